@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from llm_executor.models import LLMResponse
 
@@ -31,4 +32,17 @@ class BaseLLMAdapter(ABC):
             ProviderError for any provider-side failure
             LLMExecutionError for internal adapter misuse
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def stream(self, prompt: str, max_tokens: int) -> Iterator[str]:
+        """
+        Optional: execute a prompt and yield text chunks as they arrive.
+
+        Closing the iterator early MUST stop the provider-side
+        generation (that is how the executor enforces the hard cap
+        mid-generation).
+
+        Raises:
+            NotImplementedError if the provider has no streaming support
+        """
+        raise NotImplementedError
@@ -25,4 +25,15 @@ class ProviderError(Exception):
 
     These indicate the LLM provider failed to fulfill a valid request.
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class PromptBudgetExceededError(Exception):
+    """
+    Raised by the pre-flight check when the prompt cannot fit the model
+    context window (minus max_tokens) even with all memory context
+    trimmed.
+
+    The request is NOT sent: the provider would reject it anyway.
+    """
+    pass
@@ -1,7 +1,15 @@
+import threading
+from typing import Optional
+
 from llm_executor.models import LLMRequest, LLMResponse
 from llm_executor.adapters.base import BaseLLMAdapter
 from llm_executor.prompt_builder import build_prompt
 from llm_executor.errors import LLMExecutionError
+from llm_executor.ledger import TokenLedger
+from llm_executor.preflight import PreflightReport, preflight
+from pacing_controller.errors import TokenLimitExceededError
+from pacing_controller.streaming import StreamingCapGuard
+from tokenizer_service.service import TokenizerService, default_service
 
 
 class LLMExecutor:
@@ -10,7 +18,10 @@ class LLMExecutor:
 
     Responsibilities:
     - Build the final prompt
+    - Check it fits the context window (if one is configured),
+      trimming memory context first
     - Call the adapter exactly once
+    - Record token usage in the ledger (if one is attached)
     - Return the raw LLMResponse unchanged
 
     This class does NOT:
@@ -20,25 +31,60 @@ class LLMExecutor:
     - Enforce policy, pacing, or uncertainty
     """
 
-    def __init__(self, adapter: BaseLLMAdapter):
+    def __init__(
+        self,
+        adapter: BaseLLMAdapter,
+        ledger: Optional[TokenLedger] = None,
+        context_window_tokens: Optional[int] = None,
+        tokenizer_model: Optional[str] = None,
+        tokenizer_service: Optional[TokenizerService] = None,
+    ):
+        """
+        context_window_tokens=None disables the pre-flight check.
+        tokenizer_model defaults to the adapter's model name.
+        """
         if adapter is None:
             raise LLMExecutionError("LLMExecutor requires a valid BaseLLMAdapter")
 
         self.adapter = adapter
+        self.ledger = ledger
+        self.context_window_tokens = context_window_tokens
+        self.tokenizer_model = tokenizer_model or getattr(adapter, "model", None)
+        self.tokenizer_service = tokenizer_service
+        # Per thread: concurrent execute() calls (e.g. a background
+        # prefetch) must not overwrite each other's report
+        self._local = threading.local()
+
+    @property
+    def last_preflight(self) -> Optional[PreflightReport]:
+        """Pre-flight report of this thread's last execute() call."""
+        return getattr(self._local, "preflight", None)
 
-    def execute(self, request: LLMRequest) -> LLMResponse:
+    @last_preflight.setter
+    def last_preflight(self, report: Optional[PreflightReport]) -> None:
+        self._local.preflight = report
+
+    def execute(
+        self,
+        request: LLMRequest,
+        session_id: str = "",
+        route: str = "",
+    ) -> LLMResponse:
         """
         Execute a single LLM request.
 
         Execution flow (non-negotiable):
-        1. Build prompt
-        2. Call adapter.generate
-        3. Return LLMResponse unchanged
+        1. Pre-flight budget check (may trim memory context)
+        2. Build prompt
+        3. Call adapter.generate
+        4. Record usage under (session_id, pacing mode, route)
+        5. Return LLMResponse unchanged
         """
 
         if request is None:
             raise LLMExecutionError("LLMRequest must not be None")
 
+        request = self._preflight(request)
         prompt = build_prompt(request)
 
         response = self.adapter.generate(
@@ -46,4 +92,118 @@ class LLMExecutor:
             max_tokens=request.token_limit,
         )
 
-        return response
\ No newline at end of file
+        self._record(request, response, session_id, route)
+        return response
+
+    def _preflight(self, request: LLMRequest) -> LLMRequest:
+        self.last_preflight = None
+        if self.context_window_tokens is None:
+            return request
+
+        request, self.last_preflight = preflight(
+            request,
+            self.context_window_tokens,
+            service=self.tokenizer_service,
+            model=self.tokenizer_model,
+        )
+        return request
+
+    def _count_prompt(self, prompt: str) -> int:
+        """Prompt tokens, counted as the pre-flight check counts them."""
+        service = self.tokenizer_service or default_service()
+        return service.count(prompt, self.tokenizer_model)
+
+    def _record(
+        self,
+        request: LLMRequest,
+        response: LLMResponse,
+        session_id: str,
+        route: str,
+    ) -> None:
+        if self.ledger is None:
+            return
+        self.ledger.record(
+            session_id,
+            request.pacing_mode,
+            response.token_usage_input,
+            response.token_usage_output,
+            route=route,
+        )
+
+    def execute_streaming(
+        self,
+        request: LLMRequest,
+        guard: StreamingCapGuard,
+        session_id: str = "",
+        route: str = "",
+    ) -> LLMResponse:
+        """
+        Execute a single LLM request through adapter.stream, enforcing
+        the hard cap mid-generation.
+
+        Execution flow:
+        1. Build prompt
+        2. Feed every chunk to the guard
+        3. On STOP: close the stream, raise TokenLimitExceededError
+           On CUT_AT_CAP: close the stream, keep the text within the cap
+
+        Streams report no provider usage: token counts in the returned
+        LLMResponse come from the tokenizer service (input: the same
+        service and model as the pre-flight check; output: the guard's
+        count). raw_provider_response says so, and carries the guard's
+        final decision.
+        """
+
+        if request is None:
+            raise LLMExecutionError("LLMRequest must not be None")
+        if guard is None:
+            raise LLMExecutionError("execute_streaming requires a StreamingCapGuard")
+
+        request = self._preflight(request)
+        prompt = build_prompt(request)
+        prompt_tokens = self._count_prompt(prompt)
+
+        chunks = []
+        stream = self.adapter.stream(prompt=prompt, max_tokens=request.token_limit)
+        try:
+            for chunk in stream:
+                decision = guard.observe(chunk)
+                if decision.must_stop:
+                    break
+                chunks.append(chunk)
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+        decision = guard.final_decision
+        text = "".join(chunks)
+
+        if decision is not None and decision.action == "STOP":
+            # Generated (and billed) up to the cap, even though rejected
+            if self.ledger is not None:
+                self.ledger.record(
+                    session_id,
+                    request.pacing_mode,
+                    prompt_tokens,
+                    decision.tokens,
+                    route=route,
+                )
+            raise TokenLimitExceededError(decision.reason)
+        if decision is not None:
+            text = (text + chunk)[:decision.keep_chars]
+
+        response = LLMResponse(
+            text=text,
+            token_usage_input=prompt_tokens,
+            token_usage_output=guard.tokens,
+            model_name=getattr(self.adapter, "model", "") or "",
+            raw_provider_response={
+                "streamed": True,
+                "usage_estimated": True,
+                "cut_at_cap": decision is not None,
+                "decision": decision,
+            },
+        )
+        self._record(request, response, session_id, route)
+        return response
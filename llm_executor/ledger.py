@@ -0,0 +1,318 @@
+"""
+Token accounting ledger.
+
+LLMExecutor records every provider-reported LLMResponse
+(token_usage_input / token_usage_output) here, per
+
+    (day, session_id, mode, route)
+
+In memory the ledger keeps one [requests, input, output] counter per
+key plus running totals per session, mode and route, so every query is
+a dict lookup. Pending deltas are flushed to SQLite (UPSERT, one
+transaction) every flush_every records or flush_interval_seconds,
+whichever comes first, and on flush() / close(). No background thread.
+
+Daily totals survive restarts: the first time a day is touched its
+persisted rows are loaded back into memory. Memory holds only today
+(plus any past day queried since): when the day rolls over, older days
+are dropped and reloaded from SQLite if queried again.
+
+A failed flush keeps its deltas pending, so the next flush retries them.
+Only an explicit flush() / close() raises: the automatic flush inside
+record() logs the failure, so accounting never fails the LLM call that
+is being recorded.
+
+Budget enforcement is a query: allows_mode(session_id, mode) is False
+for restricted modes (CAREFUL by default) once the session has used
+its daily_session_budget.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from pacing_controller.enums import PacingMode
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_EVERY = 256
+DEFAULT_FLUSH_INTERVAL_SECONDS = 30.0
+
+LedgerKey = Tuple[str, str, str, str]  # (day, session_id, mode, route)
+
+
+@dataclass(frozen=True)
+class UsageTotals:
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+class TokenLedger:
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        daily_session_budget: Optional[int] = None,
+        restricted_modes: Iterable[PacingMode] = (PacingMode.CAREFUL,),
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
+        """
+        db_path=None keeps the ledger in memory only (flush is a no-op).
+        """
+        if flush_every < 1:
+            raise ValueError("flush_every must be >= 1")
+
+        self.db_path = db_path
+        self.daily_session_budget = daily_session_budget
+        self.restricted_modes = frozenset(restricted_modes)
+        self.flush_every = flush_every
+        self.flush_interval_seconds = flush_interval_seconds
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+
+        self._counters: Dict[LedgerKey, List[int]] = {}
+        self._pending: Dict[LedgerKey, List[int]] = {}
+        self._by_session: Dict[Tuple[str, str], List[int]] = {}
+        self._by_mode: Dict[Tuple[str, str], List[int]] = {}
+        self._by_route: Dict[Tuple[str, str], List[int]] = {}
+        self._loaded_days = set()
+        self._current_day: Optional[str] = None
+        self._pending_records = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+        if self.db_path is not None:
+            self._initialize_storage()
+
+    # --------------------------------------------------------------
+    # Recording
+    # --------------------------------------------------------------
+
+    def record(
+        self,
+        session_id: str,
+        mode: PacingMode,
+        input_tokens: int,
+        output_tokens: int,
+        route: str = "",
+    ) -> None:
+        day = self._today()
+        key = (day, session_id, mode.value, route)
+        delta = (1, input_tokens, output_tokens)
+
+        with self._lock:
+            if day != self._current_day:
+                self._roll_over(day)
+            self._load_day(day)
+            self._add(key, delta)
+            _accumulate(self._pending, key, delta)
+            self._pending_records += 1
+            due = (
+                self._pending_records >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval_seconds
+            )
+
+        if due:
+            try:
+                self.flush()
+            except Exception:
+                # Deltas stay pending; the next flush retries them
+                logger.exception("Token ledger flush failed; keeping deltas pending")
+
+    def _add(self, key: LedgerKey, delta: Tuple[int, int, int]) -> None:
+        day, session_id, mode, route = key
+        _accumulate(self._counters, key, delta)
+        _accumulate(self._by_session, (day, session_id), delta)
+        _accumulate(self._by_mode, (day, mode), delta)
+        _accumulate(self._by_route, (day, route), delta)
+
+    # --------------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------------
+
+    def session_usage(self, session_id: str, day: Optional[str] = None) -> UsageTotals:
+        return self._query(self._by_session, session_id, day)
+
+    def mode_usage(self, mode: PacingMode, day: Optional[str] = None) -> UsageTotals:
+        return self._query(self._by_mode, mode.value, day)
+
+    def route_usage(self, route: str, day: Optional[str] = None) -> UsageTotals:
+        return self._query(self._by_route, route, day)
+
+    def usage(
+        self,
+        session_id: str,
+        mode: PacingMode,
+        route: str = "",
+        day: Optional[str] = None,
+    ) -> UsageTotals:
+        day = day or self._today()
+        with self._lock:
+            self._load_day(day)
+            counter = self._counters.get((day, session_id, mode.value, route))
+        return UsageTotals(*counter) if counter else UsageTotals()
+
+    def remaining_daily_budget(self, session_id: str) -> Optional[int]:
+        """Tokens left today for the session (None without a budget)."""
+        if self.daily_session_budget is None:
+            return None
+        used = self.session_usage(session_id).total_tokens
+        return max(0, self.daily_session_budget - used)
+
+    def allows_mode(self, session_id: str, mode: PacingMode) -> bool:
+        """
+        False for restricted modes once the session's daily budget is
+        used up. Unrestricted modes are always allowed.
+        """
+        if mode not in self.restricted_modes:
+            return True
+        remaining = self.remaining_daily_budget(session_id)
+        return remaining is None or remaining > 0
+
+    def _query(
+        self,
+        totals: Dict[Tuple[str, str], List[int]],
+        value: str,
+        day: Optional[str],
+    ) -> UsageTotals:
+        day = day or self._today()
+        with self._lock:
+            self._load_day(day)
+            counter = totals.get((day, value))
+        return UsageTotals(*counter) if counter else UsageTotals()
+
+    # --------------------------------------------------------------
+    # Persistence
+    # --------------------------------------------------------------
+
+    def flush(self) -> int:
+        """Write pending deltas to SQLite. Returns the number of rows upserted."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            pending_records, self._pending_records = self._pending_records, 0
+            self._last_flush = time.monotonic()
+
+        if self.db_path is None or not pending:
+            return 0
+
+        rows = [key + tuple(delta) for key, delta in pending.items()]
+        try:
+            self._upsert(rows)
+        except Exception:
+            # Keep the deltas (merged with any recorded meanwhile) for
+            # the next flush; the in-memory totals already count them
+            with self._lock:
+                for key, delta in pending.items():
+                    _accumulate(self._pending, key, delta)
+                self._pending_records += pending_records
+            raise
+        return len(rows)
+
+    def _upsert(self, rows: List[tuple]) -> None:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO token_ledger (
+                        day, session_id, mode, route,
+                        requests, input_tokens, output_tokens
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (day, session_id, mode, route) DO UPDATE SET
+                        requests = requests + excluded.requests,
+                        input_tokens = input_tokens + excluded.input_tokens,
+                        output_tokens = output_tokens + excluded.output_tokens
+                    """,
+                    rows,
+                )
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        self.flush()
+
+    def _initialize_storage(self) -> None:
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.execute("""
+                CREATE TABLE IF NOT EXISTS token_ledger (
+                    day TEXT NOT NULL,
+                    session_id TEXT NOT NULL,
+                    mode TEXT NOT NULL,
+                    route TEXT NOT NULL,
+                    requests INTEGER NOT NULL,
+                    input_tokens INTEGER NOT NULL,
+                    output_tokens INTEGER NOT NULL,
+                    PRIMARY KEY (day, session_id, mode, route)
+                )
+                """)
+        finally:
+            conn.close()
+
+    def _load_day(self, day: str) -> None:
+        """Seed memory with a day's persisted rows (once per day; lock held)."""
+        if day in self._loaded_days:
+            return
+        self._loaded_days.add(day)
+
+        if self.db_path is None:
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(
+                """
+                SELECT day, session_id, mode, route,
+                       requests, input_tokens, output_tokens
+                FROM token_ledger WHERE day = ?
+                """,
+                (day,),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        for row in rows:
+            self._add(tuple(row[:4]), tuple(row[4:]))
+
+        # Recorded but not yet flushed (e.g. a dropped day queried again)
+        for key, delta in self._pending.items():
+            if key[0] == day:
+                self._add(key, tuple(delta))
+
+    def _roll_over(self, today: str) -> None:
+        """Drop in-memory totals of days before today (lock held)."""
+        self._current_day = today
+        stale = {day for day in self._loaded_days if day < today}
+        if not stale:
+            return
+
+        self._loaded_days -= stale
+        for totals in (self._counters, self._by_session, self._by_mode, self._by_route):
+            for key in [key for key in totals if key[0] in stale]:
+                del totals[key]
+
+    def _today(self) -> str:
+        return self._clock().date().isoformat()
+
+
+def _accumulate(counters: Dict, key, delta: Tuple[int, int, int]) -> None:
+    counter = counters.get(key)
+    if counter is None:
+        counters[key] = list(delta)
+    else:
+        counter[0] += delta[0]
+        counter[1] += delta[1]
+        counter[2] += delta[2]
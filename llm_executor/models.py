@@ -20,6 +20,7 @@ class LLMRequest:
     forbidden_patterns: List[str]
     claim_label_required: bool
     turn_index: Optional[int] = None  # Used only for DELIBERATIVE mode
+    context_block: str = ""  # Rendered relevant memory, one entry per line
 
 
 @dataclass(frozen=True)
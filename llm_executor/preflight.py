@@ -0,0 +1,109 @@
+"""
+Pre-flight prompt budget check.
+
+Before adapter.generate, the executor checks that
+
+    prompt tokens <= context window - max_tokens
+
+A prompt that does not fit would fail at the provider after a full
+round trip. When it does not fit, the memory context (the lowest
+priority part of the prompt) is trimmed first:
+
+- context_block is treated as one entry per line, most relevant first
+- the LONGEST prefix of lines that fits is kept (binary search, so
+  O(log lines) checks), trailing lines are dropped
+- deterministic: the same request and window always keep the same lines
+
+If the prompt does not fit even with no memory context,
+PromptBudgetExceededError is raised and nothing is sent. Instructions
+and user input are never trimmed.
+
+Counting uses TokenizerService.check_limit: approximate bounds decide
+prompts that are clearly within or clearly over, exact BPE runs only
+near the budget.
+"""
+
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple
+
+from llm_executor.errors import PromptBudgetExceededError
+from llm_executor.models import LLMRequest
+from llm_executor.prompt_builder import build_prompt
+from tokenizer_service.service import LimitCheck, TokenizerService, default_service
+
+
+@dataclass(frozen=True)
+class PreflightReport:
+    prompt_tokens: int          # exact, or the bound that decided
+    prompt_budget: int          # context window - max_tokens
+    context_window_tokens: int
+    max_tokens: int
+    context_lines_total: int
+    context_lines_kept: int
+    exact: bool
+
+    @property
+    def trimmed(self) -> bool:
+        return self.context_lines_kept < self.context_lines_total
+
+    @property
+    def context_lines_dropped(self) -> int:
+        return self.context_lines_total - self.context_lines_kept
+
+
+def preflight(
+    request: LLMRequest,
+    context_window_tokens: int,
+    service: Optional[TokenizerService] = None,
+    model: Optional[str] = None,
+) -> Tuple[LLMRequest, PreflightReport]:
+    """
+    Returns the request to send (memory context trimmed if needed) and
+    a report of what was measured and trimmed.
+    """
+    service = service or default_service()
+    budget = context_window_tokens - request.token_limit
+    lines: List[str] = request.context_block.splitlines()
+
+    def check(kept: int) -> Tuple[LLMRequest, LimitCheck]:
+        candidate = request
+        if kept < len(lines):
+            candidate = replace(request, context_block="\n".join(lines[:kept]))
+        return candidate, service.check_limit(build_prompt(candidate), max(budget, 0), model)
+
+    def report(kept: int, result: LimitCheck) -> PreflightReport:
+        return PreflightReport(
+            prompt_tokens=result.tokens,
+            prompt_budget=budget,
+            context_window_tokens=context_window_tokens,
+            max_tokens=request.token_limit,
+            context_lines_total=len(lines),
+            context_lines_kept=kept,
+            exact=result.exact,
+        )
+
+    candidate, result = check(len(lines))
+    if result.within:
+        return candidate, report(len(lines), result)
+
+    # Without any memory context
+    best_request, best = check(0)
+    if not best.within:
+        raise PromptBudgetExceededError(
+            f"Prompt needs more than {budget} tokens "
+            f"(context window {context_window_tokens} - max_tokens {request.token_limit}) "
+            "even without memory context"
+        )
+
+    # Longest prefix of context lines that still fits
+    low, high, kept = 1, len(lines) - 1, 0
+    while low <= high:
+        middle = (low + high) // 2
+        candidate, result = check(middle)
+        if result.within:
+            kept, best_request, best = middle, candidate, result
+            low = middle + 1
+        else:
+            high = middle - 1
+
+    return best_request, report(kept, best)
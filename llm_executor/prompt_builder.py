@@ -62,6 +62,13 @@ def _build_forbidden_block(forbidden_patterns: List[str]) -> str:
     return "\n".join(lines)
 
 
+def _build_context_block(context_block: str) -> str:
+    return f"""
+Relevant context (from memory):
+{context_block}
+""".strip()
+
+
 def _build_task_block(system_instruction: str, user_content: str) -> str:
     return f"""
 Task:
@@ -80,7 +87,8 @@ def build_prompt(request: LLMRequest) -> str:
     1. System control block
     2. Mode block
     3. Forbidden patterns block
-    4. Task block
+    4. Context block (only when request.context_block is non-empty)
+    5. Task block
     """
 
     if request is None:
@@ -90,7 +98,9 @@ def build_prompt(request: LLMRequest) -> str:
         SYSTEM_CONTROL_BLOCK,
         _build_mode_block(request.pacing_mode, request.turn_index),
         _build_forbidden_block(request.forbidden_patterns),
-        _build_task_block(request.system_instruction, request.user_content),
     ]
+    if request.context_block:
+        blocks.append(_build_context_block(request.context_block))
+    blocks.append(_build_task_block(request.system_instruction, request.user_content))
 
     return "\n\n".join(blocks)
\ No newline at end of file
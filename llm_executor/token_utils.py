@@ -5,33 +5,21 @@ IMPORTANT:
 - This module is for diagnostics and testing ONLY.
 - It MUST NOT be used for enforcement.
 - Provider-reported usage is always the source of truth at runtime.
-"""
 
-try:
-    import tiktoken
+Counts come from the shared tokenizer service (the same encoder and
+fallback the pacing controller uses).
+"""
 
-    _ENCODER = tiktoken.get_encoding("cl100k_base")
+from typing import Optional
 
-    def estimate_tokens(text: str) -> int:
-        """
-        Preferred token estimator using tiktoken.
+from tokenizer_service.service import count_tokens
 
-        Deterministic and aligned with OpenAI tokenization.
-        """
-        if not text:
-            return 0
-        return len(_ENCODER.encode(text))
 
-except Exception:
-    def estimate_tokens(text: str) -> int:
-        """
-        Conservative fallback estimator.
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Token estimate for diagnostics.
 
-        Rules:
-        - Never underestimates badly
-        - Deterministic
-        - Used ONLY if tiktoken is unavailable
-        """
-        if not text:
-            return 0
-        return max(1, len(text) // 4 + 1)
\ No newline at end of file
+    Deterministic; tiktoken when available, otherwise the upper bound
+    of the approximate tokenizer (see tokenizer_service.approximate).
+    """
+    return count_tokens(text, model)
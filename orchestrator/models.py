@@ -19,6 +19,8 @@ class SessionState:
     turn_index: int = 0
     mode: Optional[PacingMode] = None
     user_choice: Optional[str] = None
+    # Not advanced by the Orchestrator: DELIBERATIVE step counts live in
+    # the PacingController, keyed by session_id
     deliberative_turn_count: int = 0
     active_context: Optional[str] = None
 
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from orchestrator.models import SessionState
 from orchestrator.routes.intake import route_intake
 from orchestrator.routes.grounding import route_grounding
@@ -7,8 +9,11 @@ from orchestrator.routes.normal import route_normal_execution
 from memory_manager.enums import MemoryQueryResult
 from uncertainty_engine.enums import UncertaintyLevel
 from pacing_controller.enums import PacingMode
+from pacing_controller import tokenizer
 
 from orchestrator.models import OrchestratorContext
+from orchestrator.repair import ResponseRepairer, RepairReport, RepairTotals
+from orchestrator.prefetch import CONTINUE_INPUT, ContinuationPrefetcher
 
 
 class ConversationOrchestrator:
@@ -36,6 +41,8 @@ class ConversationOrchestrator:
         llm_executor,
         output_validator,
         policy_engine,
+        max_repair_attempts: int = 0,
+        prefetch_continuations: bool = False,
     ):
         self.memory_manager = memory_manager
         self.uncertainty_engine = uncertainty_engine
@@ -44,6 +51,22 @@ class ConversationOrchestrator:
         self.output_validator = output_validator
         self.policy_engine = policy_engine
 
+        # Repair stage (STEP 10.9b) — disabled when max_repair_attempts == 0
+        self.repairer = None
+        if max_repair_attempts > 0:
+            self.repairer = ResponseRepairer(
+                llm_executor,
+                output_validator,
+                max_repair_attempts,
+            )
+        self.last_repair_report: Optional[RepairReport] = None
+        self.repair_totals = RepairTotals()
+
+        # Speculative DELIBERATIVE continuations — opt-in
+        self.prefetcher = None
+        if prefetch_continuations:
+            self.prefetcher = ContinuationPrefetcher(llm_executor)
+
     # ------------------------------------------------------------------
     # STEP 10.3 — PRE-ROUTING (T0 → T2)
     # ------------------------------------------------------------------
@@ -139,22 +162,66 @@ class ConversationOrchestrator:
         # Mode must already be set
         limits = self.pacing_controller.get_limits(session.mode)
 
-        llm_result = self.llm_executor.execute(
-            instruction=self.pacing_controller.build_mode_instruction(session.mode),
+        forbidden_patterns = self.policy_engine.get_forbidden_patterns()
+
+        # Adaptive max_tokens per (mode, context); never above the hard
+        # cap, which validation still checks against
+        context_key = self.uncertainty_engine.last_context
+        budget = self.pacing_controller.budget_for(session.mode, context_key)
+
+        call = dict(
+            instruction=self.pacing_controller.build_mode_instruction(
+                session.mode, session_id=session.session_id
+            ),
             user_input=user_input,
             context_block=self.memory_manager.render_relevant_memory(),
-            token_limit=limits.hard_cap_tokens,
+            token_limit=budget.max_tokens,
             mode=session.mode,
-            forbidden_patterns=self.policy_engine.get_forbidden_patterns(),
+            forbidden_patterns=forbidden_patterns,
             turn_index=session.turn_index,
         )
 
+        # A prefetched continuation is used only for this exact call.
+        # Prefetches are generated at the hard cap (the adaptive budget
+        # moves between turns), so they are matched at the hard cap too
+        llm_result = None
+        if self.prefetcher is not None:
+            prefetched_call = dict(call, token_limit=limits.hard_cap_tokens)
+            llm_result = self.prefetcher.take(
+                session.session_id, prefetched_call, self._policy_stamp()
+            )
+            if llm_result is not None:
+                call = prefetched_call
+        if llm_result is None:
+            llm_result = self.llm_executor.execute(**call)
+
+            # Output that reached a budget below the hard cap may be cut
+            # off: regenerate once with the full hard cap
+            if (
+                call["token_limit"] < limits.hard_cap_tokens
+                and llm_result.token_usage_output >= call["token_limit"]
+            ):
+                call = dict(call, token_limit=limits.hard_cap_tokens)
+                llm_result = self.llm_executor.execute(**call)
+        text = llm_result.text
+
+        # Feed the adaptive budget (outputs that hit max_tokens count
+        # as truncated, so a tight budget grows back)
+        self.pacing_controller.observe_output_tokens(
+            session.mode,
+            llm_result.token_usage_output,
+            context_key=context_key,
+            requested_max_tokens=call["token_limit"],
+        )
+
         pacing_decision = self.pacing_controller.evaluate_output(
             session.mode,
-            llm_result.text,
+            text,
+            session_id=session.session_id,
         )
 
         # Construct OrchestratorContext (OWNED HERE)
+        # scan_confidence_levels indexes the claims once; validate reuses it
         context = OrchestratorContext(
             uncertainty_level=uncertainty,
             memory_write_attempted=self.memory_manager.write_attempted,
@@ -165,15 +232,44 @@ class ConversationOrchestrator:
             user_intent=self.uncertainty_engine.last_intent_summary,
             assumptions_required=self.uncertainty_engine.assumptions_required,
             contains_medium_or_low_confidence_claims=(
-                self.output_validator.scan_confidence_levels(llm_result.text)
+                self.output_validator.scan_confidence_levels(text)
             ),
         )
 
         validation = self.output_validator.validate(
-            llm_result.text,
+            text,
             context,
         )
 
+        # Cheap rejections → bounded targeted repair, then re-validation
+        self.last_repair_report = None
+        if validation.status == "REJECTED" and self.repairer is not None:
+            repaired_text, repaired_validation, repaired_context, report = (
+                self.repairer.repair(
+                    text,
+                    context,
+                    validation,
+                    llm_result,
+                    forbidden_patterns=forbidden_patterns,
+                )
+            )
+
+            # Pacing already counted this response (evaluate_output
+            # advances the DELIBERATIVE step); only the hard cap can
+            # change with the repaired text. A repair over it failed:
+            # the original, rejected response stands
+            if (
+                report.repaired
+                and tokenizer.estimate_tokens(repaired_text) > limits.hard_cap_tokens
+            ):
+                report.repaired = False
+            else:
+                text, validation, context = (
+                    repaired_text, repaired_validation, repaired_context
+                )
+            self.last_repair_report = report
+            self.repair_totals.record(report)
+
         # Validation rejection → grounding (automatic, no exposure)
         if validation.status == "REJECTED":
             return route_grounding(
@@ -181,20 +277,60 @@ class ConversationOrchestrator:
                 reason="validation_violation",
             )
 
-        # Deliberative continuation handling
+        # Deliberative continuation handling (the step count is the
+        # pacing controller's, per session_id)
         if session.mode == PacingMode.DELIBERATIVE:
-            if pacing_decision.must_continue:
-                session.deliberative_turn_count += 1
+            if pacing_decision.must_continue_in_next_turn:
+                self._prefetch_continuation(session, call, limits)
                 return {
                     "type": "DELIBERATIVE_CONTINUE",
                     "message": "Continue?",
                     "turn_index": session.turn_index,
                 }
-            else:
-                session.deliberative_turn_count = 0
 
         # ✅ NORMAL execution returns raw text ONLY
-        return llm_result.text
+        return text
+
+    # ------------------------------------------------------------------
+    # STEP 10.9c — DELIBERATIVE CONTINUATION PREFETCH (OPT-IN)
+    # ------------------------------------------------------------------
+
+    def _policy_stamp(self):
+        """Policy identity; a reload between turns invalidates a prefetch."""
+        get_version = getattr(self.policy_engine, "get_version", None)
+        return (
+            get_version() if get_version is not None else None,
+            getattr(self.policy_engine, "generation", None),
+        )
+
+    def _prefetch_continuation(self, session: SessionState, call: dict, limits):
+        """
+        Start generating the next step as if the user answers
+        CONTINUE_INPUT: the call the next turn will build. The
+        instruction is rebuilt here, AFTER evaluate_output advanced the
+        DELIBERATIVE step (the next turn asks for step N+1, not step N);
+        memory context and forbidden patterns carry over; the next turn
+        index. max_tokens is the hard cap, not the adaptive budget: the
+        budget can change before the next turn, the hard cap cannot.
+        """
+        if self.prefetcher is None:
+            return
+
+        next_call = dict(
+            call,
+            instruction=self.pacing_controller.build_mode_instruction(
+                session.mode, session_id=session.session_id
+            ),
+            user_input=CONTINUE_INPUT,
+            token_limit=limits.hard_cap_tokens,
+            turn_index=session.turn_index + 1,
+        )
+        self.prefetcher.start(session.session_id, next_call, self._policy_stamp())
+
+    def close(self) -> None:
+        """Cancel pending prefetches and stop the prefetch worker threads."""
+        if self.prefetcher is not None:
+            self.prefetcher.shutdown()
 
     # ------------------------------------------------------------------
     # PUBLIC ENTRY POINT
@@ -208,6 +344,10 @@ class ConversationOrchestrator:
         memory_result, uncertainty = self.pre_route(session, user_input)
         route = self.decide_route(memory_result, uncertainty)
 
+        # Only a NORMAL turn can use a prefetched continuation
+        if route != "NORMAL" and self.prefetcher is not None:
+            self.prefetcher.discard(session.session_id)
+
         if route == "INTAKE":
             return route_intake(self.policy_engine)
 
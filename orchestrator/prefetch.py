@@ -0,0 +1,149 @@
+"""
+Speculative prefetch of the next DELIBERATIVE step (opt-in).
+
+After step N passes validation the orchestrator returns
+DELIBERATIVE_CONTINUE and waits for the user. Users nearly always
+continue, so with prefetching enabled the generation for step N+1 is
+started in the background right away, using exactly the call the next
+turn would make if the user says CONTINUE_INPUT.
+
+On the next turn the orchestrator builds its real call and asks for the
+prefetched result. It is used ONLY if the whole call matches:
+
+    instruction, user input, memory context, token limit, mode,
+    forbidden patterns, turn index, policy (version, generation)
+
+The orchestrator prefetches and matches at the mode's hard cap rather
+than the adaptive budget, which may move between the two turns.
+
+so a declined continuation, a memory change or a policy reload simply
+discards it. Generations are temperature 0.0, so a matching prefetch is
+the response the turn would have generated.
+
+llm_executor.execute runs on a worker thread, concurrently with the
+foreground, so the executor must be thread-safe (LLMExecutor keeps
+last_preflight per thread; TokenLedger locks its counters). Call
+ConversationOrchestrator.close() to stop the workers.
+
+HARD RULES:
+- At most one pending prefetch per session; starting a new one (or
+  discarding) cancels the old one
+- A prefetched response goes through pacing and validation exactly like
+  a foreground one; nothing here decides acceptance
+- A failed prefetch is discarded and the turn generates normally
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Tuple
+
+
+CONTINUE_INPUT = "continue"
+DEFAULT_PREFETCH_WORKERS = 4
+
+
+@dataclass
+class PrefetchStats:
+    started: int = 0
+    hits: int = 0
+    discarded: int = 0
+    failed: int = 0
+    # Output tokens of prefetches that completed but were never used
+    wasted_output_tokens: int = 0
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def call_key(call: Dict[str, Any], policy_stamp: Hashable) -> Hashable:
+    """Identity of an executor call (kwargs) under a policy stamp."""
+    return (_freeze(call), policy_stamp)
+
+
+class ContinuationPrefetcher:
+    def __init__(self, llm_executor, max_workers: int = DEFAULT_PREFETCH_WORKERS):
+        self.llm_executor = llm_executor
+        self.stats = PrefetchStats()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="deliberative-prefetch",
+        )
+        self._pending: Dict[str, Tuple[Hashable, Future]] = {}
+        self._lock = threading.Lock()
+
+    def start(self, session_id: str, call: Dict[str, Any], policy_stamp: Hashable) -> None:
+        """Begin generating `call` in the background for session_id."""
+        key = call_key(call, policy_stamp)
+        future = self._pool.submit(self.llm_executor.execute, **call)
+
+        with self._lock:
+            previous = self._pending.pop(session_id, None)
+            self._pending[session_id] = (key, future)
+            self.stats.started += 1
+
+        if previous is not None:
+            self._drop(previous[1])
+
+    def take(self, session_id: str, call: Dict[str, Any], policy_stamp: Hashable):
+        """
+        The prefetched result for `call`, or None (no prefetch, a
+        different call, or a failed generation). Any pending prefetch
+        for the session is consumed either way.
+        """
+        with self._lock:
+            pending = self._pending.pop(session_id, None)
+
+        if pending is None:
+            return None
+
+        key, future = pending
+        if key != call_key(call, policy_stamp):
+            self._drop(future)
+            return None
+
+        try:
+            result = future.result()
+        except Exception:
+            with self._lock:
+                self.stats.failed += 1
+            return None
+
+        with self._lock:
+            self.stats.hits += 1
+        return result
+
+    def discard(self, session_id: str) -> None:
+        with self._lock:
+            pending = self._pending.pop(session_id, None)
+        if pending is not None:
+            self._drop(pending[1])
+
+    def has_pending(self, session_id: str) -> bool:
+        return session_id in self._pending
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for _, future in pending:
+            self._drop(future)
+        self._pool.shutdown(wait=True)
+
+    def _drop(self, future: Future) -> None:
+        with self._lock:
+            self.stats.discarded += 1
+        if future.cancel():
+            return
+        future.add_done_callback(self._count_waste)
+
+    def _count_waste(self, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        tokens = getattr(future.result(), "token_usage_output", 0) or 0
+        with self._lock:
+            self.stats.wasted_output_tokens += tokens
@@ -0,0 +1,235 @@
+"""
+Bounded repair-and-revalidate stage for NORMAL execution.
+
+Some rejections are cheap to fix without paying for a new generation:
+a missing "Next step" line, one unlabelled sentence, an undisclosed
+uncertainty. For those the orchestrator sends a small, targeted fix
+prompt, splices the fix into the response and re-validates.
+
+HARD RULES:
+- Only rejections whose EVERY violation is repairable are attempted
+  (otherwise the response is lost anyway; no tokens are spent)
+- At most max_attempts fix calls per response
+- Each fix call has a small token budget
+- The repaired text is re-validated by the OutputValidator; nothing
+  here decides acceptance
+- Fix calls are single-turn (REPAIR_MODE, no turn index): a repair of
+  a DELIBERATIVE step must not be prompted as "turn N" of the process
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, List, Literal, Optional, Tuple
+
+from output_validator.models import ErrorCode, RuleViolation, ValidationResult
+from orchestrator.models import OrchestratorContext
+from pacing_controller.enums import PacingMode
+
+
+# Output budget for one fix call (plus ~1 token per 4 rewritten chars)
+REPAIR_TOKEN_BUDGET = 120
+
+# Mode block of every fix call, whatever the response's mode
+REPAIR_MODE = PacingMode.NORMAL
+
+
+@dataclass(frozen=True)
+class RepairStrategy:
+    """
+    APPEND:         ask for ONE missing line and append it
+    REWRITE_SPANS:  send only the offending sentences / lines, ask for
+                    them rewritten (one per line), splice them back
+    """
+    kind: Literal["APPEND", "REWRITE_SPANS"]
+    instruction: str
+
+
+REPAIR_STRATEGIES: Dict[ErrorCode, RepairStrategy] = {
+    ErrorCode.missingconfidencelabel: RepairStrategy(
+        kind="REWRITE_SPANS",
+        instruction=(
+            "Rewrite each sentence below so it starts with a confidence label: "
+            "[HIGH], [MEDIUM] or [LOW]. Keep the meaning. "
+            "Return only the rewritten sentences, one per line, in the same order."
+        ),
+    ),
+    ErrorCode.lowconfidenceasserted: RepairStrategy(
+        kind="REWRITE_SPANS",
+        instruction=(
+            "Rewrite each [LOW] confidence line below without definitive wording "
+            "(no 'will', 'must', 'definitely', 'guaranteed', 'you should'). "
+            "Keep the [LOW] label. "
+            "Return only the rewritten lines, one per line, in the same order."
+        ),
+    ),
+    ErrorCode.assumptionsnotsurfaced: RepairStrategy(
+        kind="APPEND",
+        instruction=(
+            "Write ONE short line starting with 'Assumption:' that states the "
+            "main assumption behind the response below. Return only that line."
+        ),
+    ),
+    ErrorCode.uncertaintynotdisclosed: RepairStrategy(
+        kind="APPEND",
+        instruction=(
+            "Write ONE short sentence that discloses what might be wrong or "
+            "uncertain in the response below. Return only that sentence."
+        ),
+    ),
+    ErrorCode.nextstepsnotclear: RepairStrategy(
+        kind="APPEND",
+        instruction=(
+            "Write ONE short sentence starting with 'Next step:' that tells the "
+            "user what to do after reading the response below. "
+            "Return only that sentence."
+        ),
+    ),
+}
+
+
+@dataclass
+class RepairReport:
+    """
+    Outcome of the repair stage for one response.
+
+    regeneration_tokens is what the rejected generation cost
+    (input + output): the price of regenerating instead of repairing.
+    """
+    attempts: int = 0
+    repaired: bool = False
+    repaired_errors: Tuple[ErrorCode, ...] = ()
+    repair_tokens_input: int = 0
+    repair_tokens_output: int = 0
+    regeneration_tokens: int = 0
+
+    @property
+    def repair_tokens(self) -> int:
+        return self.repair_tokens_input + self.repair_tokens_output
+
+
+@dataclass
+class RepairTotals:
+    """Running totals across responses: repair spend vs regeneration avoided."""
+    responses_attempted: int = 0
+    responses_repaired: int = 0
+    repair_tokens: int = 0
+    regeneration_tokens_avoided: int = 0
+
+    def record(self, report: RepairReport) -> None:
+        if report.attempts == 0:
+            return
+        self.responses_attempted += 1
+        self.repair_tokens += report.repair_tokens
+        if report.repaired:
+            self.responses_repaired += 1
+            self.regeneration_tokens_avoided += report.regeneration_tokens
+
+
+def _is_repairable(violations: Tuple[RuleViolation, ...]) -> bool:
+    for violation in violations:
+        strategy = REPAIR_STRATEGIES.get(violation.error_code)
+        if strategy is None:
+            return False
+        if strategy.kind == "REWRITE_SPANS" and not violation.spans:
+            return False
+    return bool(violations)
+
+
+def _splice(text: str, spans, replacements: List[str]) -> str:
+    # Right to left, so earlier offsets stay valid
+    for (start, end), replacement in sorted(
+        zip(spans, replacements), key=lambda item: item[0][0], reverse=True
+    ):
+        text = text[:start] + replacement + text[end:]
+    return text
+
+
+class ResponseRepairer:
+    def __init__(self, llm_executor, output_validator, max_attempts: int):
+        self.llm_executor = llm_executor
+        self.output_validator = output_validator
+        self.max_attempts = max_attempts
+
+    def repair(
+        self,
+        text: str,
+        context: OrchestratorContext,
+        validation: ValidationResult,
+        llm_result,
+        forbidden_patterns,
+    ) -> Tuple[str, ValidationResult, OrchestratorContext, RepairReport]:
+        """
+        Try to turn a REJECTED response into an ACCEPTED one.
+        Returns (text, validation, context, report) for the last
+        version of the response (the original if nothing was tried).
+        """
+        report = RepairReport(
+            regeneration_tokens=llm_result.token_usage_input + llm_result.token_usage_output,
+        )
+        repaired_errors = []
+
+        while validation.status == "REJECTED" and report.attempts < self.max_attempts:
+            violations = self.output_validator.validate_all(text, context).violations
+            if not _is_repairable(violations):
+                break
+
+            violation = violations[0]
+            fixed = self._fix(text, violation, report, forbidden_patterns)
+            report.attempts += 1
+            if fixed is None:
+                break
+
+            text, added_tokens = fixed
+            # Upper bound: rewrites replace text, they do not only add it
+            context = replace(
+                context,
+                token_count=context.token_count + added_tokens,
+                contains_medium_or_low_confidence_claims=(
+                    self.output_validator.scan_confidence_levels(text)
+                ),
+            )
+            repaired_errors.append(violation.error_code)
+            validation = self.output_validator.validate(text, context)
+
+        report.repaired = report.attempts > 0 and validation.status == "ACCEPTED"
+        report.repaired_errors = tuple(repaired_errors)
+        return text, validation, context, report
+
+    def _fix(
+        self,
+        text: str,
+        violation: RuleViolation,
+        report: RepairReport,
+        forbidden_patterns,
+    ) -> Optional[Tuple[str, int]]:
+        strategy = REPAIR_STRATEGIES[violation.error_code]
+
+        if strategy.kind == "APPEND":
+            material = text
+            token_limit = REPAIR_TOKEN_BUDGET
+        else:
+            material = "\n".join(text[start:end] for start, end in violation.spans)
+            token_limit = REPAIR_TOKEN_BUDGET + len(material) // 4
+
+        result = self.llm_executor.execute(
+            instruction=strategy.instruction,
+            user_input=material,
+            context_block="",
+            token_limit=token_limit,
+            mode=REPAIR_MODE,
+            forbidden_patterns=forbidden_patterns,
+            turn_index=None,
+        )
+        report.repair_tokens_input += result.token_usage_input
+        report.repair_tokens_output += result.token_usage_output
+
+        fix = result.text.strip()
+        if not fix:
+            return None
+
+        if strategy.kind == "APPEND":
+            return text.rstrip() + "\n" + fix, result.token_usage_output
+
+        lines = [line.strip() for line in fix.splitlines() if line.strip()]
+        if len(lines) != len(violation.spans):
+            return None
+        return _splice(text, violation.spans, lines), result.token_usage_output
@@ -0,0 +1,62 @@
+"""
+UTF-8 bytes / memoryview responses.
+
+Provider responses arrive as bytes. OutputValidator.validate accepts
+them directly:
+
+- ASCII input (the common case) is validated IN PLACE, never decoded.
+  Sentence / line rules run ASCII case-insensitive byte regexes over
+  pos/endpos ranges of the original buffer (no per-sentence slices or
+  lowercase copies); whole-text phrase rules share one bytes.lower().
+- Non-ASCII input is decoded ONCE and validated as str, because exact
+  Unicode lowercasing (e.g. "\u212a".lower() == "k") and Unicode \\b / \\d / \\s
+  cannot be reproduced on raw bytes.
+
+Verdicts are identical to validating the decoded str.
+"""
+
+import re
+from typing import Optional, Tuple, Union
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+ResponseText = Union[str, BytesLike]
+
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+# Characters str.strip() removes, restricted to ASCII
+ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
+
+
+def as_byte_view(data: BytesLike) -> BytesLike:
+    """bytes / bytearray as-is; memoryview as a flat unsigned-byte view."""
+    if isinstance(data, memoryview) and (data.format != "B" or data.ndim != 1):
+        return data.cast("B")
+    return data
+
+
+def ascii_buffer(data: BytesLike) -> Optional[BytesLike]:
+    """
+    The buffer to validate in place, or None if it holds non-ASCII
+    bytes (and must be decoded).
+    """
+    data = as_byte_view(data)
+    if isinstance(data, memoryview):
+        return data if _NON_ASCII.search(data) is None else None
+    return data if data.isascii() else None
+
+
+def decode_response(data: BytesLike) -> str:
+    return str(as_byte_view(data), "utf-8")
+
+
+def strip_bounds(data: BytesLike, start: int, end: int) -> Tuple[int, int]:
+    """
+    (start, end) of data[start:end].strip() on ASCII data, without
+    slicing. Same whitespace set as str.strip().
+    """
+    while start < end and data[start] in ASCII_WHITESPACE:
+        start += 1
+    while end > start and data[end - 1] in ASCII_WHITESPACE:
+        end -= 1
+    return start, end
@@ -0,0 +1,132 @@
+"""
+LRU cache of validation verdicts.
+
+Temperature-0.0 generations make identical prompts produce identical
+text; retries then validate the same response again. Opt-in
+(OutputValidator(cache_size=...)): a lookup hashes the full text, which
+only pays off when responses actually repeat.
+
+Key:   (sha256 of text, CONTEXT_KEY_FIELDS values of the context)
+Stamp: (policy version, policy generation) — any change clears the
+       cache, so verdicts never outlive the policy that produced them.
+"""
+
+import hashlib
+from collections import OrderedDict
+from operator import attrgetter
+from dataclasses import dataclass
+from typing import Hashable, Optional, Tuple
+
+from output_validator.byte_input import ResponseText, as_byte_view
+from output_validator.models import ValidationResult
+from orchestrator.models import OrchestratorContext
+
+
+DEFAULT_CACHE_SIZE = 1024
+
+# Every OrchestratorContext field a rule may read, in a fixed order
+CONTEXT_KEY_FIELDS = (
+    "uncertainty_level",
+    "memory_write_attempted",
+    "memory_confirmation_asked",
+    "memory_scope",
+    "token_count",
+    "token_limit",
+    "user_intent",
+    "assumptions_required",
+    "contains_medium_or_low_confidence_claims",
+)
+_context_key = attrgetter(*CONTEXT_KEY_FIELDS)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+    invalidations: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+class ValidationCache:
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        if max_size < 0:
+            raise ValueError("max_size must be >= 0")
+
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, ValidationResult]" = OrderedDict()
+        self._stamp: Optional[Tuple[str, int]] = None
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def make_key(text: ResponseText, context: OrchestratorContext) -> Optional[Hashable]:
+        """
+        Returns None when the context holds unhashable values
+        (such lookups bypass the cache).
+
+        UTF-8 bytes are hashed in place and share keys with the
+        equivalent str.
+        """
+        if isinstance(text, str):
+            text = text.encode("utf-8", "surrogatepass")
+        digest = hashlib.sha256(as_byte_view(text)).digest()
+        key = (digest, _context_key(context))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def sync_policy(self, stamp: Tuple[str, int]) -> None:
+        """Clear all entries if the policy stamp changed."""
+        if stamp != self._stamp:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._stamp = stamp
+
+    def get(self, key: Hashable) -> Optional[ValidationResult]:
+        result = self._entries.get(key)
+        if result is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return result
+
+    def put(self, key: Hashable, result: ValidationResult) -> None:
+        if self.max_size == 0:
+            return
+
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        if self._entries:
+            self._invalidations += 1
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+            max_size=self.max_size,
+            invalidations=self._invalidations,
+        )
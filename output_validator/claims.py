@@ -0,0 +1,242 @@
+"""
+Claim index builder.
+
+Splits a response into sentences ONCE and records, per sentence, its
+character offsets, confidence labels and assertive-term hits, plus the
+[LOW] lines that use assertive wording. validate_all, the orchestrator's
+scan_confidence_levels and UI highlighting all read from this index.
+
+Fail-fast validation only needs a yes / no per claim rule, so the
+has_* scanners answer it without building the index and stop at the
+first offending sentence / line.
+"""
+
+import re
+from typing import List, Optional
+
+from output_validator.byte_input import (
+    BytesLike,
+    ResponseText,
+    ascii_buffer,
+    as_byte_view,
+    decode_response,
+    strip_bounds,
+)
+from output_validator.models import ClaimIndex, ClaimSpan, Span
+from output_validator.rules import (
+    CONFIDENCE_LABELS,
+    ASSERTIVE_PATTERN,
+    ASSERTIVE_BYTES,
+    LOW_ASSERTIVE_PATTERN,
+    LOW_ASSERTIVE_BYTES,
+    SENTENCE_SPLIT_PATTERN,
+)
+
+
+# Used for hit offsets only when lower() changed the sentence length
+_ASSERTIVE_PATTERN_IGNORECASE = re.compile(ASSERTIVE_PATTERN.pattern, re.IGNORECASE)
+
+# One sentence, already stripped (whitespace-only pieces never match).
+# \s on str is the str.strip() set; the bytes class spells it out
+_STRIPPED_SENTENCE = re.compile(r"[^\s.\n](?:[^.\n]*[^\s.\n])?")
+
+_LABEL_PATTERN = re.compile("|".join(re.escape(label) for label in CONFIDENCE_LABELS))
+
+# Bytes path (ASCII input only)
+_STRIPPED_SENTENCE_BYTES = re.compile(
+    rb"[^ \t\n\r\x0b\x0c\x1c-\x1f.](?:[^.\n]*[^ \t\n\r\x0b\x0c\x1c-\x1f.])?"
+)
+_SENTENCE_DELIMITER_BYTES = re.compile(rb"[.\n]")
+_LINE_CONTENT_BYTES = re.compile(rb"[^\n\r\x0b\x0c\x1c\x1d\x1e]+")
+_LABEL_BYTES = re.compile(
+    b"|".join(re.escape(label.encode("ascii")) for label in CONFIDENCE_LABELS)
+)
+_LOW_LABEL_BYTES = re.compile(re.escape(b"[LOW]"))
+
+
+def _low_asserted_lines(text: str) -> List[Span]:
+    lines = []
+    if "[LOW]" not in text:
+        return lines
+
+    start = 0
+    for line in text.splitlines(keepends=True):
+        if "[LOW]" in line:
+            content = line.splitlines()[0]
+            if LOW_ASSERTIVE_PATTERN.search(content.lower()):
+                lines.append((start, start + len(content)))
+        start += len(line)
+    return lines
+
+
+def has_unlabelled_claim(text: str, lower: Optional[str] = None) -> bool:
+    """
+    build_claim_index(text).has_unlabelled_claim, stopping at the first
+    unlabelled claim. Sentences are found lazily, so an early claim
+    costs nothing for the rest of the text.
+    """
+    if lower is None:
+        lower = text.lower()
+
+    search = ASSERTIVE_PATTERN.search
+    if len(lower) != len(text):
+        # Offsets do not align; pair the split pieces instead
+        for sentence, sentence_lower in zip(
+            SENTENCE_SPLIT_PATTERN.split(text),
+            SENTENCE_SPLIT_PATTERN.split(lower),
+        ):
+            if search(sentence_lower.strip()) and not any(
+                label in sentence for label in CONFIDENCE_LABELS
+            ):
+                return True
+        return False
+
+    # Same length means lower() changed no offsets: terms are searched
+    # in lower, labels (case-sensitive) in text, over the same range
+    for match in _STRIPPED_SENTENCE.finditer(lower):
+        start, end = match.span()
+        if search(lower, start, end) and not _LABEL_PATTERN.search(text, start, end):
+            return True
+    return False
+
+
+def has_low_asserted_line(text: str) -> bool:
+    """bool(build_claim_index(text).low_asserted_lines), fail-fast."""
+    if "[LOW]" not in text:
+        return False
+    return any(
+        "[LOW]" in line and LOW_ASSERTIVE_PATTERN.search(line.lower())
+        for line in text.splitlines()
+    )
+
+
+def build_claim_index(text: str, lower: Optional[str] = None) -> ClaimIndex:
+    if lower is None:
+        lower = text.lower()
+
+    sentences = []
+    start = 0
+    # lower() never creates or removes "." / "\n", so pieces align
+    for sentence, sentence_lower in zip(
+        SENTENCE_SPLIT_PATTERN.split(text),
+        SENTENCE_SPLIT_PATTERN.split(lower),
+    ):
+        s = sentence_lower.strip()
+        if s:
+            lead = len(sentence) - len(sentence.lstrip())
+            begin = start + lead
+            stripped = sentence.strip()
+
+            assertive = ASSERTIVE_PATTERN.search(s) is not None
+            hits = ()
+            if assertive:
+                if len(s) == len(stripped):
+                    matches = ASSERTIVE_PATTERN.finditer(s)
+                else:
+                    matches = _ASSERTIVE_PATTERN_IGNORECASE.finditer(stripped)
+                hits = tuple(
+                    (begin + m.start(), begin + m.end()) for m in matches
+                )
+
+            sentences.append(
+                ClaimSpan(
+                    start=begin,
+                    end=begin + len(stripped),
+                    labels=tuple(l for l in CONFIDENCE_LABELS if l in sentence),
+                    assertive=assertive,
+                    assertive_hits=hits,
+                )
+            )
+        # Every delimiter is exactly one character
+        start += len(sentence) + 1
+
+    return ClaimIndex(
+        sentences=tuple(sentences),
+        low_asserted_lines=tuple(_low_asserted_lines(text)),
+    )
+
+
+def _claim_span_bytes(data: BytesLike, start: int, end: int) -> ClaimSpan:
+    hits = tuple(match.span() for match in ASSERTIVE_BYTES.finditer(data, start, end))
+
+    labels = ()
+    found = {match.group().decode("ascii") for match in _LABEL_BYTES.finditer(data, start, end)}
+    if found:
+        labels = tuple(label for label in CONFIDENCE_LABELS if label in found)
+
+    return ClaimSpan(
+        start=start,
+        end=end,
+        labels=labels,
+        assertive=bool(hits),
+        assertive_hits=hits,
+    )
+
+
+def has_unlabelled_claim_bytes(data: BytesLike) -> bool:
+    """has_unlabelled_claim over ASCII bytes, in place."""
+    for match in _STRIPPED_SENTENCE_BYTES.finditer(data):
+        begin, end = match.span()
+        if (
+            ASSERTIVE_BYTES.search(data, begin, end)
+            and not _LABEL_BYTES.search(data, begin, end)
+        ):
+            return True
+    return False
+
+
+def has_low_asserted_line_bytes(data: BytesLike) -> bool:
+    """has_low_asserted_line over ASCII bytes, in place."""
+    if not _LOW_LABEL_BYTES.search(data):
+        return False
+    return any(
+        _LOW_LABEL_BYTES.search(data, *line.span())
+        and LOW_ASSERTIVE_BYTES.search(data, *line.span())
+        for line in _LINE_CONTENT_BYTES.finditer(data)
+    )
+
+
+def build_claim_index_bytes(data: BytesLike) -> ClaimIndex:
+    """
+    build_claim_index over ASCII bytes, in place: sentences are
+    delimited with pos/endpos searches, never sliced or lowercased.
+    Offsets are byte offsets (equal to character offsets for ASCII).
+    """
+    sentences = []
+    start = 0
+
+    def add(begin: int, end: int) -> None:
+        begin, end = strip_bounds(data, begin, end)
+        if begin < end:
+            sentences.append(_claim_span_bytes(data, begin, end))
+
+    for delimiter in _SENTENCE_DELIMITER_BYTES.finditer(data):
+        add(start, delimiter.start())
+        start = delimiter.end()
+    add(start, len(data))
+
+    low_lines = []
+    if _LOW_LABEL_BYTES.search(data):
+        for line in _LINE_CONTENT_BYTES.finditer(data):
+            line_start, line_end = line.span()
+            if (
+                _LOW_LABEL_BYTES.search(data, line_start, line_end)
+                and LOW_ASSERTIVE_BYTES.search(data, line_start, line_end)
+            ):
+                low_lines.append((line_start, line_end))
+
+    return ClaimIndex(
+        sentences=tuple(sentences),
+        low_asserted_lines=tuple(low_lines),
+    )
+
+
+def index_response(text: ResponseText) -> ClaimIndex:
+    """Claim index of a str or UTF-8 bytes / memoryview response."""
+    if isinstance(text, str):
+        return build_claim_index(text)
+
+    data = ascii_buffer(text)
+    if data is not None:
+        return build_claim_index_bytes(data)
+    return build_claim_index(decode_response(as_byte_view(text)))
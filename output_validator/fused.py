@@ -0,0 +1,420 @@
+"""
+Fused single-pass validation engine.
+
+The sequential path in OutputValidator calls each rule in
+output_validator.rules independently, and each rule re-lowercases,
+re-splits or re-scans the full response.
+
+This engine tokenizes the response at most ONCE (one lowercase copy,
+one percentage scan, one choice scan), lazily, and gathers every
+rule's signal from that. The claim rules stop at the first offending
+sentence, like the sequential rules; the full claim index is built
+only for spans (validate_all) or reused when the caller has one.
+The rules themselves are run by output_validator.registry; verdicts,
+including the first-failure order, are identical to the sequential
+path.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from output_validator.byte_input import ResponseText, ascii_buffer, decode_response
+from output_validator.claims import (
+    build_claim_index,
+    build_claim_index_bytes,
+    has_low_asserted_line,
+    has_low_asserted_line_bytes,
+    has_unlabelled_claim,
+    has_unlabelled_claim_bytes,
+)
+from output_validator.models import ClaimIndex, ErrorCode, Span
+from output_validator.rules import (
+    AUTHORITY_PHRASES,
+    AUTHORITY_PATTERN,
+    UNCERTAINTY_TERMS,
+    NEXT_STEP_PHRASES,
+    ASSUMPTION_PHRASES,
+    PERCENT_PATTERN,
+    CHOICE_PATTERN,
+)
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+
+
+# Bytes twins (ASCII input). \s is spelled out: on str it also
+# matches \x1c-\x1f, on bytes it does not. Percentages and choices
+# are two scans: one alternation of both is slower than the pair.
+_PERCENT_BYTES = re.compile(rb"\d+[ \t\n\r\x0b\x0c\x1c-\x1f]*%")
+_CHOICE_BYTES = re.compile(rb"\b([A-C])\)")
+_QUESTION_BYTES = re.compile(rb"\?")
+_ASSUMPTION_PHRASES_BYTES = [p.encode("ascii") for p in ASSUMPTION_PHRASES]
+_AUTHORITY_PHRASES_BYTES = [p.encode("ascii") for p in AUTHORITY_PHRASES]
+_UNCERTAINTY_TERMS_BYTES = [w.encode("ascii") for w in UNCERTAINTY_TERMS]
+_NEXT_STEP_PHRASES_BYTES = [p.encode("ascii") for p in NEXT_STEP_PHRASES]
+
+# Used for spans only when lower() changed the text length
+_AUTHORITY_PATTERN_IGNORECASE = re.compile(AUTHORITY_PATTERN.pattern, re.IGNORECASE)
+
+
+class _signal:
+    """
+    functools.cached_property without the lock: on Python < 3.12 every
+    first access takes an RLock, which costs more than most signals.
+    A ResponseSignals lives for one validation and is never shared
+    between threads.
+    """
+
+    def __init__(self, compute):
+        self.compute = compute
+        self.name = compute.__name__
+        self.__doc__ = compute.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.compute(instance)
+        return value
+
+
+class ResponseSignals:
+    """
+    Context-free facts about one response.
+
+    Each signal is computed on first access and then kept, so a rule
+    pays only for what it reads and nothing is scanned twice (the
+    lowercase copy is shared by every rule; the claim index by every
+    rule that needs spans).
+    """
+
+    def __init__(self, text: str, claims: Optional[ClaimIndex] = None):
+        self.text = text
+        self._claims = claims
+
+    @_signal
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @property
+    def claims(self) -> ClaimIndex:
+        # Sentences + [LOW] lines: one claim index, shared with callers
+        if self._claims is None:
+            self._claims = build_claim_index(self.text, self.lower)
+        return self._claims
+
+    def build_shared(self) -> None:
+        """
+        Build now the signals several rules read (the lowercase copy).
+        Timed callers do this first, so no rule is charged for them.
+        """
+        self.lower
+
+    @property
+    def built_claims(self) -> Optional[ClaimIndex]:
+        """The claim index if a rule (or the caller) already built it."""
+        return self._claims
+
+    @_signal
+    def unlabelled_claim(self) -> bool:
+        # Reuse an index if there is one; never build it for a yes / no
+        if self._claims is not None:
+            return self._claims.has_unlabelled_claim
+        return has_unlabelled_claim(self.text, self.lower)
+
+    @_signal
+    def low_confidence_asserted(self) -> bool:
+        if self._claims is not None:
+            return bool(self._claims.low_asserted_lines)
+        return has_low_asserted_line(self.text)
+
+    @_signal
+    def question_count(self) -> int:
+        return self.text.count("?")
+
+    # Both patterns need a literal "%" / ")"; a substring check is far
+    # cheaper than a regex scan of a text that has none
+
+    @_signal
+    def has_percentage(self) -> bool:
+        return "%" in self.text and PERCENT_PATTERN.search(self.text) is not None
+
+    @_signal
+    def choice_letters(self) -> Tuple[str, ...]:
+        if ")" not in self.text:
+            return ()
+        return tuple(CHOICE_PATTERN.findall(self.text))
+
+    @_signal
+    def assumption_block(self) -> bool:
+        return any(p in self.lower for p in ASSUMPTION_PHRASES)
+
+    @_signal
+    def forbidden_authority(self) -> bool:
+        return any(p in self.lower for p in AUTHORITY_PHRASES)
+
+    @_signal
+    def uncertainty_language(self) -> bool:
+        return any(w in self.lower for w in UNCERTAINTY_TERMS)
+
+    @_signal
+    def next_steps(self) -> bool:
+        return any(p in self.lower for p in NEXT_STEP_PHRASES)
+
+    def mentions(self, keywords: Iterable[str]) -> bool:
+        """True if any (lowercase) keyword occurs in the lowered text."""
+        return any(word in self.lower for word in keywords)
+
+
+class BytesResponseSignals(ResponseSignals):
+    """
+    ResponseSignals over an ASCII UTF-8 buffer (see
+    output_validator.byte_input). Never decoded.
+
+    Sentence / line rules run ASCII case-insensitive byte regexes
+    in place over pos/endpos ranges. Whole-text phrase rules share
+    ONE bytes.lower() copy: over a full response a single C lowercase
+    pass plus substring scans is far cheaper than case-insensitive
+    regex search.
+    """
+
+    @_signal
+    def lower(self) -> bytes:
+        return bytes(self.text).lower() if isinstance(self.text, memoryview) else self.text.lower()
+
+    @property
+    def claims(self) -> ClaimIndex:
+        if self._claims is None:
+            self._claims = build_claim_index_bytes(self.text)
+        return self._claims
+
+    @_signal
+    def unlabelled_claim(self) -> bool:
+        if self._claims is not None:
+            return self._claims.has_unlabelled_claim
+        return has_unlabelled_claim_bytes(self.text)
+
+    @_signal
+    def low_confidence_asserted(self) -> bool:
+        if self._claims is not None:
+            return bool(self._claims.low_asserted_lines)
+        return has_low_asserted_line_bytes(self.text)
+
+    @_signal
+    def question_count(self) -> int:
+        if isinstance(self.text, memoryview):
+            return sum(1 for _ in _QUESTION_BYTES.finditer(self.text))
+        return self.text.count(b"?")
+
+    @_signal
+    def has_percentage(self) -> bool:
+        return _PERCENT_BYTES.search(self.text) is not None
+
+    @_signal
+    def choice_letters(self) -> Tuple[str, ...]:
+        return tuple(letter.decode("ascii") for letter in _CHOICE_BYTES.findall(self.text))
+
+    @_signal
+    def assumption_block(self) -> bool:
+        return any(p in self.lower for p in _ASSUMPTION_PHRASES_BYTES)
+
+    @_signal
+    def forbidden_authority(self) -> bool:
+        return any(p in self.lower for p in _AUTHORITY_PHRASES_BYTES)
+
+    @_signal
+    def uncertainty_language(self) -> bool:
+        return any(w in self.lower for w in _UNCERTAINTY_TERMS_BYTES)
+
+    @_signal
+    def next_steps(self) -> bool:
+        return any(p in self.lower for p in _NEXT_STEP_PHRASES_BYTES)
+
+    def mentions(self, keywords: Iterable[str]) -> bool:
+        # A non-ASCII keyword can never occur in ASCII text
+        return any(
+            word.encode("ascii") in self.lower
+            for word in keywords
+            if word.isascii()
+        )
+
+
+def collect_signals(
+    text: ResponseText,
+    claims: Optional[ClaimIndex] = None,
+) -> ResponseSignals:
+    """
+    Signals for a str or UTF-8 bytes / memoryview response. ASCII
+    bytes are scanned in place; other bytes are decoded once.
+    """
+    if isinstance(text, str):
+        return ResponseSignals(text, claims)
+
+    data = ascii_buffer(text)
+    if data is not None:
+        return BytesResponseSignals(data, claims)
+    return ResponseSignals(decode_response(text), claims)
+
+
+@lru_cache(maxsize=256)
+def _intent_keywords(intent: str) -> Tuple[str, ...]:
+    # One intent is validated against many responses (retries, repairs)
+    return tuple(word.lower() for word in re.split(r"\W+", intent) if word)
+
+
+def _addresses_intent(signals: ResponseSignals, intent: str) -> bool:
+    return signals.mentions(_intent_keywords(intent))
+
+
+# ------------------------------------------------------------------
+# Rule table: one independent predicate per ErrorCode, canonical order
+# ------------------------------------------------------------------
+
+RulePredicate = Callable[[ResponseSignals, OrchestratorContext], bool]
+
+
+def _token_cap_reached(signals, context) -> bool:
+    # Authoritative, trust context — no text needed
+    return context.token_count > context.token_limit
+
+
+def _missing_confidence_label(signals, context) -> bool:
+    return signals.unlabelled_claim
+
+
+def _low_confidence_asserted(signals, context) -> bool:
+    return signals.low_confidence_asserted
+
+
+def _proceeded_with_uncertainty3(signals, context) -> bool:
+    return (
+        context.uncertainty_level == UncertaintyLevel.LEVEL_3
+        and signals.question_count < 1
+    )
+
+
+def _proceeded_with_uncertainty45(signals, context) -> bool:
+    return (
+        context.uncertainty_level in (UncertaintyLevel.LEVEL_4, UncertaintyLevel.LEVEL_5)
+        and signals.question_count < 3
+    )
+
+
+def _percentage_in_choice(signals, context) -> bool:
+    return signals.has_percentage
+
+
+def _invalid_user_choice_format(signals, context) -> bool:
+    letters = signals.choice_letters
+    return bool(letters) and sorted(c.upper() for c in letters) != ["A", "B", "C"]
+
+
+def _assumptions_not_surfaced(signals, context) -> bool:
+    return context.assumptions_required and not signals.assumption_block
+
+
+def _forbidden_authoritative_phrasing(signals, context) -> bool:
+    return signals.forbidden_authority
+
+
+def _memory_write_without_confirmation(signals, context) -> bool:
+    return context.memory_write_attempted and not context.memory_confirmation_asked
+
+
+def _memory_without_scope(signals, context) -> bool:
+    return context.memory_write_attempted and not context.memory_scope
+
+
+def _intent_not_addressed(signals, context) -> bool:
+    return not _addresses_intent(signals, context.user_intent)
+
+
+def _uncertainty_not_disclosed(signals, context) -> bool:
+    return (
+        context.contains_medium_or_low_confidence_claims
+        and not signals.uncertainty_language
+    )
+
+
+def _next_steps_not_clear(signals, context) -> bool:
+    return not signals.next_steps
+
+
+# Rules that are nested in the sequential path (percentage vs A/B/C
+# format, memory confirmation vs scope) are separate entries here; the
+# earlier entry always wins, so first-violation verdicts are unchanged.
+RULES: Tuple[Tuple[ErrorCode, RulePredicate], ...] = (
+    (ErrorCode.tokencapreached, _token_cap_reached),                          # 1️⃣
+    (ErrorCode.missingconfidencelabel, _missing_confidence_label),            # 2️⃣
+    (ErrorCode.lowconfidenceasserted, _low_confidence_asserted),              # 3️⃣
+    (ErrorCode.proceededwithuncertainty3, _proceeded_with_uncertainty3),      # 4️⃣
+    (ErrorCode.proceededwithuncertainty45, _proceeded_with_uncertainty45),    # 5️⃣
+    (ErrorCode.percentageinchoice, _percentage_in_choice),                    # 6️⃣
+    (ErrorCode.invaliduserchoiceformat, _invalid_user_choice_format),         # 6️⃣
+    (ErrorCode.assumptionsnotsurfaced, _assumptions_not_surfaced),            # 7️⃣
+    (ErrorCode.forbiddenauthoritativephrasing, _forbidden_authoritative_phrasing),  # 8️⃣
+    (ErrorCode.memorywritewithoutconfirmation, _memory_write_without_confirmation),  # 9️⃣
+    (ErrorCode.memorywithoutscope, _memory_without_scope),                    # 9️⃣
+    (ErrorCode.intentnotaddressed, _intent_not_addressed),                    # 🔟
+    (ErrorCode.uncertaintynotdisclosed, _uncertainty_not_disclosed),          # 1️⃣1️⃣
+    (ErrorCode.nextstepsnotclear, _next_steps_not_clear),                     # 1️⃣2️⃣
+)
+
+
+# ------------------------------------------------------------------
+# Collect-all mode (every violated rule + character spans)
+# ------------------------------------------------------------------
+
+def _authority_spans(text: str, lower: str) -> List[Span]:
+    # lower() only ever expands characters, so equal length means
+    # offsets in lower are offsets in text. Otherwise the spans are a
+    # best effort (case-insensitive match on text) and may be empty.
+    if len(lower) == len(text):
+        matches = AUTHORITY_PATTERN.finditer(lower)
+    else:
+        matches = _AUTHORITY_PATTERN_IGNORECASE.finditer(text)
+    return [match.span() for match in matches]
+
+
+# Spans of the built-in text rules; other rules report no spans
+_SPAN_LOCATORS: Dict[ErrorCode, Callable[[ResponseSignals], Iterable[Span]]] = {
+    ErrorCode.missingconfidencelabel: lambda signals: [
+        (claim.start, claim.end) for claim in signals.claims.unlabelled_claims
+    ],
+    ErrorCode.lowconfidenceasserted: lambda signals: signals.claims.low_asserted_lines,
+    ErrorCode.percentageinchoice: lambda signals: [
+        match.span() for match in PERCENT_PATTERN.finditer(signals.text)
+    ],
+    ErrorCode.invaliduserchoiceformat: lambda signals: [
+        match.span() for match in CHOICE_PATTERN.finditer(signals.text)
+    ],
+    ErrorCode.forbiddenauthoritativephrasing: lambda signals: _authority_spans(
+        signals.text, signals.lower
+    ),
+}
+
+
+def all_violations(
+    text: str,
+    context: OrchestratorContext,
+    rules: Iterable,
+    claims: Optional[ClaimIndex] = None,
+) -> List[Tuple[ErrorCode, Tuple[Span, ...]]]:
+    """
+    Evaluate EVERY rule (no fail-fast) over one tokenization of the
+    response.
+
+    rules: ValidationRules in canonical order (RuleRegistry.rules()),
+    so the first entry returned is always what validate() returns.
+    Returns (ErrorCode, spans) pairs.
+    """
+    signals = ResponseSignals(text, claims)
+    violations: List[Tuple[ErrorCode, Tuple[Span, ...]]] = []
+
+    for rule in rules:
+        if not rule.applies(context) or not rule.check(signals, context):
+            continue
+        locate = _SPAN_LOCATORS.get(rule.error_code)
+        spans = tuple(locate(signals)) if locate is not None else ()
+        violations.append((rule.error_code, spans))
+
+    return violations
@@ -0,0 +1,239 @@
+"""
+Incremental output validation over streamed text deltas.
+
+The caller feeds deltas as the LLM generates them. As soon as a rule is
+DEFINITIVELY violated (no further text can un-violate it), feed()
+returns a REJECTED ValidationResult so generation can be cancelled.
+
+Rules that can fail early (monotonic in the text):
+- token_cap_reached               (context only)
+- missing_confidence_label        (per completed sentence)
+- low_confidence_asserted         (per line, as soon as both appear)
+- percentage_in_choice            (first percentage)
+- invalid_user_choice_format      (more than 3 / repeated A/B/C markers)
+- forbidden_authoritative_phrasing (first authority phrase)
+- memory_write_* rules            (context only)
+
+Absence rules (questions, assumptions, intent, uncertainty, next
+steps) can only be decided once the text is complete, in finish().
+
+An early REJECTED status is final. Its error_code is the earliest
+registered rule (the validator's registry, canonical order) known to be
+violated at that point; finish() returns
+exactly what OutputValidator.validate returns for the full text.
+"""
+
+import re
+from typing import List, Optional
+
+from output_validator.models import ErrorCode, ValidationResult
+from output_validator.rules import (
+    CONFIDENCE_LABELS,
+    ASSERTIVE_PATTERN,
+    LOW_ASSERTIVE_TERMS,
+    LOW_ASSERTIVE_PATTERN,
+    AUTHORITY_PHRASES,
+    AUTHORITY_PATTERN,
+    SENTENCE_SPLIT_PATTERN,
+    PERCENT_PATTERN,
+    CHOICE_PATTERN,
+)
+from orchestrator.models import OrchestratorContext
+
+
+LOW_LABEL = "[LOW]"
+
+_TRAILING_NUMBER_RUN = re.compile(r"[\d\s]*\Z")
+
+# Characters str.splitlines() treats as line boundaries
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_SPLIT_PATTERN = re.compile("[" + re.escape(_LINE_BREAKS) + "]")
+
+_CHOICE_TAIL = 3  # "\b" needs one char before a 2-char "A)" marker
+_AUTHORITY_TAIL = max(len(p) for p in AUTHORITY_PHRASES) - 1
+_LOW_TERM_TAIL = max(len(t) for t in LOW_ASSERTIVE_TERMS) - 1
+_LOW_LABEL_TAIL = len(LOW_LABEL) - 1
+
+
+class IncrementalValidator:
+    """
+    Stateful validator for a single streamed response.
+    Create one per generation via OutputValidator.incremental(context).
+    """
+
+    def __init__(self, validator, context: OrchestratorContext):
+        self._validator = validator
+        self._context = context
+
+        self._chunks: List[str] = []
+        self._violations = set()
+        self._rejection: Optional[ValidationResult] = None
+
+        # missing_confidence_label: current partial sentence
+        self._sentence_parts: List[str] = []
+
+        # low_confidence_asserted: current partial line
+        self._line_tail = ""
+        self._line_tail_lower = ""
+        self._line_has_low = False
+        self._line_has_term = False
+
+        # percentage_in_choice / invalid_user_choice_format
+        self._number_run = ""
+        self._choice_tail = ""
+        self._choices: List[str] = []
+
+        # forbidden_authoritative_phrasing
+        self._authority_tail = ""
+
+        self._check_context(context)
+
+    # --------------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------------
+
+    @property
+    def rejection(self) -> Optional[ValidationResult]:
+        """The early REJECTED result, or None while undecided."""
+        return self._rejection
+
+    def feed(self, delta: str) -> Optional[ValidationResult]:
+        """
+        Consume one text delta.
+
+        Returns a REJECTED ValidationResult once any rule is
+        definitively violated (and on every call after that),
+        otherwise None.
+        """
+        if delta:
+            self._chunks.append(delta)
+
+            if self._rejection is None:
+                self._scan_sentences(delta)
+                self._scan_lines(delta)
+                self._scan_choices(delta)
+                self._scan_authority(delta)
+
+        if self._rejection is None and self._violations:
+            # Canonical order of the validator's registry; early
+            # signals for rules it does not run are ignored
+            for rule in self._validator.registry.rules():
+                if rule.error_code in self._violations:
+                    self._rejection = self._validator._reject(rule.error_code)
+                    break
+
+        return self._rejection
+
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def finish(
+        self,
+        context: Optional[OrchestratorContext] = None,
+    ) -> ValidationResult:
+        """
+        Final verdict for the complete text. Identical to
+        OutputValidator.validate(full_text, context).
+
+        context defaults to the one given at construction (pass the
+        final one if e.g. provider token usage is only known now).
+        """
+        return self._validator.validate(
+            self.text(),
+            context if context is not None else self._context,
+        )
+
+    # --------------------------------------------------------------
+    # Context-only rules
+    # --------------------------------------------------------------
+
+    def _check_context(self, context: OrchestratorContext) -> None:
+        if context.token_count > context.token_limit:
+            self._violations.add(ErrorCode.tokencapreached)
+
+        if context.memory_write_attempted:
+            if not context.memory_confirmation_asked:
+                self._violations.add(ErrorCode.memorywritewithoutconfirmation)
+            elif not context.memory_scope:
+                self._violations.add(ErrorCode.memorywithoutscope)
+
+    # --------------------------------------------------------------
+    # Text rules (each O(delta + bounded tail))
+    # --------------------------------------------------------------
+
+    def _scan_sentences(self, delta: str) -> None:
+        pieces = SENTENCE_SPLIT_PATTERN.split(delta)
+
+        # Every piece but the last closes a sentence
+        for piece in pieces[:-1]:
+            self._sentence_parts.append(piece)
+            sentence = "".join(self._sentence_parts)
+            self._sentence_parts = []
+
+            s = sentence.strip().lower()
+            if not s:
+                continue
+            if ASSERTIVE_PATTERN.search(s):
+                if not any(label in sentence for label in CONFIDENCE_LABELS):
+                    self._violations.add(ErrorCode.missingconfidencelabel)
+                    return
+
+        if pieces[-1]:
+            self._sentence_parts.append(pieces[-1])
+
+    def _scan_lines(self, delta: str) -> None:
+        pieces = _LINE_SPLIT_PATTERN.split(delta)
+
+        for index, piece in enumerate(pieces):
+            if index > 0:
+                # Line boundary crossed: reset per-line state
+                self._line_tail = ""
+                self._line_tail_lower = ""
+                self._line_has_low = False
+                self._line_has_term = False
+
+            if not piece:
+                continue
+
+            window = self._line_tail + piece
+            window_lower = self._line_tail_lower + piece.lower()
+
+            if not self._line_has_low and LOW_LABEL in window:
+                self._line_has_low = True
+            if not self._line_has_term and LOW_ASSERTIVE_PATTERN.search(window_lower):
+                self._line_has_term = True
+
+            if self._line_has_low and self._line_has_term:
+                self._violations.add(ErrorCode.lowconfidenceasserted)
+                return
+
+            self._line_tail = window[-_LOW_LABEL_TAIL:]
+            self._line_tail_lower = window_lower[-_LOW_TERM_TAIL:]
+
+    def _scan_choices(self, delta: str) -> None:
+        # Percentages: a match can only start inside the trailing run
+        # of digits / whitespace carried over from earlier deltas
+        window = self._number_run + delta
+        if PERCENT_PATTERN.search(window):
+            self._violations.add(ErrorCode.percentageinchoice)
+            return
+        self._number_run = window[_TRAILING_NUMBER_RUN.search(window).start():]
+
+        # A/B/C markers: only count matches that end inside the delta
+        offset = len(self._choice_tail)
+        window = self._choice_tail + delta
+        for match in CHOICE_PATTERN.finditer(window):
+            if match.end() <= offset:
+                continue
+            self._choices.append(match.group(1))
+            if len(self._choices) > 3 or len(set(self._choices)) != len(self._choices):
+                self._violations.add(ErrorCode.invaliduserchoiceformat)
+                return
+        self._choice_tail = window[-_CHOICE_TAIL:]
+
+    def _scan_authority(self, delta: str) -> None:
+        window = self._authority_tail + delta.lower()
+        if AUTHORITY_PATTERN.search(window):
+            self._violations.add(ErrorCode.forbiddenauthoritativephrasing)
+            return
+        self._authority_tail = window[-_AUTHORITY_TAIL:]
@@ -0,0 +1,145 @@
+"""
+Per-rule instrumentation for OutputValidator.
+
+For every rule (keyed by ErrorCode) this records:
+- calls       how often the rule was evaluated
+- total_ns    cumulative evaluation time in nanoseconds
+- rejections  how often the rule found the response in violation
+
+Disabled by default. When disabled the validator takes the
+un-instrumented path (one attribute check per validate call), so
+nothing is timed or counted.
+
+Signals that several rules read (the lowercase copy) are built
+before any rule is timed and recorded separately, so a rule's time is
+its own work, whichever rule happens to run first.
+
+Verdicts served from the verdict cache evaluate no rules and are
+not counted here (see OutputValidator.cache_stats).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+from output_validator.models import ErrorCode
+
+
+DEFAULT_METRIC_PREFIX = "output_validator"
+
+
+@dataclass(frozen=True)
+class RuleStats:
+    calls: int
+    total_ns: int
+    rejections: int
+
+    @property
+    def mean_ns(self) -> float:
+        if self.calls == 0:
+            return 0.0
+        return self.total_ns / self.calls
+
+    @property
+    def rejection_rate(self) -> float:
+        if self.calls == 0:
+            return 0.0
+        return self.rejections / self.calls
+
+
+@dataclass(frozen=True)
+class SignalStats:
+    calls: int
+    total_ns: int
+
+    @property
+    def mean_ns(self) -> float:
+        if self.calls == 0:
+            return 0.0
+        return self.total_ns / self.calls
+
+
+class ValidatorMetrics:
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._calls: Dict[ErrorCode, int] = {}
+        self._total_ns: Dict[ErrorCode, int] = {}
+        self._rejections: Dict[ErrorCode, int] = {}
+        self._signal_calls = 0
+        self._signal_ns = 0
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self._calls.clear()
+        self._total_ns.clear()
+        self._rejections.clear()
+        self._signal_calls = 0
+        self._signal_ns = 0
+
+    def observe(self, error_code: ErrorCode, elapsed_ns: int, rejected: bool) -> None:
+        self._calls[error_code] = self._calls.get(error_code, 0) + 1
+        self._total_ns[error_code] = self._total_ns.get(error_code, 0) + elapsed_ns
+        if rejected:
+            self._rejections[error_code] = self._rejections.get(error_code, 0) + 1
+
+    def observe_signals(self, elapsed_ns: int) -> None:
+        """Time spent building the shared signals of one response."""
+        self._signal_calls += 1
+        self._signal_ns += elapsed_ns
+
+    def signal_stats(self) -> SignalStats:
+        return SignalStats(calls=self._signal_calls, total_ns=self._signal_ns)
+
+    def rule_stats(self) -> Dict[ErrorCode, RuleStats]:
+        """Snapshot of every rule evaluated at least once."""
+        return {
+            error_code: RuleStats(
+                calls=calls,
+                total_ns=self._total_ns.get(error_code, 0),
+                rejections=self._rejections.get(error_code, 0),
+            )
+            for error_code, calls in self._calls.items()
+        }
+
+    def to_prometheus(self, prefix: str = DEFAULT_METRIC_PREFIX) -> str:
+        """
+        Prometheus text exposition format (version 0.0.4).
+        Durations are exported in seconds, Prometheus' base unit.
+        """
+        stats = sorted(self.rule_stats().items(), key=lambda item: item[0].value)
+
+        families = [
+            (
+                f"{prefix}_rule_calls_total",
+                "Rule evaluations.",
+                lambda s: str(s.calls),
+            ),
+            (
+                f"{prefix}_rule_duration_seconds_total",
+                "Cumulative rule evaluation time in seconds.",
+                lambda s: repr(s.total_ns / 1e9),
+            ),
+            (
+                f"{prefix}_rule_rejections_total",
+                "Rule evaluations that found a violation.",
+                lambda s: str(s.rejections),
+            ),
+        ]
+
+        lines: List[str] = []
+        for name, help_text, value in families:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for error_code, rule in stats:
+                lines.append(f'{name}{{rule="{error_code.value}"}} {value(rule)}')
+
+        if self._signal_calls:
+            name = f"{prefix}_shared_signals_duration_seconds_total"
+            lines.append(f"# HELP {name} Time building signals shared by several rules, in seconds.")
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {self._signal_ns / 1e9!r}")
+        return "\n".join(lines) + "\n"
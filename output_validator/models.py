@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Literal
+from typing import Optional, Literal, Tuple
 
 
 class ErrorCode(Enum):
@@ -20,12 +20,91 @@ class ErrorCode(Enum):
     forbidden_authoritative_phrasing = "forbidden_authoritative_phrasing"
     contradicts_memory = "contradicts_memory"
 
+    # Compact aliases (same members) used by the validator and rules
+    missingconfidencelabel = "missing_confidence_label"
+    lowconfidenceasserted = "low_confidence_asserted"
+    percentageinchoice = "percentage_in_choice"
+    invaliduserchoiceformat = "invalid_user_choice_format"
+    assumptionsnotsurfaced = "assumptions_not_surfaced"
+    proceededwithuncertainty3 = "proceeded_with_uncertainty3"
+    proceededwithuncertainty45 = "proceeded_with_uncertainty45"
+    memorywritewithoutconfirmation = "memory_write_without_confirmation"
+    memorywithoutscope = "memory_without_scope"
+    tokencapreached = "token_cap_reached"
+    nextstepsnotclear = "next_steps_not_clear"
+    uncertaintynotdisclosed = "uncertainty_not_disclosed"
+    intentnotaddressed = "intent_not_addressed"
+    forbiddenauthoritativephrasing = "forbidden_authoritative_phrasing"
+    contradictsmemory = "contradicts_memory"
+
+
+# (start, end) character offsets into the validated response
+Span = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ClaimSpan:
+    """
+    One sentence of a response (split on "." / newline), stripped.
+    """
+    start: int
+    end: int
+    labels: Tuple[str, ...]            # confidence labels present, e.g. ("[HIGH]",)
+    assertive: bool                    # contains an assertive term
+    assertive_hits: Tuple[Span, ...]   # where the assertive terms are
+
+    @property
+    def is_unlabelled_claim(self) -> bool:
+        return self.assertive and not self.labels
+
+
+@dataclass(frozen=True)
+class ClaimIndex:
+    """
+    Labelled-claim index built ONCE per response and shared by the
+    claim rules, the orchestrator and the UI.
+    """
+    sentences: Tuple[ClaimSpan, ...]
+    low_asserted_lines: Tuple[Span, ...]   # [LOW] lines using assertive wording
+
+    @property
+    def unlabelled_claims(self) -> Tuple[ClaimSpan, ...]:
+        return tuple(s for s in self.sentences if s.is_unlabelled_claim)
+
+    @property
+    def has_unlabelled_claim(self) -> bool:
+        return any(s.is_unlabelled_claim for s in self.sentences)
+
+    @property
+    def has_medium_or_low_claims(self) -> bool:
+        return any(
+            "[MEDIUM]" in s.labels or "[LOW]" in s.labels
+            for s in self.sentences
+        )
+
+
+@dataclass(frozen=True)
+class RuleViolation:
+    """
+    One violated rule, as reported by OutputValidator.validate_all.
+
+    spans is empty for context-only rules (token cap, memory) and for
+    absence rules (missing questions, next steps, ...).
+    """
+    error_code: ErrorCode
+    message: str
+    spans: Tuple[Span, ...] = ()
+
 
 @dataclass(frozen=True)
 class ValidationResult:
     status: Literal["ACCEPTED", "REJECTED"]
     error_code: Optional[ErrorCode]
     message: Optional[str]
+    # Populated by validate_all only: every violated rule, canonical order
+    violations: Tuple[RuleViolation, ...] = ()
+    # Claim index of the validated text (None if no text rule ran)
+    claim_index: Optional[ClaimIndex] = field(default=None, compare=False)
 
     def __post_init__(self):
         # Enforce invariant:
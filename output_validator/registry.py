@@ -0,0 +1,247 @@
+"""
+Pluggable rule registry with cost-based scheduling.
+
+Each ValidationRule declares:
+- error_code    the ErrorCode it rejects with (one rule per code)
+- check         predicate(signals, context) -> True if violated
+- depends_on    OrchestratorContext fields the rule reads
+- precondition  context-only gate; when False the rule cannot fire
+                and is skipped without touching the text
+- cost_ns       estimated evaluation cost, used until observed
+
+priority is the rule's canonical position (steps 1–12). The verdict is
+always the violated rule with the LOWEST priority, exactly as in the
+fixed order, whatever order the rules are run in:
+
+    once a rule at priority k fires, only rules with priority < k
+    are still evaluated, and any of them that fires replaces it.
+
+A schedule that runs cheap, often-violated rules first therefore finds
+rejections early without changing any verdict.
+"""
+
+import time
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from output_validator.errors import ValidationError
+from output_validator.fused import (
+    ResponseSignals,
+    RulePredicate,
+    RULES,
+)
+from output_validator.metrics import RuleStats, ValidatorMetrics
+from output_validator.models import ErrorCode
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+
+
+ContextPrecondition = Callable[[OrchestratorContext], bool]
+
+# Observed mean cost replaces cost_ns after this many evaluations
+MIN_OBSERVATIONS = 32
+
+_CONTEXT_FIELDS = frozenset(f.name for f in fields(OrchestratorContext))
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    error_code: ErrorCode
+    check: RulePredicate
+    priority: int
+    depends_on: Tuple[str, ...] = ()
+    precondition: Optional[ContextPrecondition] = None
+    cost_ns: float = 1_000.0
+
+    def applies(self, context: OrchestratorContext) -> bool:
+        return self.precondition is None or self.precondition(context)
+
+
+class RuleRegistry:
+    def __init__(self, rules: Iterable[ValidationRule] = ()):
+        self._rules: Dict[ErrorCode, ValidationRule] = {}
+        # Bumped on every register / unregister, so holders of a
+        # schedule (OutputValidator) know it is stale
+        self.version = 0
+        for rule in rules:
+            self.register(rule)
+
+    def register(self, rule: ValidationRule) -> None:
+        if rule.error_code in self._rules:
+            raise ValidationError(
+                f"A rule for {rule.error_code.value} is already registered"
+            )
+
+        unknown = [name for name in rule.depends_on if name not in _CONTEXT_FIELDS]
+        if unknown:
+            raise ValidationError(
+                f"Rule {rule.error_code.value} depends on unknown context fields: {unknown}"
+            )
+
+        if any(other.priority == rule.priority for other in self._rules.values()):
+            raise ValidationError(
+                f"Rule {rule.error_code.value} reuses priority {rule.priority}"
+            )
+
+        self._rules[rule.error_code] = rule
+        self.version += 1
+
+    def unregister(self, error_code: ErrorCode) -> ValidationRule:
+        rule = self._rules.pop(error_code)
+        self.version += 1
+        return rule
+
+    def rules(self) -> Tuple[ValidationRule, ...]:
+        """Registered rules in canonical (priority) order."""
+        return tuple(sorted(self._rules.values(), key=lambda rule: rule.priority))
+
+    # --------------------------------------------------------------
+    # Scheduling
+    # --------------------------------------------------------------
+
+    def schedule(
+        self,
+        stats: Optional[Dict[ErrorCode, RuleStats]] = None,
+    ) -> Tuple[ValidationRule, ...]:
+        """
+        Order rules by expected cost per rejection (lowest first):
+
+            cost        observed mean_ns after MIN_OBSERVATIONS calls,
+                        declared cost_ns before that
+            rejection   (rejections + 1) / (calls + 2), so unobserved
+                        rules start at 0.5
+
+        Ties keep canonical order.
+        """
+        stats = stats or {}
+
+        def score(rule: ValidationRule) -> Tuple[float, int]:
+            observed = stats.get(rule.error_code)
+            calls = observed.calls if observed else 0
+            rejections = observed.rejections if observed else 0
+
+            cost = rule.cost_ns
+            if calls >= MIN_OBSERVATIONS:
+                cost = observed.mean_ns
+
+            rejection = (rejections + 1) / (calls + 2)
+            return cost / rejection, rule.priority
+
+        return tuple(sorted(self._rules.values(), key=score))
+
+    # --------------------------------------------------------------
+    # Evaluation
+    # --------------------------------------------------------------
+
+    @staticmethod
+    def first_violation(
+        order: Tuple[ValidationRule, ...],
+        signals: ResponseSignals,
+        context: OrchestratorContext,
+        metrics: Optional[ValidatorMetrics] = None,
+    ) -> Optional[ErrorCode]:
+        """
+        Run rules in the given order. Returns the violated rule with the
+        lowest priority (identical to the canonical first violation).
+
+        With metrics, shared signals are built (and timed) before the
+        first rule, so each rule's time covers only its own work.
+        """
+        found: Optional[ValidationRule] = None
+
+        if metrics is not None:
+            start = time.perf_counter_ns()
+            signals.build_shared()
+            metrics.observe_signals(time.perf_counter_ns() - start)
+
+        for rule in order:
+            if found is not None and rule.priority > found.priority:
+                continue
+            # rule.applies(context), inlined: this loop runs per response
+            precondition = rule.precondition
+            if precondition is not None and not precondition(context):
+                continue
+
+            if metrics is None:
+                violated = rule.check(signals, context)
+            else:
+                start = time.perf_counter_ns()
+                violated = rule.check(signals, context)
+                metrics.observe(rule.error_code, time.perf_counter_ns() - start, violated)
+
+            if violated:
+                found = rule
+
+        return found.error_code if found is not None else None
+
+
+# ------------------------------------------------------------------
+# Built-in rules (policy v1.3.2, steps 1–12)
+# ------------------------------------------------------------------
+
+_BUILTIN_METADATA: Dict[ErrorCode, Tuple[Tuple[str, ...], Optional[ContextPrecondition], float]] = {
+    ErrorCode.tokencapreached: (
+        ("token_count", "token_limit"), None, 50.0,
+    ),
+    ErrorCode.missingconfidencelabel: ((), None, 20_000.0),
+    ErrorCode.lowconfidenceasserted: ((), None, 1_000.0),
+    ErrorCode.proceededwithuncertainty3: (
+        ("uncertainty_level",),
+        lambda context: context.uncertainty_level == UncertaintyLevel.LEVEL_3,
+        500.0,
+    ),
+    ErrorCode.proceededwithuncertainty45: (
+        ("uncertainty_level",),
+        lambda context: context.uncertainty_level in (
+            UncertaintyLevel.LEVEL_4,
+            UncertaintyLevel.LEVEL_5,
+        ),
+        500.0,
+    ),
+    ErrorCode.percentageinchoice: ((), None, 3_000.0),
+    ErrorCode.invaliduserchoiceformat: ((), None, 3_000.0),
+    ErrorCode.assumptionsnotsurfaced: (
+        ("assumptions_required",),
+        lambda context: bool(context.assumptions_required),
+        2_000.0,
+    ),
+    ErrorCode.forbiddenauthoritativephrasing: ((), None, 2_000.0),
+    ErrorCode.memorywritewithoutconfirmation: (
+        ("memory_write_attempted", "memory_confirmation_asked"),
+        lambda context: bool(context.memory_write_attempted),
+        50.0,
+    ),
+    ErrorCode.memorywithoutscope: (
+        ("memory_write_attempted", "memory_scope"),
+        lambda context: bool(context.memory_write_attempted),
+        50.0,
+    ),
+    ErrorCode.intentnotaddressed: (("user_intent",), None, 3_000.0),
+    ErrorCode.uncertaintynotdisclosed: (
+        ("contains_medium_or_low_confidence_claims",),
+        lambda context: bool(context.contains_medium_or_low_confidence_claims),
+        2_000.0,
+    ),
+    ErrorCode.nextstepsnotclear: ((), None, 2_000.0),
+}
+
+
+def builtin_rules() -> List[ValidationRule]:
+    rules = []
+    for priority, (error_code, check) in enumerate(RULES):
+        depends_on, precondition, cost_ns = _BUILTIN_METADATA[error_code]
+        rules.append(
+            ValidationRule(
+                error_code=error_code,
+                check=check,
+                priority=priority,
+                depends_on=depends_on,
+                precondition=precondition,
+                cost_ns=cost_ns,
+            )
+        )
+    return rules
+
+
+def default_registry() -> RuleRegistry:
+    return RuleRegistry(builtin_rules())
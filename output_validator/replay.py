@@ -0,0 +1,229 @@
+"""
+Bulk offline re-validation of recorded responses.
+
+Usage:
+    python -m output_validator.replay <input.jsonl> <verdicts.jsonl>
+        [--policy policy_v1.3.2.yaml] [--workers N] [--batch-size N]
+
+Input: one JSON record per line:
+    {"id": "...", "text": "...", "context": {<OrchestratorContext fields>}}
+    ("id" is optional; uncertainty_level is the UncertaintyLevel value,
+    e.g. "LEVEL_3")
+
+Output: one verdict per non-blank input line, in input order:
+    {"id": "...", "status": "ACCEPTED" | "REJECTED" | "INVALID",
+     "error_code": "..." | null}
+
+A summary (totals, per-rule rejection counts, responses/sec) is
+printed to stdout as JSON.
+
+Each worker process boots its own PolicyEngine + OutputValidator once.
+Input is consumed in bounded batches, so memory stays flat for
+arbitrarily large transcript files.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import islice
+from multiprocessing import Pool
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from output_validator.validator import OutputValidator
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+DEFAULT_POLICY_PATH = "policy_v1.3.2.yaml"
+DEFAULT_BATCH_SIZE = 10_000
+
+# (id, status, error_code value or error detail)
+Verdict = Tuple[Optional[str], str, Optional[str]]
+
+
+@dataclass
+class ReplaySummary:
+    total: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    invalid: int = 0
+    rejections_by_rule: Dict[str, int] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def responses_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total / self.elapsed_seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "invalid": self.invalid,
+            "rejections_by_rule": dict(sorted(self.rejections_by_rule.items())),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "responses_per_second": round(self.responses_per_second, 1),
+        }
+
+
+def context_from_record(fields: dict) -> OrchestratorContext:
+    """
+    Rebuild an OrchestratorContext from recorded JSON fields.
+    """
+    fields = dict(fields)
+    level = fields.get("uncertainty_level")
+    if isinstance(level, str):
+        fields["uncertainty_level"] = UncertaintyLevel(level)
+    return OrchestratorContext(**fields)
+
+
+# ------------------------------------------------------------------
+# Worker side
+# ------------------------------------------------------------------
+
+_worker_validator: Optional[OutputValidator] = None
+
+
+def _init_worker(policy_path: str) -> None:
+    global _worker_validator
+    # Replayed records are distinct responses: a verdict cache would
+    # only add a digest per record
+    _worker_validator = OutputValidator(PolicyEngine(policy_path), cache_size=0)
+
+
+def _validate_line(line: str) -> Verdict:
+    record_id = None
+    try:
+        record = json.loads(line)
+        record_id = record.get("id")
+        context = context_from_record(record["context"])
+        text = record["text"]
+        if not isinstance(text, str):
+            raise TypeError(f"text must be a string, not {type(text).__name__}")
+    except (ValueError, TypeError, KeyError, AttributeError) as exc:
+        return record_id, "INVALID", f"{type(exc).__name__}: {exc}"
+
+    # Well-formed JSON can still carry mistyped context fields
+    # (e.g. "token_count": "5"); reject the record, not the replay
+    try:
+        result = _worker_validator.validate(text, context)
+    except (ValueError, TypeError, AttributeError) as exc:
+        return record_id, "INVALID", f"{type(exc).__name__}: {exc}"
+    error_code = result.error_code.value if result.error_code else None
+    return record_id, result.status, error_code
+
+
+# ------------------------------------------------------------------
+# Driver
+# ------------------------------------------------------------------
+
+def _batches(lines: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+    records = (line for line in lines if line.strip())
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def replay(
+    lines: Iterable[str],
+    out: TextIO,
+    policy_path: str = DEFAULT_POLICY_PATH,
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ReplaySummary:
+    """
+    Validate every JSONL record in lines, writing one verdict per
+    record to out (blank lines are skipped). workers=1 runs in-process (no pool).
+    """
+    summary = ReplaySummary()
+    rejections = Counter()
+    start = time.perf_counter()
+
+    pool = None
+    if workers > 1:
+        pool = Pool(workers, initializer=_init_worker, initargs=(policy_path,))
+    else:
+        _init_worker(policy_path)
+
+    try:
+        for batch in _batches(lines, batch_size):
+            if pool is not None:
+                chunksize = max(1, len(batch) // (workers * 4))
+                verdicts = pool.map(_validate_line, batch, chunksize=chunksize)
+            else:
+                verdicts = [_validate_line(line) for line in batch]
+
+            for record_id, status, detail in verdicts:
+                summary.total += 1
+                if status == "ACCEPTED":
+                    summary.accepted += 1
+                    out.write(json.dumps({"id": record_id, "status": status, "error_code": None}) + "\n")
+                elif status == "REJECTED":
+                    summary.rejected += 1
+                    rejections[detail] += 1
+                    out.write(json.dumps({"id": record_id, "status": status, "error_code": detail}) + "\n")
+                else:
+                    summary.invalid += 1
+                    out.write(json.dumps({"id": record_id, "status": status, "error": detail}) + "\n")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    summary.rejections_by_rule = dict(rejections)
+    summary.elapsed_seconds = time.perf_counter() - start
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m output_validator.replay",
+        description="Re-validate recorded responses against the current rules.",
+    )
+    parser.add_argument("input", help="JSONL file of recorded responses ('-' for stdin)")
+    parser.add_argument("output", help="JSONL file to write verdicts to ('-' for stdout)")
+    parser.add_argument("--policy", default=DEFAULT_POLICY_PATH)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    # Fail fast on a bad policy before spawning workers
+    try:
+        PolicyEngine(args.policy)
+    except FileNotFoundError:
+        print("Policy file not found.", file=sys.stderr)
+        return 2
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    try:
+        summary = replay(
+            source,
+            sink,
+            policy_path=args.policy,
+            workers=max(1, args.workers),
+            batch_size=max(1, args.batch_size),
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    report = json.dumps(summary.to_dict(), indent=2)
+    print(report, file=sys.stderr if sink is sys.stdout else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 import re
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 
 CONFIDENCE_LABELS = ["[HIGH]", "[MEDIUM]", "[LOW]"]
 
@@ -32,22 +32,107 @@ AUTHORITY_PHRASES = [
     "undeniably",
 ]
 
+ASSUMPTION_PHRASES = [
+    "i assume",
+    "assumption",
+]
+
+UNCERTAINTY_TERMS = [
+    "might",
+    "uncertain",
+    "not sure",
+    "possibly",
+    "depends",
+]
+
+NEXT_STEP_PHRASES = [
+    "next step",
+    "you can now",
+    "we should",
+    "let me know",
+    "stop here",
+]
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    end = "" in node
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char != ""
+    ]
+
+    if not branches:
+        return ""
+
+    if len(branches) == 1 and not end:
+        return branches[0]
+
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if end else group
+
+
+def compile_vocabulary(terms: List[str]) -> Pattern[str]:
+    """
+    Compile a vocabulary into ONE trie-shaped alternation regex.
+
+    pattern.search(s) is truthy iff any(term in s for term in terms).
+    Terms are matched verbatim (callers pass lowercased text).
+    """
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    return re.compile(_trie_pattern(trie))
+
+
+# Compiled once at import. Sentence/line rules use one search() per
+# sentence. Whole-text checks keep str.__contains__ scans: a single
+# substring scan over a long response beats the regex engine there.
+ASSERTIVE_PATTERN = compile_vocabulary(ASSERTIVE_TERMS)
+LOW_ASSERTIVE_PATTERN = compile_vocabulary(LOW_ASSERTIVE_TERMS)
+AUTHORITY_PATTERN = compile_vocabulary(AUTHORITY_PHRASES)
+ASSUMPTION_PATTERN = compile_vocabulary(ASSUMPTION_PHRASES)
+UNCERTAINTY_PATTERN = compile_vocabulary(UNCERTAINTY_TERMS)
+NEXT_STEP_PATTERN = compile_vocabulary(NEXT_STEP_PHRASES)
+
+SENTENCE_SPLIT_PATTERN = re.compile(r"[.\n]")
 PERCENT_PATTERN = re.compile(r"\d+\s*%")
 CHOICE_PATTERN = re.compile(r"\b([A-C])\)")
 
+
+def compile_byte_vocabulary(pattern: Pattern[str]) -> Pattern[bytes]:
+    """
+    Bytes twin of a compiled (lowercase, ASCII) vocabulary.
+
+    Matches ASCII case-insensitively, so on ASCII input
+    twin.search(data) is truthy iff pattern.search(data.lower()) is —
+    without making the lowercase copy.
+    """
+    return re.compile(pattern.pattern.encode("ascii"), re.IGNORECASE)
+
+
+# Bytes twins for the per-sentence / per-line vocabularies, used on
+# ASCII UTF-8 input (see output_validator.byte_input)
+ASSERTIVE_BYTES = compile_byte_vocabulary(ASSERTIVE_PATTERN)
+LOW_ASSERTIVE_BYTES = compile_byte_vocabulary(LOW_ASSERTIVE_PATTERN)
+
 # ------------------------------------------------------------------
 # Claim confidence labeling
 # ------------------------------------------------------------------
 
 def contains_claim_without_label(text: str) -> bool:
-    sentences = re.split(r"[.\n]", text)
+    sentences = SENTENCE_SPLIT_PATTERN.split(text)
     for sentence in sentences:
         s = sentence.strip().lower()
         if not s:
             continue
 
         # Only evaluate assertive claims
-        if any(term in s for term in ASSERTIVE_TERMS):
+        if ASSERTIVE_PATTERN.search(s):
             if not any(label in sentence for label in CONFIDENCE_LABELS):
                 return True
     return False
@@ -58,7 +143,7 @@ def low_confidence_asserted(text: str) -> bool:
     for line in lines:
         if "[LOW]" in line:
             lower = line.lower()
-            if any(term in lower for term in LOW_ASSERTIVE_TERMS):
+            if LOW_ASSERTIVE_PATTERN.search(lower):
                 return True
     return False
 
@@ -107,15 +192,12 @@ def contains_grounding_questions(text: str) -> bool:
 
 def contains_assumption_block(text: str) -> bool:
     lower = text.lower()
-    return "i assume" in lower or "assumption" in lower
+    return any(phrase in lower for phrase in ASSUMPTION_PHRASES)
 
 
 def contains_uncertainty_language(text: str) -> bool:
     lower = text.lower()
-    return any(
-        word in lower
-        for word in ["might", "uncertain", "not sure", "possibly", "depends"]
-    )
+    return any(word in lower for word in UNCERTAINTY_TERMS)
 
 
 # ------------------------------------------------------------------
@@ -124,13 +206,7 @@ def contains_uncertainty_language(text: str) -> bool:
 
 def contains_next_steps_or_explicit_stop(text: str) -> bool:
     lower = text.lower()
-    return (
-        "next step" in lower
-        or "you can now" in lower
-        or "we should" in lower
-        or "let me know" in lower
-        or "stop here" in lower
-    )
+    return any(phrase in lower for phrase in NEXT_STEP_PHRASES)
 
 
 # ------------------------------------------------------------------
@@ -1,4 +1,13 @@
-from output_validator.models import ValidationResult, ErrorCode
+from typing import Optional, Tuple
+
+from output_validator.models import ValidationResult, ErrorCode, RuleViolation, ClaimIndex
+from output_validator.byte_input import ResponseText, decode_response
+from output_validator.claims import index_response
+from output_validator.fused import collect_signals, all_violations
+from output_validator.incremental import IncrementalValidator
+from output_validator.cache import ValidationCache, CacheStats, DEFAULT_CACHE_SIZE
+from output_validator.metrics import ValidatorMetrics
+from output_validator.registry import RuleRegistry, ValidationRule, default_registry
 from output_validator.rules import (
     contains_claim_without_label,
     low_confidence_asserted,
@@ -16,23 +25,248 @@ from uncertainty_engine.enums import UncertaintyLevel
 from policy_engine.policy_engine import PolicyEngine
 
 
+# Uncached validations between two adaptive re-schedules
+RESCHEDULE_INTERVAL = 256
+
+
+def _is_immutable(text: ResponseText) -> bool:
+    if isinstance(text, memoryview):
+        return isinstance(text.obj, bytes)
+    return isinstance(text, (str, bytes))
+
+
 class OutputValidator:
     """
     Hard gatekeeper for LLM output.
     Enforces policy v1.3.2 deterministically and fail-fast.
     """
 
-    def __init__(self, policy_engine: PolicyEngine):
+    def __init__(
+        self,
+        policy_engine: PolicyEngine,
+        cache_size: int = 0,
+        metrics_enabled: bool = False,
+        registry: Optional[RuleRegistry] = None,
+        adaptive_schedule: bool = False,
+    ):
         self.policy_engine = policy_engine
+        # Verdict cache, opt-in (e.g. cache_size=DEFAULT_CACHE_SIZE for
+        # retry / replay heavy callers): distinct responses rarely
+        # repeat, and every cached lookup hashes the full text
+        self._cache = ValidationCache(cache_size)
+        # Per-rule calls / latency / rejections (see output_validator.metrics)
+        self.metrics = ValidatorMetrics(enabled=metrics_enabled)
+
+        # Rules and the order they run in (see output_validator.registry).
+        # adaptive_schedule: run cheap, often-violated rules first, using
+        # observed metrics when enabled. Verdicts never change.
+        self.registry = registry if registry is not None else default_registry()
+        self.adaptive_schedule = adaptive_schedule
+        self._order: Tuple[ValidationRule, ...] = ()
+        self._order_version = -1
+        self._until_reschedule = 0
+        self.reschedule()
+        # Last (text, index) built, so scan_confidence_levels(text)
+        # followed by validate(text, ...) indexes the text once.
+        # Immutable texts only (see _remember_claims)
+        self._last_claims: Optional[Tuple[ResponseText, ClaimIndex]] = None
 
-    def _reject(self, error_code: ErrorCode) -> ValidationResult:
+    def _reject(
+        self,
+        error_code: ErrorCode,
+        claim_index: Optional[ClaimIndex] = None,
+    ) -> ValidationResult:
         return ValidationResult(
             status="REJECTED",
             error_code=error_code,
             message=self.policy_engine.get_error_message(error_code),
+            claim_index=claim_index,
+        )
+
+    def _accept(self, claim_index: Optional[ClaimIndex] = None) -> ValidationResult:
+        return ValidationResult(
+            status="ACCEPTED",
+            error_code=None,
+            message=None,
+            claim_index=claim_index,
         )
 
-    def validate(self, text: str, context: OrchestratorContext) -> ValidationResult:
+    def index_claims(self, text: ResponseText) -> ClaimIndex:
+        """
+        Claim index of text: sentence spans, confidence labels and
+        assertive-term hits. Built once per text and reused by
+        validate / validate_all / scan_confidence_levels.
+        """
+        claims = self._known_claims(text)
+        if claims is None:
+            claims = index_response(text)
+            self._remember_claims(text, claims)
+        return claims
+
+    def _remember_claims(self, text: ResponseText, claims: ClaimIndex) -> None:
+        # A bytearray (or a view of one) can change in place after this
+        # call; remembering it would reuse a stale index
+        if _is_immutable(text):
+            self._last_claims = (text, claims)
+
+    def _known_claims(self, text: ResponseText) -> Optional[ClaimIndex]:
+        last = self._last_claims
+        if last is None or not _is_immutable(text):
+            return None
+        if last[0] is text or last[0] == text:
+            return last[1]
+        return None
+
+    def scan_confidence_levels(self, text: ResponseText) -> bool:
+        """
+        True if any claim in text carries a [MEDIUM] or [LOW] label
+        (feeds OrchestratorContext.contains_medium_or_low_confidence_claims).
+        """
+        return self.index_claims(text).has_medium_or_low_claims
+
+    def validate(self, text: ResponseText, context: OrchestratorContext) -> ValidationResult:
+        """
+        Fused single-pass validation (see output_validator.fused).
+        text may be str or UTF-8 bytes / memoryview (validated in place
+        when ASCII, see output_validator.byte_input).
+        Rules run in the registry's schedule; verdicts are identical to
+        validate_sequential for the built-in rules.
+
+        With cache_size > 0, verdicts are cached per (text digest,
+        context, policy version); a policy reload invalidates the cache.
+
+        The claim rules stop at the first offending sentence and do not
+        build a claim index; the result carries one only if it was
+        already built for text (index_claims / scan_confidence_levels).
+        """
+        self._cache.sync_policy(
+            (self.policy_engine.get_version(), self.policy_engine.generation)
+        )
+        # Registry changed since the last schedule: new order, and no
+        # verdict from the old rule set may be served
+        if self.registry.version != self._order_version:
+            self.reschedule()
+
+        # A disabled cache costs nothing: no digest, no miss recorded
+        key = None
+        if self._cache.enabled:
+            key = self._cache.make_key(text, context)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+
+        signals = collect_signals(text, self._known_claims(text))
+        error_code = self.registry.first_violation(
+            self._next_order(),
+            signals,
+            context,
+            self.metrics if self.metrics.enabled else None,
+        )
+
+        claims = signals.built_claims
+        if claims is not None:
+            self._remember_claims(text, claims)
+
+        if error_code is not None:
+            result = self._reject(error_code, claims)
+        else:
+            # ✅ ACCEPTED
+            result = self._accept(claims)
+
+        if key is not None:
+            self._cache.put(key, result)
+        return result
+
+    def reschedule(self) -> None:
+        """
+        Recompute the rule order now and drop cached verdicts. validate()
+        does this by itself when the registry changes.
+        """
+        self._order_version = self.registry.version
+        if self.adaptive_schedule:
+            stats = self.metrics.rule_stats() if self.metrics.enabled else None
+            self._order = self.registry.schedule(stats)
+        else:
+            self._order = self.registry.rules()
+
+        self._until_reschedule = RESCHEDULE_INTERVAL
+        self._cache.clear()
+
+    def _next_order(self) -> Tuple[ValidationRule, ...]:
+        if self.adaptive_schedule and self.metrics.enabled:
+            self._until_reschedule -= 1
+            if self._until_reschedule <= 0:
+                self._order = self.registry.schedule(self.metrics.rule_stats())
+                self._until_reschedule = RESCHEDULE_INTERVAL
+        return self._order
+
+    def export_metrics(self) -> str:
+        """Per-rule metrics in Prometheus text format."""
+        return self.metrics.to_prometheus()
+
+    def cache_stats(self) -> CacheStats:
+        """Hit / miss counts and hit ratio of the verdict cache."""
+        return self._cache.stats()
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def validate_all(self, text: ResponseText, context: OrchestratorContext) -> ValidationResult:
+        """
+        Collect-all mode: evaluate EVERY rule in one fused pass.
+
+        status / error_code / message are identical to validate();
+        violations lists every violated registry rule (canonical order)
+        with its policy message and character spans, so a single repair or
+        re-prompt can address all of them.
+
+        Bytes input is decoded first (spans are character offsets).
+        """
+        if not isinstance(text, str):
+            text = decode_response(text)
+
+        claims = self.index_claims(text)
+        violations = tuple(
+            RuleViolation(
+                error_code=error_code,
+                message=self.policy_engine.get_error_message(error_code),
+                spans=spans,
+            )
+            for error_code, spans in all_violations(
+                text, context, self.registry.rules(), claims
+            )
+        )
+
+        if not violations:
+            return self._accept(claims)
+
+        first = violations[0]
+        return ValidationResult(
+            status="REJECTED",
+            error_code=first.error_code,
+            message=first.message,
+            violations=violations,
+            claim_index=claims,
+        )
+
+    def incremental(self, context: OrchestratorContext) -> IncrementalValidator:
+        """
+        Start streamed validation of one response.
+        Feed text deltas; a REJECTED result is returned as soon as a
+        rule is definitively violated so generation can be cancelled.
+        """
+        return IncrementalValidator(self, context)
+
+    def validate_sequential(
+        self,
+        text: str,
+        context: OrchestratorContext,
+    ) -> ValidationResult:
+        """
+        Reference path: one rule function per step, in canonical order.
+        Kept as the parity baseline for the fused engine.
+        """
         # 1️⃣ Token limit (authoritative, trust context)
         if context.token_count > context.token_limit:
             return self._reject(ErrorCode.tokencapreached)
@@ -61,7 +295,7 @@ class OutputValidator:
         # 6️⃣ A/B/C rules + percentages
         violates, error = violates_abc_rules(text)
         if violates:
-            return self._reject(error)
+            return self._reject(ErrorCode[error])
 
         # 7️⃣ Assumptions surfaced
         if context.assumptions_required:
@@ -93,8 +327,4 @@ class OutputValidator:
             return self._reject(ErrorCode.nextstepsnotclear)
 
         # ✅ ACCEPTED
-        return ValidationResult(
-            status="ACCEPTED",
-            error_code=None,
-            message=None,
-        )
\ No newline at end of file
+        return self._accept()
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""
+Adaptive token budgets (optional).
+
+By default prepare_request asks the provider for max_tokens = hard cap,
+so CAREFUL reserves 5000 output tokens for every request even though
+most answers are far shorter. With an AdaptiveBudget the controller
+asks for
+
+    max_tokens = clamp(quantile(observed outputs) * headroom,
+                       min_tokens, hard_cap_tokens)
+
+per (mode, context key), where quantile is read from a streaming sketch
+of token_usage_output at a configurable percentile.
+
+HARD RULES:
+- Never above the policy hard cap (the policy stays the ceiling)
+- Until min_observations outputs are seen, the hard cap is used
+- A truncated output (one that hit its budget) is recorded as the hard
+  cap, so a budget that was too tight grows back instead of
+  reinforcing itself
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+from pacing_controller.enums import PacingMode
+
+
+DEFAULT_PERCENTILE = 0.95
+DEFAULT_HEADROOM = 1.2
+DEFAULT_MIN_OBSERVATIONS = 50
+DEFAULT_MIN_TOKENS = 256
+
+# Sketch accuracy a: quantiles overestimate by at most (1 + a) / (1 - a)
+SKETCH_RELATIVE_ACCURACY = 0.02
+
+
+class QuantileSketch:
+    """
+    Log-bucketed streaming histogram (DDSketch-style).
+
+    Values are counted in buckets whose bounds grow geometrically by
+    gamma = (1 + a) / (1 - a); quantile() returns the UPPER bound of the
+    bucket holding the requested rank: never below the true value, at
+    most a factor gamma above it (a conservative budget). Memory is
+    O(log(max value)) buckets, independent of the number of observations.
+    """
+
+    __slots__ = ("_gamma", "_log_gamma", "_buckets", "_zeros", "count")
+
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts values >= 0")
+
+        self.count += 1
+        if value == 0:
+            self._zeros += 1
+            return
+
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1]")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if seen > rank:
+            return 0.0
+
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                return self._gamma ** index
+        return self._gamma ** max(self._buckets)
+
+
+@dataclass(frozen=True)
+class BudgetDecision:
+    max_tokens: int
+    hard_cap_tokens: int
+    observations: int
+    adaptive: bool
+
+
+class AdaptiveBudget:
+    def __init__(
+        self,
+        percentile: float = DEFAULT_PERCENTILE,
+        headroom: float = DEFAULT_HEADROOM,
+        min_observations: int = DEFAULT_MIN_OBSERVATIONS,
+        min_tokens: int = DEFAULT_MIN_TOKENS,
+        relative_accuracy: float = SKETCH_RELATIVE_ACCURACY,
+    ):
+        if not 0 < percentile <= 1:
+            raise ValueError("percentile must be in (0, 1]")
+        if headroom < 1:
+            raise ValueError("headroom must be >= 1")
+        if min_observations < 1:
+            raise ValueError("min_observations must be >= 1")
+
+        self.percentile = percentile
+        self.headroom = headroom
+        self.min_observations = min_observations
+        self.min_tokens = min_tokens
+        self.relative_accuracy = relative_accuracy
+
+        self._sketches: Dict[Tuple[PacingMode, Hashable], QuantileSketch] = {}
+        self._lock = threading.Lock()
+
+    def _sketch(self, mode: PacingMode, context_key: Hashable) -> QuantileSketch:
+        key = (mode, context_key)
+        sketch = self._sketches.get(key)
+        if sketch is None:
+            with self._lock:
+                sketch = self._sketches.setdefault(
+                    key, QuantileSketch(self.relative_accuracy)
+                )
+        return sketch
+
+    def observe(
+        self,
+        mode: PacingMode,
+        output_tokens: int,
+        hard_cap_tokens: int,
+        context_key: Hashable = None,
+        truncated: bool = False,
+    ) -> None:
+        """Record one provider-reported token_usage_output."""
+        value = hard_cap_tokens if truncated else min(output_tokens, hard_cap_tokens)
+        sketch = self._sketch(mode, context_key)
+        with self._lock:
+            sketch.add(value)
+
+    def decide(
+        self,
+        mode: PacingMode,
+        hard_cap_tokens: int,
+        context_key: Hashable = None,
+    ) -> BudgetDecision:
+        sketch = self._sketches.get((mode, context_key))
+        observations = sketch.count if sketch is not None else 0
+
+        if observations < self.min_observations:
+            return BudgetDecision(hard_cap_tokens, hard_cap_tokens, observations, False)
+
+        with self._lock:
+            estimate = sketch.quantile(self.percentile)
+
+        budget = math.ceil(estimate * self.headroom)
+        budget = min(hard_cap_tokens, max(self.min_tokens, budget))
+        return BudgetDecision(budget, hard_cap_tokens, observations, True)
@@ -1,10 +1,18 @@
-from copy import deepcopy
-from typing import Dict, Optional
+from typing import Callable, Dict, Hashable, Optional, Tuple
 
 from policy_engine.policy_engine import PolicyEngine
+from pacing_controller import tokenizer
 from pacing_controller.enums import PacingMode
 from pacing_controller.models import PacingLimits, PacingDecision
 from pacing_controller.errors import TokenLimitExceededError
+from pacing_controller.budget import AdaptiveBudget, BudgetDecision
+from pacing_controller.session_state import (
+    DEFAULT_MAX_SESSIONS,
+    DEFAULT_SESSION_TTL_SECONDS,
+    DeliberativeState,
+    SessionPacingStore,
+)
+from pacing_controller.streaming import StreamingCapGuard
 
 
 class PacingController:
@@ -25,22 +33,69 @@ class PacingController:
 
     MAX_DELIBERATIVE_TURNS = 5
 
-    def __init__(self, policy_engine: PolicyEngine):
+    def __init__(
+        self,
+        policy_engine: PolicyEngine,
+        session_ttl_seconds: float = DEFAULT_SESSION_TTL_SECONDS,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        clock: Optional[Callable[[], float]] = None,
+        adaptive_budget: Optional[AdaptiveBudget] = None,
+    ):
         """
         Initialize the pacing controller.
 
         - Load pacing limits from PolicyEngine
         - Validate all required modes
-        - Store deep copies internally
-        - Initialize deliberative state
+        - Store immutable (frozen, interned) limits internally
+        - Precompute per-mode instruction strings
+        - Initialize deliberative state:
+            session_id=None  → the controller's own state
+                               (deliberative_turn_count; single-session use)
+            session_id=<id>  → per-session state in a TTL store, so one
+                               controller can serve many sessions
+        - adaptive_budget (optional): request max_tokens from observed
+          output sizes instead of always the hard cap (never above it)
         """
         if policy_engine is None:
             raise ValueError("PolicyEngine must be provided to PacingController")
 
         self._limits_by_mode: Dict[PacingMode, PacingLimits] = {}
-        self.deliberative_turn_count: int = 0
+        self._instructions_by_mode: Dict[PacingMode, str] = {}
+        self._deliberative_instructions: Tuple[str, ...] = ()
+        self._default_state = DeliberativeState(last_seen=0.0)
+        self._sessions = SessionPacingStore(session_ttl_seconds, max_sessions, clock)
+        self.adaptive_budget = adaptive_budget
 
         self._load_limits_from_policy(policy_engine)
+        self._build_instructions()
+
+    # --------------------------------------------------------------
+    # Deliberative state
+    # --------------------------------------------------------------
+
+    @property
+    def deliberative_turn_count(self) -> int:
+        """Deliberative step count of the default (session_id=None) state."""
+        return self._default_state.turn_count
+
+    @deliberative_turn_count.setter
+    def deliberative_turn_count(self, value: int) -> None:
+        self._default_state.turn_count = value
+
+    def _state(self, session_id: Optional[str]) -> DeliberativeState:
+        if session_id is None:
+            return self._default_state
+        return self._sessions.get(session_id)
+
+    def deliberative_turns(self, session_id: Optional[str] = None) -> int:
+        return self._state(session_id).turn_count
+
+    def reset_session(self, session_id: Optional[str] = None) -> None:
+        """Forget deliberative progress (e.g. after a final step)."""
+        if session_id is None:
+            self._default_state.turn_count = 0
+        else:
+            self._sessions.discard(session_id)
 
     def _load_limits_from_policy(self, policy_engine: PolicyEngine) -> None:
         """
@@ -57,6 +112,9 @@ class PacingController:
             PacingMode.DELIBERATIVE,
         ]
 
+        # Modes with identical limits share one PacingLimits object
+        interned: Dict[Tuple[int, int, bool], PacingLimits] = {}
+
         for mode in required_modes:
             limits = policy_engine.get_pacing_limits(mode.value)
 
@@ -83,70 +141,152 @@ class PacingController:
             if not isinstance(multiturn, bool):
                 raise ValueError(f"'multiturn' must be boolean for mode: {mode.value}")
 
-            self._limits_by_mode[mode] = PacingLimits(
-                target_tokens=target_tokens,
-                hard_cap_tokens=hard_cap_tokens,
-                multiturn=multiturn,
+            key = (target_tokens, hard_cap_tokens, multiturn)
+            if key not in interned:
+                interned[key] = PacingLimits(
+                    target_tokens=target_tokens,
+                    hard_cap_tokens=hard_cap_tokens,
+                    multiturn=multiturn,
+                )
+            self._limits_by_mode[mode] = interned[key]
+
+    def _build_instructions(self) -> None:
+        """
+        Precompute every instruction string prepare_request can return.
+        DELIBERATIVE gets one per step (steps 1 .. MAX_DELIBERATIVE_TURNS + 1).
+        """
+        for mode, opening in (
+            (PacingMode.NORMAL, "Produce a concise response."),
+            (PacingMode.CAREFUL, "Produce a detailed response."),
+        ):
+            limits = self._limits_by_mode[mode]
+            self._instructions_by_mode[mode] = (
+                f"{opening}\n"
+                f"Target {limits.target_tokens} tokens.\n"
+                f"Hard cap {limits.hard_cap_tokens} tokens.\n"
+                "Never split across turns."
             )
 
+        self._deliberative_instructions = tuple(
+            self._deliberative_instruction(step)
+            for step in range(1, self.MAX_DELIBERATIVE_TURNS + 2)
+        )
+
+    def _deliberative_instruction(self, step_number: int) -> str:
+        limits = self._limits_by_mode[PacingMode.DELIBERATIVE]
+        return (
+            f"This is step {step_number} of a multi-turn process.\n"
+            f"Target {limits.target_tokens} tokens.\n"
+            f"Hard cap {limits.hard_cap_tokens} tokens.\n"
+            "If more is needed, stop and end with [CONTINUE]."
+        )
+
     def get_limits(self, mode: PacingMode) -> PacingLimits:
         """
-        Return a DEEP COPY of pacing limits for the given mode.
+        Return the pacing limits for the given mode.
 
         Guarantees:
-        - No shared mutable state
+        - No shared mutable state (PacingLimits is frozen; no copy needed)
         - No mutation leaks
         - Policy remains the single source of truth
         """
-        if mode not in self._limits_by_mode:
+        limits = self._limits_by_mode.get(mode)
+        if limits is None:
             raise ValueError(f"Unknown pacing mode requested: {mode.value}")
 
-        return deepcopy(self._limits_by_mode[mode])
-    
-    def prepare_request(self, mode: PacingMode, user_choice: Optional[str] = None) -> dict:
+        return limits
+
+    def build_mode_instruction(
+        self,
+        mode: PacingMode,
+        session_id: Optional[str] = None,
+    ) -> str:
+        """
+        Strict pacing instruction for the given mode (precomputed).
+        """
+        instruction = self._instructions_by_mode.get(mode)
+        if instruction is not None:
+            return instruction
+
+        if mode == PacingMode.DELIBERATIVE:
+            step_index = self._state(session_id).turn_count
+            if 0 <= step_index < len(self._deliberative_instructions):
+                return self._deliberative_instructions[step_index]
+            return self._deliberative_instruction(step_index + 1)
+
+        raise ValueError(f"Unsupported pacing mode: {mode}")
+
+    def prepare_request(
+        self,
+        mode: PacingMode,
+        user_choice: Optional[str] = None,
+        session_id: Optional[str] = None,
+        context_key: Hashable = None,
+    ) -> dict:
         """
         Prepare LLM request constraints for the given pacing mode.
 
         Returns a dict containing:
-        - max_tokens: hard cap enforced upstream
+        - max_tokens: hard cap enforced upstream (or the adaptive
+          budget for (mode, context_key), which never exceeds it)
         - instruction_prefix: strict instructions for the LLM
         """
-        limits = self.get_limits(mode)
-
-        if mode == PacingMode.NORMAL:
-            instruction = (
-                "Produce a concise response.\n"
-                f"Target {limits.target_tokens} tokens.\n"
-                f"Hard cap {limits.hard_cap_tokens} tokens.\n"
-                "Never split across turns."
-            )
-
-        elif mode == PacingMode.CAREFUL:
-            instruction = (
-                "Produce a detailed response.\n"
-                f"Target {limits.target_tokens} tokens.\n"
-                f"Hard cap {limits.hard_cap_tokens} tokens.\n"
-                "Never split across turns."
-            )
-
-        elif mode == PacingMode.DELIBERATIVE:
-            step_number = self.deliberative_turn_count + 1
-            instruction = (
-                f"This is step {step_number} of a multi-turn process.\n"
-                f"Target {limits.target_tokens} tokens.\n"
-                f"Hard cap {limits.hard_cap_tokens} tokens.\n"
-                "If more is needed, stop and end with [CONTINUE]."
-            )
-
-        else:
-            raise ValueError(f"Unsupported pacing mode: {mode}")
-
         return {
-            "max_tokens": limits.hard_cap_tokens,
-            "instruction_prefix": instruction,
+            "max_tokens": self.budget_for(mode, context_key).max_tokens,
+            "instruction_prefix": self.build_mode_instruction(mode, session_id),
         }
+
+    def budget_for(self, mode: PacingMode, context_key: Hashable = None) -> BudgetDecision:
+        """max_tokens to request for (mode, context_key)."""
+        hard_cap = self.get_limits(mode).hard_cap_tokens
+        if self.adaptive_budget is None:
+            return BudgetDecision(hard_cap, hard_cap, 0, False)
+        return self.adaptive_budget.decide(mode, hard_cap, context_key)
+
+    def observe_output_tokens(
+        self,
+        mode: PacingMode,
+        output_tokens: int,
+        context_key: Hashable = None,
+        requested_max_tokens: Optional[int] = None,
+    ) -> None:
+        """
+        Feed provider-reported token_usage_output to the adaptive budget
+        (no-op without one). Outputs that reached requested_max_tokens
+        count as truncated.
+        """
+        if self.adaptive_budget is None:
+            return
+
+        truncated = requested_max_tokens is not None and output_tokens >= requested_max_tokens
+        self.adaptive_budget.observe(
+            mode,
+            output_tokens,
+            self.get_limits(mode).hard_cap_tokens,
+            context_key,
+            truncated=truncated,
+        )
     
-    def evaluate_output(self, mode: PacingMode, output_text: str) -> PacingDecision:
+    def streaming_guard(
+        self,
+        mode: PacingMode,
+        on_cap: str = "STOP",
+        service=None,
+        model: Optional[str] = None,
+    ) -> StreamingCapGuard:
+        """
+        Guard enforcing this mode's hard cap WHILE the executor streams
+        (see pacing_controller.streaming). One guard per generation.
+        """
+        return StreamingCapGuard(self.get_limits(mode), on_cap, service, model)
+
+    def evaluate_output(
+        self,
+        mode: PacingMode,
+        output_text: str,
+        token_count: Optional[int] = None,
+        session_id: Optional[str] = None,
+    ) -> PacingDecision:
         """
         Evaluate the generated output against pacing rules.
 
@@ -154,10 +294,17 @@ class PacingController:
         - accepted
         - requires continuation (multi-turn)
         - rejected (hard failure)
-        """
-        from pacing_controller.tokenizer import estimate_tokens
 
-        tokens = estimate_tokens(output_text)
+        token_count: running count from an IncrementalTokenCounter fed
+        the same text (streaming callers); skips re-encoding the output.
+
+        session_id: whose deliberative step count to use and advance
+        (None → the controller's own deliberative_turn_count).
+        """
+        if token_count is not None:
+            tokens = token_count
+        else:
+            tokens = tokenizer.estimate_tokens(output_text)
         limits = self.get_limits(mode)
 
         # Hard cap enforcement (NON-RECOVERABLE)
@@ -168,7 +315,8 @@ class PacingController:
 
         # DELIBERATIVE mode (multi-turn)
         if mode == PacingMode.DELIBERATIVE:
-            if self.deliberative_turn_count >= self.MAX_DELIBERATIVE_TURNS:
+            state = self._state(session_id)
+            if state.turn_count >= self.MAX_DELIBERATIVE_TURNS:
                 return PacingDecision(
                     accepted=True,
                     must_continue_in_next_turn=False,
@@ -176,7 +324,7 @@ class PacingController:
                 )
 
             if tokens >= limits.target_tokens:
-                self.deliberative_turn_count += 1
+                state.turn_count += 1
                 return PacingDecision(
                     accepted=True,
                     must_continue_in_next_turn=True,
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Literal, Optional
 
 @dataclass(frozen=True)
 class PacingLimits:
@@ -10,4 +11,26 @@ class PacingLimits:
 class PacingDecision:
     accepted: bool
     must_continue_in_next_turn: bool
-    reason: str
\ No newline at end of file
+    reason: str
+
+@dataclass(frozen=True)
+class StreamDecision:
+    """
+    Streaming guard verdict after one chunk.
+
+    CONTINUE        keep generating
+    TARGET_REACHED  target_tokens crossed by this chunk (reported once)
+    STOP            hard cap crossed; abort generation, output rejected
+    CUT_AT_CAP      hard cap crossed; abort generation and keep the
+                    first keep_chars characters (within the cap)
+    """
+    action: Literal["CONTINUE", "TARGET_REACHED", "STOP", "CUT_AT_CAP"]
+    tokens: int
+    target_tokens: int
+    hard_cap_tokens: int
+    reason: str
+    keep_chars: Optional[int] = None
+
+    @property
+    def must_stop(self) -> bool:
+        return self.action in ("STOP", "CUT_AT_CAP")
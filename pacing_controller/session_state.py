@@ -0,0 +1,113 @@
+"""
+Per-session pacing state.
+
+One PacingController may serve many sessions. Deliberative step counts
+are therefore kept per session_id in a SessionPacingStore instead of
+on the controller:
+
+- Compact: one __slots__ object per live session
+- Kept in least-recently-seen order (OrderedDict + move_to_end), so
+  every eviction pops from the front: O(1) per evicted session
+- TTL eviction: sessions idle for longer than ttl_seconds are dropped,
+  by an amortised sweep (every SWEEP_INTERVAL lookups), never by a
+  background thread
+- Bounded: beyond max_sessions the least recently seen are dropped
+
+Concurrency: one lock guards the ordering; it is held only for a few
+dict operations per lookup. Each session only ever touches its own
+state object, so turns of different sessions never share a counter.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+DEFAULT_SESSION_TTL_SECONDS = 3600.0
+DEFAULT_MAX_SESSIONS = 100_000
+
+# Lookups between two amortised sweeps
+SWEEP_INTERVAL = 1024
+
+
+class DeliberativeState:
+    __slots__ = ("turn_count", "last_seen")
+
+    def __init__(self, last_seen: float):
+        self.turn_count = 0
+        self.last_seen = last_seen
+
+
+class SessionPacingStore:
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_SESSION_TTL_SECONDS,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+        if max_sessions <= 0:
+            raise ValueError("max_sessions must be > 0")
+
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._clock = clock or time.monotonic
+        # Least recently seen first
+        self._states: "OrderedDict[str, DeliberativeState]" = OrderedDict()
+        self._lookups = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._states
+
+    def get(self, session_id: str) -> DeliberativeState:
+        """State for session_id, created on first use; refreshes its TTL."""
+        now = self._clock()
+
+        with self._lock:
+            state = self._states.get(session_id)
+            if state is None or now - state.last_seen > self.ttl_seconds:
+                state = DeliberativeState(now)
+                self._states[session_id] = state
+            state.last_seen = now
+            self._states.move_to_end(session_id)
+
+            # Bounded: drop the least recently seen
+            while len(self._states) > self.max_sessions:
+                self._states.popitem(last=False)
+
+            self._lookups += 1
+            if self._lookups % SWEEP_INTERVAL == 0:
+                self._evict_expired(now)
+        return state
+
+    def discard(self, session_id: str) -> None:
+        with self._lock:
+            self._states.pop(session_id, None)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Drop expired sessions (and the oldest beyond max_sessions)."""
+        with self._lock:
+            now = self._clock() if now is None else now
+            evicted = self._evict_expired(now)
+            while len(self._states) > self.max_sessions:
+                self._states.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def _evict_expired(self, now: float) -> int:
+        # Oldest first, so expired sessions form a prefix
+        cutoff = now - self.ttl_seconds
+        evicted = 0
+        while self._states:
+            state = next(iter(self._states.values()))
+            if state.last_seen >= cutoff:
+                break
+            self._states.popitem(last=False)
+            evicted += 1
+        return evicted
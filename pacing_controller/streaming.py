@@ -0,0 +1,116 @@
+"""
+Mid-generation hard-cap enforcement.
+
+evaluate_output can only reject an over-cap response after it has been
+generated and paid for. A StreamingCapGuard watches the running token
+count while the executor streams, and says STOP as soon as the hard cap
+is crossed, so a runaway output costs at most one chunk past the cap.
+
+on_cap decides what happens at the cap:
+- "STOP" (default): abort, and the response is rejected, exactly as
+  evaluate_output would have rejected it (TokenLimitExceededError)
+- "CUT":  abort, and keep the longest prefix within the cap; the
+  CUT_AT_CAP decision records where the response was cut
+
+Counting is incremental (IncrementalTokenCounter): each chunk costs
+O(chunk), not O(response).
+"""
+
+from typing import Literal, Optional
+
+from pacing_controller.models import PacingLimits, StreamDecision
+from tokenizer_service.incremental import IncrementalTokenCounter
+from tokenizer_service.service import TokenizerService
+
+
+class StreamingCapGuard:
+    def __init__(
+        self,
+        limits: PacingLimits,
+        on_cap: Literal["STOP", "CUT"] = "STOP",
+        service: Optional[TokenizerService] = None,
+        model: Optional[str] = None,
+    ):
+        if on_cap not in ("STOP", "CUT"):
+            raise ValueError(f"on_cap must be 'STOP' or 'CUT', got {on_cap!r}")
+
+        self.limits = limits
+        self.on_cap = on_cap
+        self.counter = IncrementalTokenCounter(service, model)
+        self._target_reported = False
+        self._final: Optional[StreamDecision] = None
+
+    @property
+    def tokens(self) -> int:
+        return self.counter.tokens
+
+    @property
+    def stopped(self) -> bool:
+        return self._final is not None
+
+    @property
+    def final_decision(self) -> Optional[StreamDecision]:
+        """The STOP / CUT_AT_CAP decision, once the cap has been crossed."""
+        return self._final
+
+    def observe(self, delta: str) -> StreamDecision:
+        """Account for one streamed chunk and decide whether to go on."""
+        if self._final is not None:
+            return self._final
+
+        chars_before = self.counter.chars
+        tokens = self.counter.tokens_with(delta)
+
+        if tokens > self.limits.hard_cap_tokens:
+            self._final = self._cap_decision(delta, chars_before, tokens)
+            return self._final
+
+        self.counter.append(delta)
+
+        if not self._target_reported and tokens >= self.limits.target_tokens:
+            self._target_reported = True
+            return self._decision("TARGET_REACHED", tokens, "Reached target tokens")
+
+        return self._decision("CONTINUE", tokens, "Within target")
+
+    def _cap_decision(self, delta: str, chars_before: int, tokens: int) -> StreamDecision:
+        if self.on_cap == "STOP":
+            return self._decision(
+                "STOP",
+                tokens,
+                f"Output exceeds hard cap: {tokens} > {self.limits.hard_cap_tokens}",
+            )
+
+        # Longest prefix of the chunk that stays within the cap
+        low, high = 0, len(delta) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.counter.tokens_with(delta[:middle]) <= self.limits.hard_cap_tokens:
+                low = middle
+            else:
+                high = middle - 1
+
+        kept = delta[:low]
+        self.counter.append(kept)
+        return self._decision(
+            "CUT_AT_CAP",
+            self.counter.tokens,
+            f"Output cut at hard cap {self.limits.hard_cap_tokens}",
+            keep_chars=chars_before + len(kept),
+        )
+
+    def _decision(
+        self,
+        action: str,
+        tokens: int,
+        reason: str,
+        keep_chars: Optional[int] = None,
+    ) -> StreamDecision:
+        return StreamDecision(
+            action=action,
+            tokens=tokens,
+            target_tokens=self.limits.target_tokens,
+            hard_cap_tokens=self.limits.hard_cap_tokens,
+            reason=reason,
+            keep_chars=keep_chars,
+        )
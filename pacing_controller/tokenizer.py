@@ -1,30 +1,32 @@
-try:
-    import tiktoken
-    _ENCODER = tiktoken.get_encoding("cl100k_base")
-except Exception:
-    _ENCODER = None
+from typing import Optional
 
+from tokenizer_service.service import LimitCheck, count_tokens, default_service
 
-def estimate_tokens(text: str) -> int:
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
     """
     Estimate the number of tokens in a text string.
 
-    Priority:
-    1. Use real tokenizer (tiktoken) if available
-    2. Fallback to conservative estimator
+    Delegates to the shared tokenizer service:
+    1. Use real tokenizer (tiktoken) if available, loaded on first use
+    2. Fallback to the upper bound of the model's ApproximateTokenizer
+       (byte-class estimate, capped at the UTF-8 byte count)
 
     This function must:
     - Be deterministic
     - Never dangerously underestimate
     - Never rely on heuristics or randomness
     """
-    if not text:
-        return 0
+    return count_tokens(text, model)
+
 
-    # Preferred: real tokenizer
-    if _ENCODER is not None:
-        return len(_ENCODER.encode(text))
 
-    # Fallback: conservative approximation
-    # Rule: ~4 characters per token + buffer
-    return max(1, len(text) // 4 + 1)
\ No newline at end of file
+def check_limit(text: str, limit: int, model: Optional[str] = None) -> LimitCheck:
+    """
+    Pre-flight "does this fit in `limit` tokens?".
+
+    Decided from approximate bounds when the text is clearly within or
+    clearly over (empirical bounds once calibrated, the UTF-8 byte
+    ceiling before); exact BPE runs only near the limit.
+    """
+    return default_service().check_limit(text, limit, model)
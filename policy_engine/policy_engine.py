@@ -12,6 +12,27 @@ class PolicyEngine:
         policy = load_policy(policy_path)
         validate_policy(policy)
         self._policy = policy
+        self._policy_path = policy_path
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every successful reload()."""
+        return self._generation
+
+    def reload(self) -> None:
+        """
+        Re-load and re-validate the policy file.
+        FAIL FAST: on any error the previous policy stays in effect.
+        """
+        policy = load_policy(self._policy_path)
+        validate_policy(policy)
+        self._policy = policy
+        self._generation += 1
+
+    def get_version(self) -> str:
+        """Get policy version string."""
+        return self._policy["version"]
 
     def get_error_message(self, error_code: ErrorCode) -> str:
         """Get error message for a given error code."""
@@ -78,6 +99,11 @@ class PolicyEngine:
             "multiturn": limits.get("multiturn", False),
         }
 
+    def get_uncertainty_mapping(self) -> dict:
+        """Get uncertainty matrix mapping (allyes / oneno / twoormoreno) from policy."""
+        mapping = self._policy.get("uncertainty", {}).get("mapping", {})
+        return copy.deepcopy(mapping)
+
     def get_user_choice_options(self) -> dict:
         """Get user choice options (A, B, C) from policy."""
         options = self._policy.get("userchoice", {}).get("options", {})
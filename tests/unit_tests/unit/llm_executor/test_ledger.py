@@ -0,0 +1,217 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from llm_executor.adapters.base import BaseLLMAdapter
+from llm_executor.executor import LLMExecutor
+from llm_executor.ledger import TokenLedger, UsageTotals
+from llm_executor.models import LLMRequest, LLMResponse
+from pacing_controller.enums import PacingMode
+
+
+class Clock:
+    def __init__(self):
+        self.now = datetime(2024, 1, 1, 12)
+
+    def __call__(self):
+        return self.now
+
+
+class MockAdapter(BaseLLMAdapter):
+    def generate(self, prompt, max_tokens):
+        return LLMResponse(
+            text="ok",
+            token_usage_input=10,
+            token_usage_output=20,
+            model_name="test-model",
+            raw_provider_response={},
+        )
+
+
+def make_request(mode=PacingMode.NORMAL):
+    return LLMRequest(
+        system_instruction="Do the task.",
+        user_content="User input here.",
+        pacing_mode=mode,
+        token_limit=100,
+        forbidden_patterns=[],
+        claim_label_required=False,
+    )
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+# ---------------------------------------------------------------------
+# AGGREGATION
+# ---------------------------------------------------------------------
+
+def test_executor_records_usage_per_session_mode_and_route(clock):
+    ledger = TokenLedger(clock=clock)
+    executor = LLMExecutor(MockAdapter(), ledger=ledger)
+
+    executor.execute(make_request(), session_id="s1", route="normal")
+    executor.execute(make_request(PacingMode.CAREFUL), session_id="s1", route="normal")
+    executor.execute(make_request(), session_id="s2", route="grounding")
+
+    assert ledger.session_usage("s1") == UsageTotals(2, 20, 40)
+    assert ledger.mode_usage(PacingMode.NORMAL) == UsageTotals(2, 20, 40)
+    assert ledger.route_usage("grounding") == UsageTotals(1, 10, 20)
+    assert ledger.usage("s1", PacingMode.CAREFUL, "normal").total_tokens == 30
+
+
+def test_executor_without_ledger_is_unchanged():
+    response = LLMExecutor(MockAdapter()).execute(make_request())
+    assert response.token_usage_output == 20
+
+
+def test_usage_is_per_day(clock):
+    ledger = TokenLedger(clock=clock)
+    ledger.record("s1", PacingMode.NORMAL, 10, 20)
+    clock.now += timedelta(days=1)
+
+    assert ledger.session_usage("s1") == UsageTotals()
+    assert ledger.session_usage("s1", day="2024-01-01").requests == 1
+
+
+# ---------------------------------------------------------------------
+# BUDGET ENFORCEMENT
+# ---------------------------------------------------------------------
+
+def test_careful_denied_once_daily_budget_is_used(clock):
+    ledger = TokenLedger(daily_session_budget=50, clock=clock)
+
+    ledger.record("s1", PacingMode.NORMAL, 10, 20)
+    assert ledger.allows_mode("s1", PacingMode.CAREFUL)
+    assert ledger.remaining_daily_budget("s1") == 20
+
+    ledger.record("s1", PacingMode.NORMAL, 10, 20)
+    assert not ledger.allows_mode("s1", PacingMode.CAREFUL)
+    assert ledger.allows_mode("s1", PacingMode.NORMAL)
+    assert ledger.allows_mode("s2", PacingMode.CAREFUL)
+
+    clock.now += timedelta(days=1)
+    assert ledger.allows_mode("s1", PacingMode.CAREFUL)
+
+
+def test_no_budget_allows_everything(clock):
+    ledger = TokenLedger(clock=clock)
+    ledger.record("s1", PacingMode.CAREFUL, 10**6, 10**6)
+
+    assert ledger.allows_mode("s1", PacingMode.CAREFUL)
+    assert ledger.remaining_daily_budget("s1") is None
+
+
+# ---------------------------------------------------------------------
+# SQLITE FLUSH
+# ---------------------------------------------------------------------
+
+def test_flush_every_n_records(tmp_path, clock):
+    ledger = TokenLedger(tmp_path / "ledger.db", flush_every=2, clock=clock)
+
+    ledger.record("s1", PacingMode.NORMAL, 10, 20)
+    assert ledger.flush() == 1
+    ledger.record("s1", PacingMode.NORMAL, 10, 20)
+    ledger.record("s1", PacingMode.NORMAL, 10, 20)  # auto flush
+
+    assert ledger.flush() == 0
+
+
+def test_totals_survive_restart(tmp_path, clock):
+    path = tmp_path / "ledger.db"
+    first = TokenLedger(path, clock=clock)
+    first.record("s1", PacingMode.NORMAL, 10, 20)
+    first.record("s1", PacingMode.NORMAL, 10, 20)
+    first.close()
+
+    second = TokenLedger(path, clock=clock)
+    second.record("s1", PacingMode.NORMAL, 1, 2)
+    second.close()
+
+    third = TokenLedger(path, clock=clock)
+    assert third.session_usage("s1") == UsageTotals(3, 21, 42)
+
+
+def test_failed_flush_keeps_deltas_for_retry(tmp_path, clock, monkeypatch):
+    path = tmp_path / "ledger.db"
+    ledger = TokenLedger(path, clock=clock)
+    ledger.record("s1", PacingMode.NORMAL, 10, 20)
+
+    def fail(rows):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ledger, "_upsert", fail)
+    with pytest.raises(OSError):
+        ledger.flush()
+    monkeypatch.undo()
+
+    ledger.record("s1", PacingMode.NORMAL, 1, 2)
+    assert ledger.flush() == 1
+
+    assert TokenLedger(path, clock=clock).session_usage("s1") == UsageTotals(2, 11, 22)
+
+
+def test_failed_auto_flush_does_not_fail_execute(tmp_path, clock, monkeypatch):
+    path = tmp_path / "ledger.db"
+    ledger = TokenLedger(path, flush_every=1, clock=clock)
+    executor = LLMExecutor(MockAdapter(), ledger=ledger)
+
+    def fail(rows):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ledger, "_upsert", fail)
+    response = executor.execute(make_request(), session_id="s1")
+    assert response.text == "ok"
+    assert ledger.session_usage("s1") == UsageTotals(1, 10, 20)
+
+    # An explicit flush still surfaces the error
+    with pytest.raises(OSError):
+        ledger.flush()
+    monkeypatch.undo()
+
+    assert ledger.flush() == 1
+    assert TokenLedger(path, clock=clock).session_usage("s1") == UsageTotals(1, 10, 20)
+
+
+def test_past_days_are_dropped_from_memory(tmp_path, clock):
+    path = tmp_path / "ledger.db"
+    ledger = TokenLedger(path, clock=clock)
+    ledger.record("s1", PacingMode.NORMAL, 10, 20)
+    clock.now += timedelta(days=1)
+    ledger.record("s1", PacingMode.NORMAL, 1, 2)
+
+    assert all(key[0] == "2024-01-02" for key in ledger._counters)
+    # Reloaded from SQLite (including unflushed deltas) when queried
+    assert ledger.session_usage("s1", day="2024-01-01") == UsageTotals(1, 10, 20)
+    ledger.flush()
+    assert ledger.session_usage("s1", day="2024-01-01") == UsageTotals(1, 10, 20)
+
+
+def test_concurrent_records_are_all_persisted(tmp_path, clock):
+    path = tmp_path / "ledger.db"
+    ledger = TokenLedger(path, flush_every=7, clock=clock)
+
+    def worker():
+        for _ in range(50):
+            ledger.record("s1", PacingMode.DELIBERATIVE, 1, 2)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ledger.close()
+
+    assert ledger.session_usage("s1") == UsageTotals(200, 200, 400)
+    assert TokenLedger(path, clock=clock).session_usage("s1") == UsageTotals(200, 200, 400)
+
+
+def test_in_memory_ledger_flush_is_noop(clock):
+    ledger = TokenLedger(clock=clock)
+    ledger.record("s1", PacingMode.NORMAL, 10, 20)
+
+    assert ledger.flush() == 0
+    assert ledger.session_usage("s1").requests == 1
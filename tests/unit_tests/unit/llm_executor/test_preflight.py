@@ -0,0 +1,165 @@
+import threading
+
+import pytest
+
+from llm_executor.adapters.base import BaseLLMAdapter
+from llm_executor.errors import PromptBudgetExceededError
+from llm_executor.executor import LLMExecutor
+from llm_executor.models import LLMRequest, LLMResponse
+from llm_executor.preflight import preflight
+from llm_executor.prompt_builder import build_prompt
+from pacing_controller.enums import PacingMode
+from tokenizer_service.service import TokenizerService
+
+
+class WordEncoder:
+    def encode(self, text):
+        return text.split()
+
+
+@pytest.fixture
+def service():
+    service = TokenizerService(default_model="words")
+    service.register_encoder("words", WordEncoder())
+    return service
+
+
+MEMORY = "\n".join(f"memory entry {i} about python retries" for i in range(20))
+
+
+def make_request(context_block=MEMORY, user_content="How do I retry?"):
+    return LLMRequest(
+        system_instruction="Explain.",
+        user_content=user_content,
+        pacing_mode=PacingMode.NORMAL,
+        token_limit=100,
+        forbidden_patterns=[],
+        claim_label_required=False,
+        context_block=context_block,
+    )
+
+
+def words(request):
+    return len(build_prompt(request).split())
+
+
+class RecordingAdapter(BaseLLMAdapter):
+    def __init__(self):
+        self.prompts = []
+
+    def generate(self, prompt, max_tokens):
+        self.prompts.append(prompt)
+        return LLMResponse("ok", 1, 1, "test-model", {})
+
+
+# ---------------------------------------------------------------------
+# PROMPT STRUCTURE
+# ---------------------------------------------------------------------
+
+def test_context_block_rendered_before_task():
+    prompt = build_prompt(make_request())
+
+    assert prompt.find("Relevant context (from memory):") < prompt.find("Task:")
+    assert "Relevant context" not in build_prompt(make_request(context_block=""))
+
+
+# ---------------------------------------------------------------------
+# PRE-FLIGHT
+# ---------------------------------------------------------------------
+
+def test_prompt_within_budget_is_untouched(service):
+    request = make_request()
+
+    sent, report = preflight(request, words(request) + 100, service)
+
+    assert sent is request
+    assert not report.trimmed
+    assert report.prompt_tokens <= report.prompt_budget
+
+
+def test_memory_context_trimmed_to_longest_fitting_prefix(service):
+    request = make_request()
+    full = words(request)
+    window = full - 12 + 100  # two 6-word lines too many
+
+    sent, report = preflight(request, window, service)
+
+    assert report.trimmed
+    assert report.context_lines_kept == 18
+    assert report.context_lines_dropped == 2
+    assert sent.context_block == "\n".join(MEMORY.splitlines()[:18])
+    assert words(sent) <= report.prompt_budget
+    assert sent.user_content == request.user_content
+
+
+def test_trimming_is_deterministic(service):
+    request = make_request()
+    window = words(request) - 40 + 100
+
+    first = preflight(request, window, service)
+    second = preflight(request, window, service)
+
+    assert first == second
+
+
+def test_prompt_too_large_without_memory_raises(service):
+    request = make_request(user_content="word " * 500)
+
+    with pytest.raises(PromptBudgetExceededError):
+        preflight(request, 300, service)
+
+
+# ---------------------------------------------------------------------
+# EXECUTOR INTEGRATION
+# ---------------------------------------------------------------------
+
+def test_executor_sends_trimmed_prompt(service):
+    adapter = RecordingAdapter()
+    request = make_request()
+    executor = LLMExecutor(
+        adapter,
+        context_window_tokens=words(request) - 30 + 100,
+        tokenizer_service=service,
+    )
+
+    executor.execute(request)
+
+    assert executor.last_preflight.trimmed
+    assert len(adapter.prompts[0].split()) <= executor.last_preflight.prompt_budget
+
+
+def test_executor_does_not_call_provider_when_prompt_cannot_fit(service):
+    adapter = RecordingAdapter()
+    executor = LLMExecutor(adapter, context_window_tokens=50, tokenizer_service=service)
+
+    with pytest.raises(PromptBudgetExceededError):
+        executor.execute(make_request())
+
+    assert adapter.prompts == []
+
+
+def test_executor_without_window_skips_preflight():
+    executor = LLMExecutor(RecordingAdapter())
+    executor.execute(make_request())
+
+    assert executor.last_preflight is None
+
+
+def test_preflight_report_is_per_thread(service):
+    adapter = RecordingAdapter()
+    request = make_request()
+    executor = LLMExecutor(
+        adapter,
+        context_window_tokens=words(request) - 30 + 100,
+        tokenizer_service=service,
+    )
+
+    executor.execute(request)
+    background = threading.Thread(
+        target=executor.execute, args=(make_request(context_block=""),)
+    )
+    background.start()
+    background.join()
+
+    # The background call did not replace this thread's report
+    assert executor.last_preflight.trimmed
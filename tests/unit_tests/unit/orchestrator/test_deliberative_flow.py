@@ -6,6 +6,7 @@ from orchestrator.models import SessionState
 from memory_manager.enums import MemoryQueryResult
 from uncertainty_engine.enums import UncertaintyLevel
 from pacing_controller.enums import PacingMode
+from pacing_controller.budget import BudgetDecision
 
 
 # ---------------------------------------------------------------------
@@ -50,26 +51,37 @@ class DummyPacingLimits:
 
 
 class ContinueDecision:
-    must_continue = True
+    must_continue_in_next_turn = True
 
 
 class StopDecision:
-    must_continue = False
+    must_continue_in_next_turn = False
 
 
 class DummyPacingController:
     def __init__(self):
         self.call_count = 0
+        self.session_ids = []
 
     def get_limits(self, mode):
         return DummyPacingLimits()
 
-    def build_mode_instruction(self, mode):
+    def budget_for(self, mode, context_key=None):
+        hard_cap = DummyPacingLimits.hard_cap_tokens
+        return BudgetDecision(hard_cap, hard_cap, 0, False)
+
+    def observe_output_tokens(
+        self, mode, output_tokens, context_key=None, requested_max_tokens=None
+    ):
+        pass
+
+    def build_mode_instruction(self, mode, session_id=None):
         return "DELIBERATIVE instruction"
 
-    def evaluate_output(self, mode, text):
+    def evaluate_output(self, mode, text, session_id=None):
         # First call → continue, second → stop
         self.call_count += 1
+        self.session_ids.append(session_id)
         return ContinueDecision() if self.call_count == 1 else StopDecision()
 
 
@@ -110,17 +122,18 @@ class DummyOutputValidator:
 def test_deliberative_continuation_and_state_increment():
     """
     DELIBERATIVE:
-    - First turn → must_continue
+    - First turn → must_continue_in_next_turn
     - Structured continuation object returned
-    - deliberative_turn_count increments
+    - the step is counted by the pacing controller, for this session
     """
 
     session = SessionState(session_id="delib-1")
+    pacing = DummyPacingController()
 
     orchestrator = ConversationOrchestrator(
         memory_manager=DummyMemoryManager(),
         uncertainty_engine=DummyUncertaintyEngine(),
-        pacing_controller=DummyPacingController(),
+        pacing_controller=pacing,
         llm_executor=DummyLLMExecutor(),
         output_validator=DummyOutputValidator(),
         policy_engine=DummyPolicyEngine(),
@@ -132,20 +145,19 @@ def test_deliberative_continuation_and_state_increment():
     assert result["type"] == "DELIBERATIVE_CONTINUE"
     assert result["turn_index"] == 1
 
-    assert session.deliberative_turn_count == 1
+    assert pacing.session_ids == ["delib-1"]
+    assert session.deliberative_turn_count == 0
     assert session.mode == PacingMode.DELIBERATIVE
 
 
 def test_deliberative_stops_and_resets_counter():
     """
     DELIBERATIVE:
-    - Second turn → must_continue = False
+    - Second turn → must_continue_in_next_turn = False
     - Raw text returned
-    - deliberative_turn_count reset to 0
     """
 
     session = SessionState(session_id="delib-2")
-    session.deliberative_turn_count = 1  # Simulate prior continuation
 
     pacing = DummyPacingController()
     pacing.call_count = 1  # Force stop decision on first call here
@@ -164,4 +176,4 @@ def test_deliberative_stops_and_resets_counter():
     assert isinstance(result, str)
     assert result == "Partial reasoning"
 
-    assert session.deliberative_turn_count == 0
\ No newline at end of file
+    assert pacing.session_ids == ["delib-2"]
\ No newline at end of file
@@ -6,6 +6,9 @@ from orchestrator.models import SessionState
 from memory_manager.enums import MemoryQueryResult
 from uncertainty_engine.enums import UncertaintyLevel
 from pacing_controller.enums import PacingMode
+from pacing_controller.budget import AdaptiveBudget, BudgetDecision
+from pacing_controller.controller import PacingController
+from policy_engine.policy_engine import PolicyEngine
 
 
 # ---------------------------------------------------------------------
@@ -51,7 +54,7 @@ class DummyPacingLimits:
 
 
 class DummyPacingDecision:
-    must_continue = False
+    must_continue_in_next_turn = False
 
 
 class DummyPacingController:
@@ -59,10 +62,19 @@ class DummyPacingController:
         assert mode == PacingMode.NORMAL
         return DummyPacingLimits()
 
-    def build_mode_instruction(self, mode):
+    def budget_for(self, mode, context_key=None):
+        hard_cap = DummyPacingLimits.hard_cap_tokens
+        return BudgetDecision(hard_cap, hard_cap, 0, False)
+
+    def observe_output_tokens(
+        self, mode, output_tokens, context_key=None, requested_max_tokens=None
+    ):
+        pass
+
+    def build_mode_instruction(self, mode, session_id=None):
         return "NORMAL instruction"
 
-    def evaluate_output(self, mode, text):
+    def evaluate_output(self, mode, text, session_id=None):
         return DummyPacingDecision()
 
 
@@ -139,4 +151,92 @@ def test_normal_execution_returns_raw_text_and_mutates_state():
     assert session.turn_index == 1
     assert session.mode == PacingMode.NORMAL
     assert session.user_choice is None
-    assert session.deliberative_turn_count == 0
\ No newline at end of file
+    assert session.deliberative_turn_count == 0
+
+def test_adaptive_budget_sets_requested_max_tokens():
+    """
+    With an AdaptiveBudget on the pacing controller:
+    - the hard cap is requested until enough outputs are observed
+    - then max_tokens follows the observed output sizes
+    - every provider output is fed back to the budget
+    """
+
+    class RecordingLLMExecutor:
+        def __init__(self):
+            self.token_limits = []
+
+        def execute(self, **kwargs):
+            self.token_limits.append(kwargs["token_limit"])
+            return DummyLLMResult()
+
+    pacing = PacingController(
+        PolicyEngine("policy_v1.3.2.yaml"),
+        adaptive_budget=AdaptiveBudget(min_observations=3),
+    )
+    llm = RecordingLLMExecutor()
+    orchestrator = ConversationOrchestrator(
+        memory_manager=DummyMemoryManager(),
+        uncertainty_engine=DummyUncertaintyEngine(),
+        pacing_controller=pacing,
+        llm_executor=llm,
+        output_validator=DummyOutputValidator(),
+        policy_engine=DummyPolicyEngine(),
+    )
+    session = SessionState(session_id="normal-2", mode=PacingMode.NORMAL)
+
+    for _ in range(4):
+        orchestrator.execute_normal(session, "Clear question", UncertaintyLevel.LEVEL_1_2)
+
+    hard_cap = pacing.get_limits(PacingMode.NORMAL).hard_cap_tokens
+    assert llm.token_limits[:3] == [hard_cap] * 3
+    assert llm.token_limits[3] == pacing.budget_for(PacingMode.NORMAL, "context").max_tokens
+    assert llm.token_limits[3] < hard_cap
+
+
+def test_output_at_budget_is_regenerated_at_hard_cap():
+    """
+    An output that reaches a budget below the hard cap may be cut off:
+    - the call is repeated once with max_tokens = hard cap
+    - the regenerated response is the one returned
+    - budgets are kept per (mode, uncertainty context)
+    """
+
+    class TruncatingLLMExecutor:
+        def __init__(self):
+            self.token_limits = []
+
+        def execute(self, **kwargs):
+            token_limit = kwargs["token_limit"]
+            self.token_limits.append(token_limit)
+            result = DummyLLMResult()
+            if token_limit < hard_cap:
+                result.text = "Cut off"
+                result.token_usage_output = token_limit
+            return result
+
+    pacing = PacingController(
+        PolicyEngine("policy_v1.3.2.yaml"),
+        adaptive_budget=AdaptiveBudget(min_observations=3),
+    )
+    hard_cap = pacing.get_limits(PacingMode.NORMAL).hard_cap_tokens
+    llm = TruncatingLLMExecutor()
+    orchestrator = ConversationOrchestrator(
+        memory_manager=DummyMemoryManager(),
+        uncertainty_engine=DummyUncertaintyEngine(),
+        pacing_controller=pacing,
+        llm_executor=llm,
+        output_validator=DummyOutputValidator(),
+        policy_engine=DummyPolicyEngine(),
+    )
+    session = SessionState(session_id="normal-3", mode=PacingMode.NORMAL)
+
+    for _ in range(3):
+        orchestrator.execute_normal(session, "Clear question", UncertaintyLevel.LEVEL_1_2)
+    budget = pacing.budget_for(PacingMode.NORMAL, "context").max_tokens
+    assert budget < hard_cap
+    assert pacing.budget_for(PacingMode.NORMAL, "other").max_tokens == hard_cap
+
+    result = orchestrator.execute_normal(session, "Clear question", UncertaintyLevel.LEVEL_1_2)
+
+    assert result == "Final answer text"
+    assert llm.token_limits[3:] == [budget, hard_cap]
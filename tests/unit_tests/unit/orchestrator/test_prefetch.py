@@ -0,0 +1,350 @@
+import shutil
+import threading
+
+import pytest
+
+from orchestrator.orchestrator import ConversationOrchestrator
+from orchestrator.models import SessionState
+from orchestrator.prefetch import CONTINUE_INPUT, ContinuationPrefetcher
+
+from memory_manager.enums import MemoryQueryResult
+from uncertainty_engine.enums import UncertaintyLevel
+from pacing_controller.enums import PacingMode
+from pacing_controller.controller import PacingController
+from pacing_controller.budget import AdaptiveBudget, BudgetDecision
+from policy_engine.policy_engine import PolicyEngine
+
+
+# ---------------------------------------------------------------------
+# DUMMY DEPENDENCIES
+# ---------------------------------------------------------------------
+
+class DummyMemoryManager:
+    write_attempted = False
+    confirmation_requested = False
+    last_scope = None
+
+    def __init__(self):
+        self.memory = "Memory context"
+        self.query_result = MemoryQueryResult.PRESENT
+
+    def query_memory(self, user_input: str):
+        return self.query_result
+
+    def render_relevant_memory(self):
+        return self.memory
+
+
+class DummyUncertaintyEngine:
+    last_context = "ctx"
+    last_intent_summary = "intent"
+    assumptions_required = False
+
+
+class DummyPolicyEngine:
+    def __init__(self):
+        self.generation = 1
+
+    def get_version(self):
+        return "1.3.2"
+
+    def get_forbidden_patterns(self):
+        return []
+
+    def get_grounding_questions(self, reason: str):
+        return ["Q1", "Q2", "Q3", "Q4", "Q5"]
+
+    def get_intake_questions(self):
+        return ["Q1", "Q2", "Q3", "Q4", "Q5"]
+
+
+class DummyPacingLimits:
+    target_tokens = 100
+    hard_cap_tokens = 200
+
+
+class ContinueDecision:
+    must_continue_in_next_turn = True
+
+
+class DummyPacingController:
+    def get_limits(self, mode):
+        return DummyPacingLimits()
+
+    def budget_for(self, mode, context_key=None):
+        hard_cap = DummyPacingLimits.hard_cap_tokens
+        return BudgetDecision(hard_cap, hard_cap, 0, False)
+
+    def observe_output_tokens(
+        self, mode, output_tokens, context_key=None, requested_max_tokens=None
+    ):
+        pass
+
+    def build_mode_instruction(self, mode, session_id=None):
+        return "DELIBERATIVE instruction"
+
+    def evaluate_output(self, mode, text, session_id=None):
+        return ContinueDecision()
+
+
+class DummyLLMResult:
+    def __init__(self, text):
+        self.text = text
+        self.token_usage_output = 7
+        self.raw_provider_response = {}
+
+
+class RecordingLLMExecutor:
+    """Thread-safe; the text identifies the call that produced it."""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def execute(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+        return DummyLLMResult(f"step {kwargs['turn_index']}: {kwargs['user_input']}")
+
+
+class DummyOutputValidator:
+    def validate(self, text, context):
+        class Result:
+            status = "ACCEPTED"
+        return Result()
+
+    def scan_confidence_levels(self, text: str) -> bool:
+        return False
+
+
+@pytest.fixture
+def step_policy_path(tmp_path):
+    # Policy copy with a DELIBERATIVE target below its hard cap, so a
+    # long step continues
+    source = open("policy_v1.3.2.yaml", encoding="utf-8").read()
+    deliberative = "deliberative:\n      targettokens: 1200"
+    assert deliberative in source
+    path = tmp_path / "policy.yaml"
+    path.write_text(
+        source.replace(deliberative, "deliberative:\n      targettokens: 50"),
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+@pytest.fixture
+def step_pacing(step_policy_path):
+    return PacingController(PolicyEngine(step_policy_path))
+
+
+class LongStepLLMExecutor(RecordingLLMExecutor):
+    def execute(self, **kwargs):
+        result = super().execute(**kwargs)
+        result.text += " reasoning" * 100
+        return result
+
+
+def make_orchestrator(prefetch=True, pacing_controller=None, llm=None):
+    llm = llm or RecordingLLMExecutor()
+    orchestrator = ConversationOrchestrator(
+        memory_manager=DummyMemoryManager(),
+        uncertainty_engine=DummyUncertaintyEngine(),
+        pacing_controller=pacing_controller or DummyPacingController(),
+        llm_executor=llm,
+        output_validator=DummyOutputValidator(),
+        policy_engine=DummyPolicyEngine(),
+        prefetch_continuations=prefetch,
+    )
+    return orchestrator, llm
+
+
+def run_turn(orchestrator, session, user_input):
+    session.turn_index += 1
+    return orchestrator.execute_normal(session, user_input, UncertaintyLevel.LEVEL_1_2)
+
+
+def settle(orchestrator):
+    # Wait for in-flight prefetches so call counts are stable
+    orchestrator.close()
+
+
+@pytest.fixture
+def session():
+    return SessionState(session_id="prefetch-1", mode=PacingMode.DELIBERATIVE)
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+
+def test_continue_uses_prefetched_step(session):
+    orchestrator, llm = make_orchestrator()
+
+    first = run_turn(orchestrator, session, "Start reasoning")
+    assert first["type"] == "DELIBERATIVE_CONTINUE"
+    assert orchestrator.prefetcher.has_pending(session.session_id)
+
+    run_turn(orchestrator, session, CONTINUE_INPUT)
+    settle(orchestrator)
+
+    # Turn 2 was generated once, by the prefetch
+    turn_two = [call for call in llm.calls if call["turn_index"] == 2]
+    assert len(turn_two) == 1
+    assert turn_two[0]["user_input"] == CONTINUE_INPUT
+    assert turn_two[0]["context_block"] == "Memory context"
+
+    stats = orchestrator.prefetcher.stats
+    assert (stats.started, stats.hits) == (2, 1)
+
+
+def test_prefetch_matches_real_step_instructions(session, step_pacing):
+    orchestrator, llm = make_orchestrator(
+        pacing_controller=step_pacing, llm=LongStepLLMExecutor()
+    )
+
+    run_turn(orchestrator, session, "Start reasoning")
+    for _ in range(2):
+        result = run_turn(orchestrator, session, CONTINUE_INPUT)
+        assert result["type"] == "DELIBERATIVE_CONTINUE"
+    settle(orchestrator)
+
+    stats = orchestrator.prefetcher.stats
+    assert (stats.started, stats.hits, stats.discarded) == (3, 2, 1)
+
+    # Each step was generated once, with its own step instruction
+    # (the turn-4 prefetch may have been cancelled by close)
+    steps = [call for call in llm.calls if call["turn_index"] <= 3]
+    assert [call["turn_index"] for call in steps] == [1, 2, 3]
+    assert [call["instruction"].splitlines()[0] for call in steps] == [
+        "This is step 1 of a multi-turn process.",
+        "This is step 2 of a multi-turn process.",
+        "This is step 3 of a multi-turn process.",
+    ]
+
+
+def test_sessions_keep_their_own_steps(step_pacing):
+    orchestrator, llm = make_orchestrator(
+        prefetch=False, pacing_controller=step_pacing, llm=LongStepLLMExecutor()
+    )
+    first = SessionState(session_id="a", mode=PacingMode.DELIBERATIVE)
+    second = SessionState(session_id="b", mode=PacingMode.DELIBERATIVE)
+
+    run_turn(orchestrator, first, "Start reasoning")
+    run_turn(orchestrator, first, CONTINUE_INPUT)
+    run_turn(orchestrator, second, "Start reasoning")
+
+    # Session b starts at step 1 although session a is on step 3
+    assert [call["instruction"].splitlines()[0] for call in llm.calls] == [
+        "This is step 1 of a multi-turn process.",
+        "This is step 2 of a multi-turn process.",
+        "This is step 1 of a multi-turn process.",
+    ]
+    assert step_pacing.deliberative_turns("a") == 2
+    assert step_pacing.deliberative_turns("b") == 1
+    assert step_pacing.deliberative_turn_count == 0
+
+
+def test_prefetch_survives_adaptive_budget_change(session, step_policy_path):
+    pacing = PacingController(
+        PolicyEngine(step_policy_path),
+        adaptive_budget=AdaptiveBudget(min_observations=1, min_tokens=1),
+    )
+    orchestrator, llm = make_orchestrator(
+        pacing_controller=pacing, llm=LongStepLLMExecutor()
+    )
+
+    run_turn(orchestrator, session, "Start reasoning")
+    run_turn(orchestrator, session, CONTINUE_INPUT)
+    settle(orchestrator)
+
+    # The budget moved after turn 1; the prefetch (at the hard cap) still matched
+    hard_cap = pacing.get_limits(PacingMode.DELIBERATIVE).hard_cap_tokens
+    assert pacing.budget_for(PacingMode.DELIBERATIVE, "ctx").max_tokens < hard_cap
+    assert orchestrator.prefetcher.stats.hits == 1
+    turn_two = [call for call in llm.calls if call["turn_index"] == 2]
+    assert [call["token_limit"] for call in turn_two] == [hard_cap]
+
+
+def test_other_input_discards_prefetch(session):
+    orchestrator, llm = make_orchestrator()
+
+    run_turn(orchestrator, session, "Start reasoning")
+    run_turn(orchestrator, session, "Actually, explain decorators")
+    settle(orchestrator)
+
+    foreground = [call for call in llm.calls if call["user_input"] != CONTINUE_INPUT]
+    assert [call["turn_index"] for call in foreground] == [1, 2]
+    assert orchestrator.prefetcher.stats.hits == 0
+    assert orchestrator.prefetcher.stats.discarded >= 1
+
+
+def test_memory_change_invalidates_prefetch(session):
+    orchestrator, llm = make_orchestrator()
+
+    run_turn(orchestrator, session, "Start reasoning")
+    orchestrator.memory_manager.memory = "Updated memory"
+    run_turn(orchestrator, session, CONTINUE_INPUT)
+    settle(orchestrator)
+
+    assert orchestrator.prefetcher.stats.hits == 0
+    # The stale prefetch (if it ran at all) was not used
+    foreground = [call for call in llm.calls if call["context_block"] == "Updated memory"]
+    assert foreground[0]["turn_index"] == 2
+
+
+def test_policy_reload_invalidates_prefetch(session):
+    orchestrator, _ = make_orchestrator()
+
+    run_turn(orchestrator, session, "Start reasoning")
+    orchestrator.policy_engine.generation += 1
+    run_turn(orchestrator, session, CONTINUE_INPUT)
+    settle(orchestrator)
+
+    assert orchestrator.prefetcher.stats.hits == 0
+
+
+def test_non_normal_route_discards_prefetch(session):
+    orchestrator, _ = make_orchestrator()
+
+    run_turn(orchestrator, session, "Start reasoning")
+    orchestrator.memory_manager.query_result = MemoryQueryResult.EMPTY
+    result = orchestrator.handle_turn(session, CONTINUE_INPUT)
+
+    assert result.type == "INTAKE"
+    assert not orchestrator.prefetcher.has_pending(session.session_id)
+
+
+def test_prefetch_disabled_by_default(session):
+    orchestrator, llm = make_orchestrator(prefetch=False)
+
+    run_turn(orchestrator, session, "Start reasoning")
+    run_turn(orchestrator, session, CONTINUE_INPUT)
+
+    assert orchestrator.prefetcher is None
+    assert [call["turn_index"] for call in llm.calls] == [1, 2]
+
+
+def test_close_stops_prefetching(session):
+    orchestrator, _ = make_orchestrator()
+    run_turn(orchestrator, session, "Start reasoning")
+
+    orchestrator.close()
+
+    assert not orchestrator.prefetcher.has_pending(session.session_id)
+    with pytest.raises(RuntimeError):
+        orchestrator.prefetcher.start(session.session_id, {"turn_index": 9}, None)
+
+
+def test_failed_prefetch_falls_back_to_none():
+    class FailingExecutor:
+        def execute(self, **kwargs):
+            raise RuntimeError("provider down")
+
+    prefetcher = ContinuationPrefetcher(FailingExecutor(), max_workers=1)
+    call = {"user_input": CONTINUE_INPUT, "turn_index": 2}
+
+    prefetcher.start("s", call, None)
+
+    assert prefetcher.take("s", call, None) is None
+    assert prefetcher.stats.failed == 1
+    prefetcher.shutdown()
@@ -0,0 +1,245 @@
+import pytest
+
+from orchestrator.orchestrator import ConversationOrchestrator
+from orchestrator.models import OrchestratorContext, SessionState
+from orchestrator.repair import ResponseRepairer, REPAIR_MODE, REPAIR_TOKEN_BUDGET
+from output_validator.validator import OutputValidator
+from output_validator.models import ErrorCode
+from uncertainty_engine.enums import UncertaintyLevel
+from pacing_controller.enums import PacingMode
+from pacing_controller.budget import BudgetDecision
+from policy_engine.policy_engine import PolicyEngine
+
+
+# ---------------------------------------------------------------------
+# DUMMIES — scripted LLM, real OutputValidator
+# ---------------------------------------------------------------------
+
+class DummyLLMResult:
+    def __init__(self, text, token_usage_input=10, token_usage_output=5):
+        self.text = text
+        self.token_usage_input = token_usage_input
+        self.token_usage_output = token_usage_output
+        self.raw_provider_response = {}
+
+
+class ScriptedLLMExecutor:
+    """Returns the scripted texts in order and records every call."""
+
+    def __init__(self, *texts):
+        self.texts = list(texts)
+        self.calls = []
+
+    def execute(self, **kwargs):
+        self.calls.append(kwargs)
+        return DummyLLMResult(self.texts.pop(0))
+
+
+class DummyMemoryManager:
+    write_attempted = False
+    confirmation_requested = False
+    last_scope = None
+
+    def render_relevant_memory(self):
+        return "memory"
+
+
+class DummyUncertaintyEngine:
+    last_context = "ctx"
+    last_intent_summary = "learn python"
+    assumptions_required = False
+
+
+class DummyPolicyEngine:
+    def get_forbidden_patterns(self):
+        return []
+
+    def get_grounding_questions(self, reason: str):
+        return ["Q1", "Q2", "Q3", "Q4", "Q5"]
+
+
+class DummyPacingLimits:
+    target_tokens = 100
+    hard_cap_tokens = 200
+
+
+class DummyPacingDecision:
+    must_continue_in_next_turn = False
+
+
+class DummyPacingController:
+    def __init__(self):
+        self.evaluated = []
+
+    def get_limits(self, mode):
+        return DummyPacingLimits()
+
+    def budget_for(self, mode, context_key=None):
+        hard_cap = DummyPacingLimits.hard_cap_tokens
+        return BudgetDecision(hard_cap, hard_cap, 0, False)
+
+    def observe_output_tokens(
+        self, mode, output_tokens, context_key=None, requested_max_tokens=None
+    ):
+        pass
+
+    def build_mode_instruction(self, mode, session_id=None):
+        return "instruction"
+
+    def evaluate_output(self, mode, text, session_id=None):
+        self.evaluated.append(text)
+        return DummyPacingDecision()
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return OutputValidator(PolicyEngine("policy_v1.3.2.yaml"))
+
+
+def base_context(**overrides) -> OrchestratorContext:
+    defaults = dict(
+        uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+        memory_write_attempted=False,
+        memory_confirmation_asked=False,
+        memory_scope=None,
+        token_count=50,
+        token_limit=200,
+        user_intent="learn python",
+        assumptions_required=False,
+        contains_medium_or_low_confidence_claims=False,
+    )
+    defaults.update(overrides)
+    return OrchestratorContext(**defaults)
+
+
+def make_orchestrator(llm, validator, attempts):
+    return ConversationOrchestrator(
+        memory_manager=DummyMemoryManager(),
+        uncertainty_engine=DummyUncertaintyEngine(),
+        pacing_controller=DummyPacingController(),
+        llm_executor=llm,
+        output_validator=validator,
+        policy_engine=DummyPolicyEngine(),
+        max_repair_attempts=attempts,
+    )
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+
+def test_missing_next_step_is_appended_and_accepted(validator):
+    llm = ScriptedLLMExecutor(
+        "[HIGH] Python lists are ordered",
+        "Next step: try slicing a list.",
+    )
+    orchestrator = make_orchestrator(llm, validator, attempts=2)
+    session = SessionState(session_id="repair-1", mode=PacingMode.NORMAL)
+
+    result = orchestrator.execute_normal(session, "lists?", UncertaintyLevel.LEVEL_1_2)
+
+    assert result == "[HIGH] Python lists are ordered\nNext step: try slicing a list."
+    assert len(llm.calls) == 2
+    assert llm.calls[1]["token_limit"] == REPAIR_TOKEN_BUDGET
+
+    report = orchestrator.last_repair_report
+    assert report.repaired
+    assert report.attempts == 1
+    assert report.repaired_errors == (ErrorCode.nextstepsnotclear,)
+    assert (report.repair_tokens, report.regeneration_tokens) == (15, 15)
+    assert orchestrator.repair_totals.responses_repaired == 1
+
+
+def test_unlabelled_sentence_is_rewritten_in_place(validator):
+    llm = ScriptedLLMExecutor("[HIGH] It is done")
+    repairer = ResponseRepairer(llm, validator, max_attempts=1)
+    text = "[HIGH] Python is fun. It is done. Next step: learn python."
+    context = base_context()
+
+    repaired, validation, _, report = repairer.repair(
+        text, context, validator.validate(text, context), DummyLLMResult(text),
+        forbidden_patterns=[],
+    )
+
+    assert repaired == "[HIGH] Python is fun. [HIGH] It is done. Next step: learn python."
+    assert validation.status == "ACCEPTED"
+    assert llm.calls[0]["user_input"] == "It is done"
+
+
+def test_unrepairable_rejection_spends_no_tokens(validator):
+    llm = ScriptedLLMExecutor("[HIGH] You must use python. Next step: go.")
+    orchestrator = make_orchestrator(llm, validator, attempts=2)
+    session = SessionState(session_id="repair-2", mode=PacingMode.NORMAL)
+
+    result = orchestrator.execute_normal(session, "python?", UncertaintyLevel.LEVEL_1_2)
+
+    assert result.type == "GROUNDING"
+    assert len(llm.calls) == 1
+    assert orchestrator.last_repair_report.attempts == 0
+    assert orchestrator.repair_totals.responses_attempted == 0
+
+
+def test_repair_stops_after_max_attempts(validator):
+    llm = ScriptedLLMExecutor(
+        "[HIGH] Python lists are ordered",
+        "Try slicing.",
+        "Try slicing again.",
+    )
+    orchestrator = make_orchestrator(llm, validator, attempts=2)
+    session = SessionState(session_id="repair-3", mode=PacingMode.NORMAL)
+
+    result = orchestrator.execute_normal(session, "lists?", UncertaintyLevel.LEVEL_1_2)
+
+    assert result.type == "GROUNDING"
+    assert len(llm.calls) == 3
+    report = orchestrator.last_repair_report
+    assert report.attempts == 2 and not report.repaired
+    assert orchestrator.repair_totals.repair_tokens == 30
+    assert orchestrator.repair_totals.regeneration_tokens_avoided == 0
+
+
+def test_repair_disabled_by_default(validator):
+    llm = ScriptedLLMExecutor("[HIGH] Python lists are ordered")
+    orchestrator = make_orchestrator(llm, validator, attempts=0)
+    session = SessionState(session_id="repair-4", mode=PacingMode.NORMAL)
+
+    result = orchestrator.execute_normal(session, "lists?", UncertaintyLevel.LEVEL_1_2)
+
+    assert result.type == "GROUNDING"
+    assert len(llm.calls) == 1
+    assert orchestrator.last_repair_report is None
+
+
+def test_repaired_response_is_paced_once(validator):
+    llm = ScriptedLLMExecutor(
+        "[HIGH] Python lists are ordered",
+        "Next step: try slicing a list.",
+    )
+    orchestrator = make_orchestrator(llm, validator, attempts=1)
+    session = SessionState(session_id="repair-5", mode=PacingMode.DELIBERATIVE)
+
+    orchestrator.execute_normal(session, "lists?", UncertaintyLevel.LEVEL_1_2)
+
+    assert orchestrator.last_repair_report.repaired
+    assert orchestrator.pacing_controller.evaluated == ["[HIGH] Python lists are ordered"]
+
+    # The fix call is single-turn, not prompted as a DELIBERATIVE step
+    assert llm.calls[0]["mode"] == PacingMode.DELIBERATIVE
+    assert (llm.calls[1]["mode"], llm.calls[1]["turn_index"]) == (REPAIR_MODE, None)
+
+
+def test_repaired_response_over_hard_cap_is_a_failed_repair(validator):
+    llm = ScriptedLLMExecutor(
+        "[HIGH] Python lists are ordered",
+        "Next step: " + "try slicing a list. " * 100,
+    )
+    orchestrator = make_orchestrator(llm, validator, attempts=1)
+    session = SessionState(session_id="repair-6", mode=PacingMode.NORMAL)
+
+    result = orchestrator.execute_normal(session, "lists?", UncertaintyLevel.LEVEL_1_2)
+
+    assert result.type == "GROUNDING"
+    report = orchestrator.last_repair_report
+    assert report.attempts == 1 and not report.repaired
+    assert orchestrator.repair_totals.responses_repaired == 0
+    assert orchestrator.repair_totals.regeneration_tokens_avoided == 0
@@ -6,6 +6,7 @@ from orchestrator.models import SessionState
 from memory_manager.enums import MemoryQueryResult
 from uncertainty_engine.enums import UncertaintyLevel
 from pacing_controller.enums import PacingMode
+from pacing_controller.budget import BudgetDecision
 
 
 # ---------------------------------------------------------------------
@@ -56,17 +57,26 @@ class DummyPacingLimits:
 
 
 class DummyPacingDecision:
-    must_continue = False
+    must_continue_in_next_turn = False
 
 
 class DummyPacingController:
     def get_limits(self, mode):
         return DummyPacingLimits()
 
-    def build_mode_instruction(self, mode):
+    def budget_for(self, mode, context_key=None):
+        hard_cap = DummyPacingLimits.hard_cap_tokens
+        return BudgetDecision(hard_cap, hard_cap, 0, False)
+
+    def observe_output_tokens(
+        self, mode, output_tokens, context_key=None, requested_max_tokens=None
+    ):
+        pass
+
+    def build_mode_instruction(self, mode, session_id=None):
         return "instruction"
 
-    def evaluate_output(self, mode, text):
+    def evaluate_output(self, mode, text, session_id=None):
         return DummyPacingDecision()
 
 
@@ -0,0 +1,128 @@
+import itertools
+import random
+
+import pytest
+
+from output_validator.validator import OutputValidator
+from output_validator.byte_input import ascii_buffer, strip_bounds
+from output_validator.cache import DEFAULT_CACHE_SIZE
+from output_validator.claims import build_claim_index, index_response
+from output_validator.fused import BytesResponseSignals, collect_signals
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+FRAGMENTS = [
+    "[HIGH] This WILL work",
+    "[LOW] You Should act",
+    "It IS done",
+    "Which one?",
+    "A) first B) second C) third",
+    "xA) glued",
+    "50\x1c%",
+    "Assumption: none",
+    "CLEARLY",
+    "Python Error handling",
+    "Not Sure",
+    "Next Step: try it",
+    "worKs fine",
+    "café ",
+    ".", "\n", "\r\n", "\x1e", " \x1f ",
+]
+
+CONTEXTS = [
+    dict(),
+    dict(uncertainty_level=UncertaintyLevel.LEVEL_3),
+    dict(uncertainty_level=UncertaintyLevel.LEVEL_4),
+    dict(assumptions_required=True),
+    dict(contains_medium_or_low_confidence_claims=True),
+    dict(user_intent="Café python"),
+]
+
+
+def base_context(**overrides) -> OrchestratorContext:
+    defaults = dict(
+        uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+        memory_write_attempted=False,
+        memory_confirmation_asked=False,
+        memory_scope=None,
+        token_count=100,
+        token_limit=1000,
+        user_intent="learn python error handling",
+        assumptions_required=False,
+        contains_medium_or_low_confidence_claims=False,
+    )
+    defaults.update(overrides)
+    return OrchestratorContext(**defaults)
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return OutputValidator(PolicyEngine("policy_v1.3.2.yaml"), cache_size=0)
+
+
+def byte_forms(text):
+    data = text.encode("utf-8")
+    return [data, bytearray(data), memoryview(data)]
+
+
+def test_bytes_verdicts_match_str(validator):
+    rng = random.Random(38)
+    for _ in range(400):
+        text = " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 8)))
+        for overrides in CONTEXTS:
+            context = base_context(**overrides)
+            expected = validator.validate_sequential(text, context)
+            for data in byte_forms(text):
+                assert validator.validate(data, context) == expected
+
+
+def test_ascii_claim_index_matches_str():
+    for a, b, c in itertools.product(FRAGMENTS, repeat=3):
+        text = a + b + c
+        if not text.isascii():
+            continue
+        assert index_response(text.encode("ascii")) == build_claim_index(text)
+
+
+def test_ascii_bytes_scanned_in_place():
+    data = b"[HIGH] It is done. Next step: try it."
+    signals = collect_signals(memoryview(data))
+    assert isinstance(signals, BytesResponseSignals)
+    assert signals.next_steps
+    assert not signals.unlabelled_claim
+
+    # Non-ASCII falls back to one decode
+    assert not isinstance(collect_signals("café".encode("utf-8")), BytesResponseSignals)
+
+
+def test_ascii_buffer_and_strip_bounds():
+    assert ascii_buffer(b"plain") == b"plain"
+    assert ascii_buffer(memoryview(b"caf\xc3\xa9")) is None
+
+    data = b" \x1c text \x1f\t"
+    start, end = strip_bounds(data, 0, len(data))
+    assert data[start:end] == b"text"
+
+
+def test_bytes_and_str_share_cache_entries():
+    validator = OutputValidator(PolicyEngine("policy_v1.3.2.yaml"), cache_size=DEFAULT_CACHE_SIZE)
+    text = "[HIGH] python error handling works. Next step: try it."
+    validator.validate(text, base_context())
+    validator.validate(text.encode("utf-8"), base_context())
+    assert validator.cache_stats().hits == 1
+
+
+@pytest.mark.parametrize("wrap", [bytearray, lambda data: memoryview(bytearray(data))])
+def test_mutated_buffer_is_reindexed(wrap):
+    validator = OutputValidator(PolicyEngine("policy_v1.3.2.yaml"), cache_size=0)
+    buffer = wrap(b"[HIGH] python error handling will work. Next step: try it.")
+
+    assert not validator.scan_confidence_levels(buffer)
+    assert validator.validate(buffer, base_context()).status == "ACCEPTED"
+
+    # Same object, new content: the label is gone
+    buffer[0:6] = b"      "
+
+    assert validator.validate(buffer, base_context()).status == "REJECTED"
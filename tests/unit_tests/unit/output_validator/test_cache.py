@@ -0,0 +1,136 @@
+import shutil
+from dataclasses import fields
+
+import pytest
+
+from output_validator.cache import CONTEXT_KEY_FIELDS, DEFAULT_CACHE_SIZE, ValidationCache
+from output_validator.validator import OutputValidator
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+def base_context(**overrides) -> OrchestratorContext:
+    defaults = dict(
+        uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+        memory_write_attempted=False,
+        memory_confirmation_asked=False,
+        memory_scope=None,
+        token_count=100,
+        token_limit=1000,
+        user_intent="learn python error handling",
+        assumptions_required=False,
+        contains_medium_or_low_confidence_claims=False,
+    )
+    defaults.update(overrides)
+    return OrchestratorContext(**defaults)
+
+
+TEXT = "[HIGH] Python error handling uses try blocks. Next step: practice."
+
+
+@pytest.fixture
+def policy_engine(tmp_path):
+    path = tmp_path / "policy.yaml"
+    shutil.copy("policy_v1.3.2.yaml", path)
+    return PolicyEngine(str(path))
+
+
+def cached_validator(policy_engine) -> OutputValidator:
+    return OutputValidator(policy_engine, cache_size=DEFAULT_CACHE_SIZE)
+
+
+def test_cache_is_opt_in(policy_engine, monkeypatch):
+    validator = OutputValidator(policy_engine)
+
+    def fail(*args):
+        raise AssertionError("make_key called with the default validator")
+
+    monkeypatch.setattr(validator._cache, "make_key", fail)
+    validator.validate(TEXT, base_context())
+    assert validator.cache_stats().max_size == 0
+
+
+def test_repeat_validation_hits_cache(policy_engine):
+    validator = cached_validator(policy_engine)
+
+    first = validator.validate(TEXT, base_context())
+    second = validator.validate(TEXT, base_context())
+
+    assert second is first
+    stats = validator.cache_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.hit_ratio == 0.5
+
+
+def test_context_change_is_a_miss(policy_engine):
+    validator = cached_validator(policy_engine)
+
+    accepted = validator.validate(TEXT, base_context())
+    rejected = validator.validate(TEXT, base_context(token_count=5000))
+
+    assert accepted.status == "ACCEPTED"
+    assert rejected.status == "REJECTED"
+    assert validator.cache_stats().hits == 0
+
+
+def test_disabled_cache_skips_digest(policy_engine, monkeypatch):
+    validator = OutputValidator(policy_engine, cache_size=0)
+
+    def fail(*args):
+        raise AssertionError("make_key called with the cache disabled")
+
+    monkeypatch.setattr(validator._cache, "make_key", fail)
+    assert validator.validate(TEXT, base_context()).status == "ACCEPTED"
+
+
+def test_key_covers_every_context_field():
+    assert set(CONTEXT_KEY_FIELDS) == {f.name for f in fields(OrchestratorContext)}
+
+    assert ValidationCache.make_key(TEXT, base_context()) == ValidationCache.make_key(TEXT, base_context())
+
+
+def test_policy_reload_invalidates_cache(policy_engine):
+    validator = cached_validator(policy_engine)
+    validator.validate(TEXT, base_context())
+
+    policy_engine.reload()
+    validator.validate(TEXT, base_context())
+
+    stats = validator.cache_stats()
+    assert stats.hits == 0
+    assert stats.invalidations == 1
+    assert stats.size == 1
+
+
+def test_lru_evicts_oldest(policy_engine):
+    validator = OutputValidator(policy_engine, cache_size=2)
+
+    for text in ("a", "b", "c"):
+        validator.validate(text, base_context())
+    validator.validate("a", base_context())
+
+    stats = validator.cache_stats()
+    assert stats.size == 2
+    assert stats.hits == 0
+
+
+def test_unhashable_context_bypasses_cache(policy_engine):
+    validator = cached_validator(policy_engine)
+    context = base_context(memory_scope=["learning"])
+
+    validator.validate(TEXT, context)
+    validator.validate(TEXT, context)
+
+    stats = validator.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)
+
+
+def test_cache_disabled(policy_engine):
+    validator = OutputValidator(policy_engine, cache_size=0)
+
+    validator.validate(TEXT, base_context())
+    validator.validate(TEXT, base_context())
+
+    stats = validator.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (0, 0, 0)
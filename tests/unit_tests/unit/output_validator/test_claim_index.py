@@ -0,0 +1,127 @@
+import random
+
+import pytest
+
+from output_validator.validator import OutputValidator
+from output_validator.claims import (
+    build_claim_index,
+    build_claim_index_bytes,
+    has_low_asserted_line,
+    has_low_asserted_line_bytes,
+    has_unlabelled_claim,
+    has_unlabelled_claim_bytes,
+)
+from output_validator import rules
+from output_validator.models import ErrorCode
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+@pytest.fixture
+def validator():
+    return OutputValidator(PolicyEngine("policy_v1.3.2.yaml"))
+
+
+def base_context(**overrides) -> OrchestratorContext:
+    defaults = dict(
+        uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+        memory_write_attempted=False,
+        memory_confirmation_asked=False,
+        memory_scope=None,
+        token_count=100,
+        token_limit=1000,
+        user_intent="learn python error handling",
+        assumptions_required=False,
+        contains_medium_or_low_confidence_claims=False,
+    )
+    defaults.update(overrides)
+    return OrchestratorContext(**defaults)
+
+
+FRAGMENTS = [
+    "[HIGH] This will work",
+    "[MEDIUM] it may help",
+    "[LOW] you should act",
+    "This IS certain",
+    "It always fails",
+    "İt will run",
+    "Next step: try it",
+    ".", "\n", " ", "?",
+]
+
+
+def test_sentence_spans_labels_and_hits():
+    text = "[HIGH] This will work.  It is done\n[LOW] maybe"
+    index = build_claim_index(text)
+
+    first, second, third = index.sentences
+    assert text[first.start:first.end] == "[HIGH] This will work"
+    assert first.labels == ("[HIGH]",)
+    assert [text[a:b] for a, b in first.assertive_hits] == [" will "]
+
+    assert text[second.start:second.end] == "It is done"
+    assert second.is_unlabelled_claim
+    assert index.unlabelled_claims == (second,)
+
+    assert third.labels == ("[LOW]",)
+    assert not third.assertive
+    assert index.has_medium_or_low_claims
+
+
+def test_index_matches_rule_functions():
+    rng = random.Random(35)
+    for _ in range(300):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 10)))
+        index = build_claim_index(text)
+        assert index.has_unlabelled_claim == rules.contains_claim_without_label(text)
+        assert bool(index.low_asserted_lines) == rules.low_confidence_asserted(text)
+        for claim in index.sentences:
+            assert text[claim.start:claim.end] == text[claim.start:claim.end].strip()
+
+
+def test_fail_fast_scans_match_index():
+    # Edge whitespace decides whether " is " counts; "[high]" is no label
+    fragments = FRAGMENTS + [" is ", "\t", "\x1c", "[high] it is so"]
+    rng = random.Random(29)
+    for _ in range(2000):
+        text = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 10)))
+        index = build_claim_index(text)
+        assert has_unlabelled_claim(text) == index.has_unlabelled_claim
+        assert has_low_asserted_line(text) == bool(index.low_asserted_lines)
+
+        if text.isascii():
+            data = text.encode("ascii")
+            index = build_claim_index_bytes(data)
+            assert has_unlabelled_claim_bytes(data) == index.has_unlabelled_claim
+            assert has_low_asserted_line_bytes(data) == bool(index.low_asserted_lines)
+
+
+def test_validate_does_not_build_index(validator):
+    text = "[HIGH] python error handling works. It is done. Next step: try it."
+    result = validator.validate(text, base_context())
+
+    assert result.error_code is ErrorCode.missingconfidencelabel
+    assert result.claim_index is None
+
+
+def test_scan_confidence_levels(validator):
+    assert validator.scan_confidence_levels("[MEDIUM] it may help.")
+    assert validator.scan_confidence_levels("[LOW] perhaps.")
+    assert not validator.scan_confidence_levels("[HIGH] it works.")
+
+
+def test_validate_reuses_scanned_index(validator):
+    text = "[MEDIUM] This may help with python errors. Next step: try it."
+    validator.scan_confidence_levels(text)
+    scanned = validator.index_claims(text)
+
+    result = validator.validate(text, base_context())
+    assert result.claim_index is scanned
+    assert validator.validate_all(text, base_context()).claim_index is scanned
+
+
+def test_token_cap_rejection_has_no_index(validator):
+    result = validator.validate("anything", base_context(token_count=2000))
+    assert result.status == "REJECTED"
+    assert result.claim_index is None
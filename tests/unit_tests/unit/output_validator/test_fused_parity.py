@@ -0,0 +1,91 @@
+import itertools
+import random
+
+import pytest
+
+from output_validator.validator import OutputValidator
+from output_validator.fused import collect_signals
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return OutputValidator(PolicyEngine("policy_v1.3.2.yaml"))
+
+
+FRAGMENTS = [
+    "[HIGH] Python is a language.",
+    "This will definitely work.",
+    "[LOW] This will definitely work.",
+    "[LOW] it might help\n",
+    "[MEDIUM] It depends on your setup.",
+    "Is this clear?",
+    "What next? Why? How?",
+    "A) first B) second C) third",
+    "A) only one",
+    "about 50 % of cases",
+    "I assume you use Python 3.",
+    "You must do this.",
+    "Clearly the answer.",
+    "Next step: learn error handling.",
+    "Let me know.",
+    "Python error handling basics",
+    "İstanbul is big.",
+    "\n\n",
+    "",
+]
+
+
+def make_context(**overrides) -> OrchestratorContext:
+    defaults = dict(
+        uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+        memory_write_attempted=False,
+        memory_confirmation_asked=False,
+        memory_scope=None,
+        token_count=100,
+        token_limit=1000,
+        user_intent="learn python error handling",
+        assumptions_required=False,
+        contains_medium_or_low_confidence_claims=False,
+    )
+    defaults.update(overrides)
+    return OrchestratorContext(**defaults)
+
+
+CONTEXTS = [
+    make_context(),
+    make_context(token_count=2000),
+    make_context(uncertainty_level=UncertaintyLevel.LEVEL_3),
+    make_context(uncertainty_level=UncertaintyLevel.LEVEL_5),
+    make_context(assumptions_required=True),
+    make_context(memory_write_attempted=True),
+    make_context(memory_write_attempted=True, memory_confirmation_asked=True),
+    make_context(memory_write_attempted=True, memory_confirmation_asked=True, memory_scope="learning"),
+    make_context(contains_medium_or_low_confidence_claims=True),
+    make_context(user_intent="quantum chromodynamics"),
+]
+
+
+def test_fused_matches_sequential_on_random_responses(validator):
+    rng = random.Random(1234)
+
+    for _ in range(400):
+        text = " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 6)))
+        for context in CONTEXTS:
+            assert validator.validate(text, context) == validator.validate_sequential(text, context)
+
+
+def test_fused_matches_sequential_on_fragment_pairs(validator):
+    for a, b in itertools.product(FRAGMENTS, repeat=2):
+        text = a + " " + b
+        for context in CONTEXTS:
+            assert validator.validate(text, context) == validator.validate_sequential(text, context)
+
+
+def test_signals_lowercase_once():
+    signals = collect_signals("Next Step: [HIGH] It IS done.")
+    assert signals.lower == "next step: [high] it is done."
+    assert signals.next_steps
+    assert not signals.unlabelled_claim
@@ -0,0 +1,130 @@
+import random
+
+import pytest
+
+from output_validator.validator import OutputValidator
+from output_validator.models import ErrorCode
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return OutputValidator(PolicyEngine("policy_v1.3.2.yaml"))
+
+
+def base_context(**overrides) -> OrchestratorContext:
+    defaults = dict(
+        uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+        memory_write_attempted=False,
+        memory_confirmation_asked=False,
+        memory_scope=None,
+        token_count=100,
+        token_limit=1000,
+        user_intent="learn python error handling",
+        assumptions_required=False,
+        contains_medium_or_low_confidence_claims=False,
+    )
+    defaults.update(overrides)
+    return OrchestratorContext(**defaults)
+
+
+def stream(validator, text, context, sizes):
+    session = validator.incremental(context)
+    position = 0
+    early = None
+    for size in sizes:
+        if position >= len(text):
+            break
+        result = session.feed(text[position:position + size])
+        position += size
+        if result is not None and early is None:
+            early = result
+    session.feed(text[position:])
+    return session, early
+
+
+FRAGMENTS = [
+    "[HIGH] Python is a language.",
+    "This will definitely work.",
+    "[LOW] it will\nwork",
+    "[LOW] You should try",
+    "Is this clear?",
+    "A) one B) two C) three",
+    "A) again",
+    "about 50",
+    " %",
+    "You must do this.",
+    "clear",
+    "ly",
+    "Next step: learn error handling.",
+    "\r\n",
+    "",
+]
+
+
+def test_finish_matches_validate_and_early_rejection_is_final(validator):
+    rng = random.Random(99)
+
+    for _ in range(300):
+        text = " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 6)))
+        sizes = [rng.randint(1, 6) for _ in range(len(text) + 1)]
+
+        session, early = stream(validator, text, base_context(), sizes)
+        final = validator.validate(text, base_context())
+
+        assert session.finish() == final
+        if early is not None:
+            assert early.status == "REJECTED"
+            assert final.status == "REJECTED"
+
+
+def test_rejects_at_first_unlabelled_sentence(validator):
+    session = validator.incremental(base_context())
+
+    assert session.feed("This will defin") is None
+    result = session.feed("itely work. More text")
+
+    assert result.status == "REJECTED"
+    assert result.error_code == ErrorCode.missingconfidencelabel
+
+
+def test_low_confidence_rejected_before_line_ends(validator):
+    session = validator.incremental(base_context())
+
+    assert session.feed("[LO") is None
+    result = session.feed("W] this must")
+
+    assert result is None
+    result = session.feed(" hold")
+    assert result.error_code == ErrorCode.lowconfidenceasserted
+
+
+def test_authority_phrase_split_across_deltas(validator):
+    session = validator.incremental(base_context())
+
+    assert session.feed("[HIGH] you mu") is None
+    assert session.feed("st").error_code == ErrorCode.forbiddenauthoritativephrasing
+
+
+def test_percentage_split_across_deltas(validator):
+    session = validator.incremental(base_context())
+
+    assert session.feed("roughly 40") is None
+    assert session.feed("   ") is None
+    assert session.feed("% of users").error_code == ErrorCode.percentageinchoice
+
+
+def test_context_violation_rejects_immediately(validator):
+    context = base_context(memory_write_attempted=True)
+    session = validator.incremental(context)
+
+    assert session.feed("").error_code == ErrorCode.memorywritewithoutconfirmation
+
+
+def test_absence_rules_wait_for_finish(validator):
+    session = validator.incremental(base_context())
+
+    assert session.feed("[HIGH] Python is great") is None
+    assert session.finish().error_code == ErrorCode.nextstepsnotclear
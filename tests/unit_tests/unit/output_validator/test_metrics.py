@@ -0,0 +1,108 @@
+import pytest
+
+from output_validator.validator import OutputValidator
+from output_validator.cache import DEFAULT_CACHE_SIZE
+from output_validator.models import ErrorCode
+from output_validator.registry import ValidationRule
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+ACCEPTED_TEXT = "[HIGH] Python error handling uses try blocks. Next step: try it."
+
+
+@pytest.fixture
+def validator():
+    return OutputValidator(PolicyEngine("policy_v1.3.2.yaml"), metrics_enabled=True)
+
+
+def base_context(**overrides) -> OrchestratorContext:
+    defaults = dict(
+        uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+        memory_write_attempted=False,
+        memory_confirmation_asked=False,
+        memory_scope=None,
+        token_count=100,
+        token_limit=1000,
+        user_intent="learn python error handling",
+        assumptions_required=False,
+        contains_medium_or_low_confidence_claims=False,
+    )
+    defaults.update(overrides)
+    return OrchestratorContext(**defaults)
+
+
+def test_accepted_response_evaluates_every_applicable_rule_once(validator):
+    context = base_context()
+    assert validator.validate(ACCEPTED_TEXT, context).status == "ACCEPTED"
+
+    stats = validator.metrics.rule_stats()
+    assert set(stats) == {
+        rule.error_code for rule in validator.registry.rules() if rule.applies(context)
+    }
+    assert all(rule.calls == 1 and rule.rejections == 0 for rule in stats.values())
+    assert all(rule.total_ns >= 0 for rule in stats.values())
+
+
+def test_rejection_stops_at_rejecting_rule(validator):
+    result = validator.validate("This is done. Next step: python.", base_context())
+    assert result.error_code == ErrorCode.missingconfidencelabel
+
+    stats = validator.metrics.rule_stats()
+    assert set(stats) == {ErrorCode.tokencapreached, ErrorCode.missingconfidencelabel}
+    assert stats[ErrorCode.missingconfidencelabel].rejections == 1
+    assert stats[ErrorCode.missingconfidencelabel].rejection_rate == 1.0
+
+
+def test_shared_signals_are_timed_before_rules(validator):
+    seen = []
+
+    def probe(signals, context):
+        # Runs first: the lowercase copy must already be built
+        seen.append("lower" in vars(signals))
+        return False
+
+    validator.registry.register(
+        ValidationRule(error_code=ErrorCode.contradictsmemory, check=probe, priority=-1)
+    )
+    validator.reschedule()
+    validator.validate(ACCEPTED_TEXT, base_context())
+
+    assert seen == [True]
+    assert validator.metrics.signal_stats().calls == 1
+    assert "output_validator_shared_signals_duration_seconds_total " in validator.export_metrics()
+
+
+def test_cache_hits_are_not_counted():
+    validator = OutputValidator(
+        PolicyEngine("policy_v1.3.2.yaml"),
+        cache_size=DEFAULT_CACHE_SIZE,
+        metrics_enabled=True,
+    )
+    validator.validate(ACCEPTED_TEXT, base_context())
+    validator.validate(ACCEPTED_TEXT, base_context())
+    assert validator.metrics.rule_stats()[ErrorCode.nextstepsnotclear].calls == 1
+
+
+def test_disabled_metrics_record_nothing():
+    validator = OutputValidator(PolicyEngine("policy_v1.3.2.yaml"))
+    validator.validate(ACCEPTED_TEXT, base_context())
+    assert validator.metrics.rule_stats() == {}
+
+    validator.metrics.enable()
+    validator.validate(ACCEPTED_TEXT + " ", base_context())
+    assert validator.metrics.rule_stats()
+
+
+def test_prometheus_export(validator):
+    validator.validate("This is done. Next step: python.", base_context())
+    exported = validator.export_metrics()
+
+    assert "# TYPE output_validator_rule_calls_total counter" in exported
+    assert 'output_validator_rule_rejections_total{rule="missing_confidence_label"} 1' in exported
+    assert 'output_validator_rule_calls_total{rule="token_cap_reached"} 1' in exported
+    assert exported.endswith("\n")
+
+    validator.metrics.reset()
+    assert 'rule="' not in validator.export_metrics()
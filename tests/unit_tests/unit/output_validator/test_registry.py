@@ -0,0 +1,228 @@
+import itertools
+import random
+
+import pytest
+
+from output_validator.validator import OutputValidator
+from output_validator.registry import (
+    RuleRegistry,
+    ValidationRule,
+    builtin_rules,
+    default_registry,
+)
+from output_validator.errors import ValidationError
+from output_validator.fused import collect_signals
+from output_validator.metrics import RuleStats
+from output_validator.models import ErrorCode
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+FRAGMENTS = [
+    "[HIGH] This will work",
+    "[LOW] you should act",
+    "This is certain",
+    "Which one?",
+    "A) first B) second C) third",
+    "A) only",
+    "50%",
+    "Assumption: none",
+    "You must do it",
+    "python error handling",
+    "maybe",
+    "Next step: try it",
+    ".", "\n",
+]
+
+CONTEXT_VARIANTS = [
+    dict(),
+    dict(token_count=5000),
+    dict(uncertainty_level=UncertaintyLevel.LEVEL_3),
+    dict(uncertainty_level=UncertaintyLevel.LEVEL_5),
+    dict(assumptions_required=True),
+    dict(memory_write_attempted=True),
+    dict(memory_write_attempted=True, memory_confirmation_asked=True),
+    dict(contains_medium_or_low_confidence_claims=True),
+]
+
+
+def base_context(**overrides) -> OrchestratorContext:
+    defaults = dict(
+        uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+        memory_write_attempted=False,
+        memory_confirmation_asked=False,
+        memory_scope=None,
+        token_count=100,
+        token_limit=1000,
+        user_intent="learn python error handling",
+        assumptions_required=False,
+        contains_medium_or_low_confidence_claims=False,
+    )
+    defaults.update(overrides)
+    return OrchestratorContext(**defaults)
+
+
+@pytest.fixture(scope="module")
+def policy_engine():
+    return PolicyEngine("policy_v1.3.2.yaml")
+
+
+def test_any_order_gives_canonical_verdicts(policy_engine):
+    validator = OutputValidator(policy_engine, cache_size=0)
+    registry = default_registry()
+    rng = random.Random(37)
+    orders = [registry.rules(), tuple(reversed(registry.rules()))]
+    for _ in range(3):
+        order = list(registry.rules())
+        rng.shuffle(order)
+        orders.append(tuple(order))
+
+    for a, b in itertools.product(FRAGMENTS, repeat=2):
+        text = a + " " + b
+        for overrides in CONTEXT_VARIANTS:
+            context = base_context(**overrides)
+            expected = validator.validate_sequential(text, context).error_code
+            for order in orders:
+                verdict = RuleRegistry.first_violation(order, collect_signals(text), context)
+                assert verdict == expected
+
+
+def test_adaptive_schedule_keeps_verdicts(policy_engine):
+    adaptive = OutputValidator(
+        policy_engine, cache_size=0, metrics_enabled=True, adaptive_schedule=True
+    )
+    for a, b in itertools.product(FRAGMENTS, repeat=2):
+        text = a + " " + b
+        for overrides in CONTEXT_VARIANTS:
+            context = base_context(**overrides)
+            assert adaptive.validate(text, context) == adaptive.validate_sequential(text, context)
+
+
+def test_schedule_prefers_cheap_frequent_rejectors():
+    registry = default_registry()
+    stats = {
+        rule.error_code: RuleStats(calls=100, total_ns=100 * 1_000, rejections=0)
+        for rule in registry.rules()
+    }
+    stats[ErrorCode.nextstepsnotclear] = RuleStats(calls=100, total_ns=100 * 1_000, rejections=90)
+
+    order = registry.schedule(stats)
+    assert order[0].error_code == ErrorCode.nextstepsnotclear
+
+
+def test_unobserved_schedule_uses_declared_cost():
+    order = default_registry().schedule()
+    costs = [rule.cost_ns for rule in order]
+    assert costs == sorted(costs)
+
+
+def test_preconditions_skip_rules():
+    registry = default_registry()
+    calls = []
+
+    def check(signals, context):
+        calls.append(1)
+        return True
+
+    registry.unregister(ErrorCode.assumptionsnotsurfaced)
+    registry.register(
+        ValidationRule(
+            error_code=ErrorCode.assumptionsnotsurfaced,
+            check=check,
+            priority=7,
+            depends_on=("assumptions_required",),
+            precondition=lambda context: context.assumptions_required,
+        )
+    )
+    signals = collect_signals("[HIGH] python error handling. Next step: try it.")
+
+    assert registry.first_violation(registry.rules(), signals, base_context()) is None
+    assert calls == []
+    assert (
+        registry.first_violation(registry.rules(), signals, base_context(assumptions_required=True))
+        == ErrorCode.assumptionsnotsurfaced
+    )
+
+
+def test_custom_registry_drives_validate(policy_engine):
+    registry = default_registry()
+    registry.unregister(ErrorCode.nextstepsnotclear)
+    validator = OutputValidator(policy_engine, registry=registry)
+
+    result = validator.validate("[HIGH] python error handling is fun.", base_context())
+    assert result.status == "ACCEPTED"
+
+
+def test_custom_registry_drives_validate_all_and_incremental(policy_engine):
+    registry = default_registry()
+    registry.unregister(ErrorCode.forbiddenauthoritativephrasing)
+    registry.unregister(ErrorCode.nextstepsnotclear)
+    validator = OutputValidator(policy_engine, registry=registry)
+    text = "[HIGH] python error handling is fun. [HIGH] You must try it."
+
+    assert validator.validate(text, base_context()).status == "ACCEPTED"
+    assert validator.validate_all(text, base_context()).status == "ACCEPTED"
+
+    stream = validator.incremental(base_context())
+    assert stream.feed(text) is None
+    assert stream.finish().status == "ACCEPTED"
+
+
+def test_registry_change_after_validate_is_picked_up(policy_engine):
+    validator = OutputValidator(policy_engine, cache_size=16)
+    text = "[HIGH] python error handling is fun."
+    assert validator.validate(text, base_context()).error_code == ErrorCode.nextstepsnotclear
+
+    validator.registry.unregister(ErrorCode.nextstepsnotclear)
+
+    # No stale schedule, no stale cached verdict
+    assert validator.validate(text, base_context()).status == "ACCEPTED"
+    assert validator.validate_all(text, base_context()).status == "ACCEPTED"
+
+
+def test_validate_all_reports_registered_custom_rule(policy_engine):
+    registry = default_registry()
+    registry.unregister(ErrorCode.uncertaintynotdisclosed)
+    registry.register(
+        ValidationRule(
+            error_code=ErrorCode.uncertaintynotdisclosed,
+            check=lambda signals, context: "maybe" not in signals.lower,
+            priority=99,
+        )
+    )
+    validator = OutputValidator(policy_engine, registry=registry)
+    text = "[HIGH] python error handling. Next step: try it."
+
+    single = validator.validate(text, base_context())
+    full = validator.validate_all(text, base_context())
+
+    assert single.error_code == ErrorCode.uncertaintynotdisclosed
+    assert (full.status, full.error_code) == (single.status, single.error_code)
+    assert [v.error_code for v in full.violations] == [ErrorCode.uncertaintynotdisclosed]
+    assert full.violations[0].spans == ()
+
+
+def test_register_rejects_bad_rules():
+    registry = RuleRegistry(builtin_rules())
+    with pytest.raises(ValidationError):
+        registry.register(builtin_rules()[0])
+
+    registry.unregister(ErrorCode.nextstepsnotclear)
+    with pytest.raises(ValidationError):
+        registry.register(
+            ValidationRule(
+                error_code=ErrorCode.nextstepsnotclear,
+                check=lambda signals, context: False,
+                priority=99,
+                depends_on=("no_such_field",),
+            )
+        )
+    with pytest.raises(ValidationError):
+        registry.register(
+            ValidationRule(
+                error_code=ErrorCode.nextstepsnotclear,
+                check=lambda signals, context: False,
+                priority=0,
+            )
+        )
@@ -0,0 +1,111 @@
+import io
+import json
+
+from output_validator import replay as replay_module
+from output_validator.replay import replay, main
+from output_validator.validator import OutputValidator
+from output_validator.models import ErrorCode
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+CONTEXT = dict(
+    uncertainty_level="LEVEL_1_2",
+    memory_write_attempted=False,
+    memory_confirmation_asked=False,
+    memory_scope=None,
+    token_count=100,
+    token_limit=1000,
+    user_intent="learn python error handling",
+    assumptions_required=False,
+    contains_medium_or_low_confidence_claims=False,
+)
+
+TEXTS = [
+    "[HIGH] Python error handling uses try blocks. Next step: practice.",
+    "This will definitely work.",
+    "[HIGH] Python is nice. You must learn it. Next step: go.",
+    "[HIGH] Python error handling. Is it clear?",
+]
+
+
+def make_lines():
+    lines = [
+        json.dumps({"id": f"r{i}", "text": text, "context": CONTEXT})
+        for i, text in enumerate(TEXTS)
+    ]
+    lines.append("{not json")
+    lines.append("")
+    return [line + "\n" for line in lines]
+
+
+def expected_verdicts():
+    validator = OutputValidator(PolicyEngine("policy_v1.3.2.yaml"))
+    context = OrchestratorContext(**dict(CONTEXT, uncertainty_level=UncertaintyLevel.LEVEL_1_2))
+    return [validator.validate(text, context) for text in TEXTS]
+
+
+def test_replay_in_process_matches_validator():
+    out = io.StringIO()
+    summary = replay(make_lines(), out, workers=1)
+
+    verdicts = [json.loads(line) for line in out.getvalue().splitlines()]
+    expected = expected_verdicts()
+
+    assert [v["status"] for v in verdicts[:4]] == [r.status for r in expected]
+    assert [v["error_code"] for v in verdicts[:4]] == [
+        r.error_code.value if r.error_code else None for r in expected
+    ]
+    assert verdicts[4]["status"] == "INVALID"
+
+    assert summary.total == 5
+    assert summary.accepted + summary.rejected + summary.invalid == 5
+    assert summary.invalid == 1
+    assert summary.rejections_by_rule[ErrorCode.missingconfidencelabel.value] == sum(
+        1 for r in expected if r.error_code == ErrorCode.missingconfidencelabel
+    )
+    assert summary.responses_per_second > 0
+
+
+def test_replay_process_pool_preserves_order():
+    single, pooled = io.StringIO(), io.StringIO()
+    replay(make_lines() * 3, single, workers=1, batch_size=4)
+    replay(make_lines() * 3, pooled, workers=2, batch_size=4)
+
+    assert pooled.getvalue() == single.getvalue()
+
+
+def test_mistyped_records_are_invalid_not_fatal():
+    lines = [
+        json.dumps({"id": "null-text", "text": None, "context": CONTEXT}),
+        json.dumps({"id": "str-count", "text": TEXTS[0], "context": dict(CONTEXT, token_count="5")}),
+        json.dumps({"id": "null-intent", "text": TEXTS[0], "context": dict(CONTEXT, user_intent=None)}),
+        json.dumps({"id": "ok", "text": TEXTS[0], "context": CONTEXT}),
+    ]
+
+    for workers in (1, 2):
+        out = io.StringIO()
+        summary = replay(lines, out, workers=workers)
+
+        verdicts = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [v["status"] for v in verdicts] == ["INVALID", "INVALID", "INVALID", "ACCEPTED"]
+        assert (summary.total, summary.invalid) == (4, 3)
+
+
+def test_worker_validator_has_no_cache():
+    replay_module._init_worker("policy_v1.3.2.yaml")
+    assert replay_module._worker_validator.cache_stats().max_size == 0
+
+
+def test_cli_writes_verdicts_and_summary(tmp_path, capsys):
+    source = tmp_path / "in.jsonl"
+    target = tmp_path / "out.jsonl"
+    source.write_text("".join(make_lines()), encoding="utf-8")
+
+    assert main([str(source), str(target), "--workers", "1"]) == 0
+
+    assert len(target.read_text(encoding="utf-8").splitlines()) == 5
+    report = json.loads(capsys.readouterr().out)
+    assert report["total"] == 5
+    assert "responses_per_second" in report
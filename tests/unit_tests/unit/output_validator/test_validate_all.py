@@ -0,0 +1,166 @@
+import random
+
+import pytest
+
+from output_validator.validator import OutputValidator
+from output_validator.models import ErrorCode
+from output_validator import rules
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return OutputValidator(PolicyEngine("policy_v1.3.2.yaml"))
+
+
+def base_context(**overrides) -> OrchestratorContext:
+    defaults = dict(
+        uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+        memory_write_attempted=False,
+        memory_confirmation_asked=False,
+        memory_scope=None,
+        token_count=100,
+        token_limit=1000,
+        user_intent="learn python error handling",
+        assumptions_required=False,
+        contains_medium_or_low_confidence_claims=False,
+    )
+    defaults.update(overrides)
+    return OrchestratorContext(**defaults)
+
+
+def expected_codes(text, context):
+    """Every rule checked independently with the per-rule functions."""
+    codes = []
+    if context.token_count > context.token_limit:
+        codes.append(ErrorCode.tokencapreached)
+    if rules.contains_claim_without_label(text):
+        codes.append(ErrorCode.missingconfidencelabel)
+    if rules.low_confidence_asserted(text):
+        codes.append(ErrorCode.lowconfidenceasserted)
+    if context.uncertainty_level == UncertaintyLevel.LEVEL_3 and not rules.contains_clarifying_question(text):
+        codes.append(ErrorCode.proceededwithuncertainty3)
+    if context.uncertainty_level in (UncertaintyLevel.LEVEL_4, UncertaintyLevel.LEVEL_5) and not rules.contains_grounding_questions(text):
+        codes.append(ErrorCode.proceededwithuncertainty45)
+    if rules.PERCENT_PATTERN.search(text):
+        codes.append(ErrorCode.percentageinchoice)
+    choices = rules.CHOICE_PATTERN.findall(text)
+    if choices and sorted(choices) != ["A", "B", "C"]:
+        codes.append(ErrorCode.invaliduserchoiceformat)
+    if context.assumptions_required and not rules.contains_assumption_block(text):
+        codes.append(ErrorCode.assumptionsnotsurfaced)
+    if rules.contains_forbidden_authority(text):
+        codes.append(ErrorCode.forbiddenauthoritativephrasing)
+    if context.memory_write_attempted:
+        if not context.memory_confirmation_asked:
+            codes.append(ErrorCode.memorywritewithoutconfirmation)
+        if not context.memory_scope:
+            codes.append(ErrorCode.memorywithoutscope)
+    if not rules.addresses_user_intent(text, context.user_intent):
+        codes.append(ErrorCode.intentnotaddressed)
+    if context.contains_medium_or_low_confidence_claims and not rules.contains_uncertainty_language(text):
+        codes.append(ErrorCode.uncertaintynotdisclosed)
+    if not rules.contains_next_steps_or_explicit_stop(text):
+        codes.append(ErrorCode.nextstepsnotclear)
+    return codes
+
+
+FRAGMENTS = [
+    "[HIGH] Python is a language.",
+    "This will definitely work.",
+    "[LOW] This will definitely work.\n",
+    "Is this clear?",
+    "A) one B) two C) three",
+    "A) again",
+    "about 50 % of cases",
+    "You must do this.",
+    "Next step: learn error handling.",
+    "I assume Python 3.",
+    "İ",
+]
+
+CONTEXTS = [
+    base_context(),
+    base_context(token_count=5000),
+    base_context(uncertainty_level=UncertaintyLevel.LEVEL_3),
+    base_context(uncertainty_level=UncertaintyLevel.LEVEL_4, assumptions_required=True),
+    base_context(memory_write_attempted=True),
+    base_context(contains_medium_or_low_confidence_claims=True, user_intent="zzz"),
+]
+
+
+def test_validate_all_reports_every_rule_and_agrees_with_validate(validator):
+    rng = random.Random(5)
+
+    for _ in range(300):
+        text = " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 6)))
+        for context in CONTEXTS:
+            full = validator.validate_all(text, context)
+            first = validator.validate(text, context)
+
+            assert full.status == first.status
+            assert full.error_code == first.error_code
+            assert full.message == first.message
+            assert [v.error_code for v in full.violations] == expected_codes(text, context)
+
+
+def test_spans_locate_offending_text(validator):
+    text = "[HIGH] Python is fine. It will definitely work. You must retry at 50 %."
+    result = validator.validate_all(text, base_context())
+
+    by_code = {v.error_code: v for v in result.violations}
+
+    claims = by_code[ErrorCode.missingconfidencelabel].spans
+    assert [text[a:b] for a, b in claims] == [
+        "It will definitely work",
+        "You must retry at 50 %",
+    ]
+
+    (authority,) = by_code[ErrorCode.forbiddenauthoritativephrasing].spans
+    assert text[authority[0]:authority[1]] == "You must"
+
+    (percent,) = by_code[ErrorCode.percentageinchoice].spans
+    assert text[percent[0]:percent[1]] == "50 %"
+
+    assert by_code[ErrorCode.nextstepsnotclear].spans == ()
+    assert by_code[ErrorCode.nextstepsnotclear].message
+
+
+def test_low_line_spans(validator):
+    text = "[HIGH] ok\r\n[LOW] you should act\nend"
+    result = validator.validate_all(text, base_context())
+    by_code = {v.error_code: v for v in result.violations}
+
+    (line,) = by_code[ErrorCode.lowconfidenceasserted].spans
+    assert text[line[0]:line[1]] == "[LOW] you should act"
+
+
+def test_accepted_has_no_violations(validator):
+    text = "[HIGH] Python error handling uses try blocks. Next step: practice."
+    result = validator.validate_all(text, base_context())
+
+    assert result.status == "ACCEPTED"
+    assert result.violations == ()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[HIGH] python undenİably. next step: go",
+        "[HIGH] python undeniably İ. next step: go",
+        "[HIGH] İstanbul python. ẞ you must go. next step: go",
+        "[HIGH] python KLEARLY ﬁne. next step: go",
+        "[HIGH] python Clearly İİ. next step: go",
+    ],
+)
+def test_validate_all_matches_validate_on_non_ascii_case_folding(validator, text):
+    context = base_context()
+
+    full = validator.validate_all(text, context)
+    single = validator.validate(text, context)
+
+    assert (full.status, full.error_code, full.message) == (
+        single.status, single.error_code, single.message,
+    )
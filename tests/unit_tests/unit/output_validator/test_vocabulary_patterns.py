@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from output_validator.rules import (
+    compile_vocabulary,
+    ASSERTIVE_TERMS,
+    LOW_ASSERTIVE_TERMS,
+    AUTHORITY_PHRASES,
+    ASSUMPTION_PHRASES,
+    UNCERTAINTY_TERMS,
+    NEXT_STEP_PHRASES,
+    ASSERTIVE_PATTERN,
+    LOW_ASSERTIVE_PATTERN,
+    AUTHORITY_PATTERN,
+    ASSUMPTION_PATTERN,
+    UNCERTAINTY_PATTERN,
+    NEXT_STEP_PATTERN,
+)
+
+
+VOCABULARIES = [
+    (ASSERTIVE_TERMS, ASSERTIVE_PATTERN),
+    (LOW_ASSERTIVE_TERMS, LOW_ASSERTIVE_PATTERN),
+    (AUTHORITY_PHRASES, AUTHORITY_PATTERN),
+    (ASSUMPTION_PHRASES, ASSUMPTION_PATTERN),
+    (UNCERTAINTY_TERMS, UNCERTAINTY_PATTERN),
+    (NEXT_STEP_PHRASES, NEXT_STEP_PATTERN),
+]
+
+
+@pytest.mark.parametrize("terms, pattern", VOCABULARIES)
+def test_pattern_matches_iff_any_term_is_substring(terms, pattern):
+    rng = random.Random(7)
+    pieces = terms + ["the", " ", "x", "is", "will", "you", "might be", "."]
+
+    for _ in range(500):
+        s = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 5)))
+        assert bool(pattern.search(s)) == any(term in s for term in terms)
+
+
+def test_prefix_terms_are_all_reachable():
+    pattern = compile_vocabulary(["you", "you must", "your"])
+
+    assert pattern.search("you")
+    assert pattern.search("your")
+    assert pattern.search("you must")
+    assert not pattern.search("yo")
+
+
+def test_special_characters_are_escaped():
+    pattern = compile_vocabulary(["[low]", "a.b"])
+
+    assert pattern.search("x [low] y")
+    assert not pattern.search("l")
+    assert not pattern.search("axb")
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from pacing_controller.budget import AdaptiveBudget, QuantileSketch
+from pacing_controller.controller import PacingController
+from pacing_controller.enums import PacingMode
+from policy_engine.policy_engine import PolicyEngine
+
+
+@pytest.fixture
+def policy_engine():
+    return PolicyEngine("policy_v1.3.2.yaml")
+
+
+# ---------------------------------------------------------------------
+# QUANTILE SKETCH
+# ---------------------------------------------------------------------
+
+@pytest.mark.parametrize("q", [0.5, 0.9, 0.95, 0.99])
+def test_sketch_quantile_is_conservative_and_close(q):
+    rng = random.Random(0)
+    values = [rng.lognormvariate(6, 0.6) for _ in range(5000)]
+    sketch = QuantileSketch(relative_accuracy=0.02)
+    for value in values:
+        sketch.add(value)
+
+    exact = sorted(values)[int(q * (len(values) - 1))]
+    estimate = sketch.quantile(q)
+
+    assert exact <= estimate <= exact * 1.05
+
+
+def test_empty_sketch_has_no_quantile():
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_sketch_rejects_negative_values():
+    with pytest.raises(ValueError):
+        QuantileSketch().add(-1)
+
+
+# ---------------------------------------------------------------------
+# CONTROLLER INTEGRATION
+# ---------------------------------------------------------------------
+
+def test_without_budget_max_tokens_is_hard_cap(policy_engine):
+    pacing_controller = PacingController(policy_engine)
+    limits = pacing_controller.get_limits(PacingMode.CAREFUL)
+
+    assert pacing_controller.prepare_request(PacingMode.CAREFUL)["max_tokens"] == limits.hard_cap_tokens
+
+
+def test_hard_cap_until_enough_observations(policy_engine):
+    pacing_controller = PacingController(
+        policy_engine, adaptive_budget=AdaptiveBudget(min_observations=10)
+    )
+    for _ in range(9):
+        pacing_controller.observe_output_tokens(PacingMode.CAREFUL, 400)
+
+    decision = pacing_controller.budget_for(PacingMode.CAREFUL)
+
+    assert not decision.adaptive
+    assert decision.max_tokens == decision.hard_cap_tokens
+
+
+def test_budget_follows_observed_outputs(policy_engine):
+    pacing_controller = PacingController(
+        policy_engine,
+        adaptive_budget=AdaptiveBudget(percentile=0.95, headroom=1.2, min_observations=10),
+    )
+    for tokens in range(300, 500, 10):
+        pacing_controller.observe_output_tokens(PacingMode.CAREFUL, tokens)
+
+    max_tokens = pacing_controller.prepare_request(PacingMode.CAREFUL)["max_tokens"]
+
+    assert 490 * 1.2 <= max_tokens < 5000 / 5
+
+
+def test_budget_never_exceeds_hard_cap(policy_engine):
+    pacing_controller = PacingController(
+        policy_engine, adaptive_budget=AdaptiveBudget(min_observations=1, headroom=3)
+    )
+    limits = pacing_controller.get_limits(PacingMode.NORMAL)
+    pacing_controller.observe_output_tokens(PacingMode.NORMAL, limits.hard_cap_tokens * 10)
+
+    assert pacing_controller.budget_for(PacingMode.NORMAL).max_tokens == limits.hard_cap_tokens
+
+
+def test_truncated_outputs_grow_the_budget(policy_engine):
+    pacing_controller = PacingController(
+        policy_engine,
+        adaptive_budget=AdaptiveBudget(percentile=0.5, min_observations=1),
+    )
+    for _ in range(5):
+        pacing_controller.observe_output_tokens(PacingMode.CAREFUL, 400)
+    tight = pacing_controller.budget_for(PacingMode.CAREFUL).max_tokens
+
+    for _ in range(10):
+        pacing_controller.observe_output_tokens(
+            PacingMode.CAREFUL, tight, requested_max_tokens=tight
+        )
+
+    assert pacing_controller.budget_for(PacingMode.CAREFUL).max_tokens == 5000
+
+
+def test_budgets_are_kept_per_context_key(policy_engine):
+    pacing_controller = PacingController(
+        policy_engine, adaptive_budget=AdaptiveBudget(min_observations=1, min_tokens=1)
+    )
+    pacing_controller.observe_output_tokens(PacingMode.CAREFUL, 300, context_key="chat")
+    pacing_controller.observe_output_tokens(PacingMode.CAREFUL, 3000, context_key="code")
+
+    chat = pacing_controller.budget_for(PacingMode.CAREFUL, "chat").max_tokens
+    code = pacing_controller.budget_for(PacingMode.CAREFUL, "code").max_tokens
+
+    assert chat < code
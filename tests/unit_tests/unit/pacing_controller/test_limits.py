@@ -86,4 +86,15 @@ def test_requesting_unknown_mode_fails(pacing_controller):
         value = "fake"
 
     with pytest.raises(Exception):
-        pacing_controller.get_limits(FakeMode())
\ No newline at end of file
+        pacing_controller.get_limits(FakeMode())
+
+def test_get_limits_returns_frozen_shared_instance(pacing_controller):
+    """
+    PacingLimits is frozen, so get_limits hands out the stored instance.
+    """
+
+    limits = pacing_controller.get_limits(PacingMode.NORMAL)
+
+    assert limits is pacing_controller.get_limits(PacingMode.NORMAL)
+    with pytest.raises(Exception):
+        limits.target_tokens = 1
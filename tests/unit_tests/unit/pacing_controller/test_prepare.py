@@ -100,4 +100,30 @@ def test_prepare_request_invalid_mode_fails(pacing_controller):
         pacing_controller.prepare_request(
             mode=FakeMode(),
             user_choice=None,
-        )
\ No newline at end of file
+        )
+
+# ---------------------------------------------------------------------
+# PRECOMPUTED INSTRUCTIONS — NO PER-TURN WORK
+# ---------------------------------------------------------------------
+
+def test_instruction_prefix_is_precomputed_per_mode(pacing_controller):
+    """
+    prepare_request must hand out the instruction built at construction.
+    """
+
+    first = pacing_controller.prepare_request(PacingMode.CAREFUL)
+    second = pacing_controller.prepare_request(PacingMode.CAREFUL)
+
+    assert first["instruction_prefix"] is second["instruction_prefix"]
+    assert first["instruction_prefix"] == pacing_controller.build_mode_instruction(PacingMode.CAREFUL)
+
+
+def test_deliberative_instruction_tracks_step(pacing_controller):
+    """
+    DELIBERATIVE instructions must still reflect the current step.
+    """
+
+    for step in range(pacing_controller.MAX_DELIBERATIVE_TURNS + 3):
+        pacing_controller.deliberative_turn_count = step
+        instruction = pacing_controller.prepare_request(PacingMode.DELIBERATIVE)["instruction_prefix"]
+        assert instruction.startswith(f"This is step {step + 1} of")
@@ -0,0 +1,160 @@
+import threading
+
+import pytest
+
+from pacing_controller.controller import PacingController
+from pacing_controller.enums import PacingMode
+from pacing_controller.session_state import SWEEP_INTERVAL, SessionPacingStore
+from policy_engine.policy_engine import PolicyEngine
+
+
+class ManualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return ManualClock()
+
+
+@pytest.fixture
+def pacing_controller(clock):
+    policy_engine = PolicyEngine("policy_v1.3.2.yaml")
+    return PacingController(policy_engine, session_ttl_seconds=60, clock=clock)
+
+
+def continue_step(pacing_controller, session_id):
+    limits = pacing_controller.get_limits(PacingMode.DELIBERATIVE)
+    return pacing_controller.evaluate_output(
+        PacingMode.DELIBERATIVE,
+        "",
+        token_count=limits.target_tokens,
+        session_id=session_id,
+    )
+
+
+# ---------------------------------------------------------------------
+# ISOLATION — ONE CONTROLLER, MANY SESSIONS
+# ---------------------------------------------------------------------
+
+def test_sessions_do_not_share_deliberative_steps(pacing_controller):
+    continue_step(pacing_controller, "a")
+    continue_step(pacing_controller, "a")
+    continue_step(pacing_controller, "b")
+
+    assert pacing_controller.deliberative_turns("a") == 2
+    assert pacing_controller.deliberative_turns("b") == 1
+    assert pacing_controller.deliberative_turn_count == 0
+
+
+def test_instruction_reflects_session_step(pacing_controller):
+    continue_step(pacing_controller, "a")
+
+    a = pacing_controller.prepare_request(PacingMode.DELIBERATIVE, session_id="a")
+    b = pacing_controller.prepare_request(PacingMode.DELIBERATIVE, session_id="b")
+
+    assert a["instruction_prefix"].startswith("This is step 2 of")
+    assert b["instruction_prefix"].startswith("This is step 1 of")
+
+
+def test_max_turns_enforced_per_session(pacing_controller):
+    for _ in range(pacing_controller.MAX_DELIBERATIVE_TURNS):
+        assert continue_step(pacing_controller, "a").must_continue_in_next_turn
+
+    assert not continue_step(pacing_controller, "a").must_continue_in_next_turn
+    assert continue_step(pacing_controller, "b").must_continue_in_next_turn
+
+
+def test_reset_session_forgets_progress(pacing_controller):
+    continue_step(pacing_controller, "a")
+    pacing_controller.reset_session("a")
+
+    assert pacing_controller.deliberative_turns("a") == 0
+
+
+# ---------------------------------------------------------------------
+# TTL EVICTION
+# ---------------------------------------------------------------------
+
+def test_idle_session_expires(pacing_controller, clock):
+    continue_step(pacing_controller, "a")
+    clock.now += 61
+
+    assert pacing_controller.deliberative_turns("a") == 0
+
+
+def test_active_session_is_kept(pacing_controller, clock):
+    for _ in range(3):
+        clock.now += 50
+        continue_step(pacing_controller, "a")
+
+    assert pacing_controller.deliberative_turns("a") == 3
+
+
+def test_sweep_drops_idle_sessions(clock):
+    store = SessionPacingStore(ttl_seconds=10, clock=clock)
+    for i in range(SWEEP_INTERVAL - 1):
+        store.get(f"old-{i}")
+    clock.now += 11
+
+    store.get("new")
+
+    assert len(store) == 1
+    assert "new" in store
+
+
+def test_store_is_bounded(clock):
+    store = SessionPacingStore(ttl_seconds=1000, max_sessions=3, clock=clock)
+    for i in range(5):
+        clock.now += 1
+        store.get(f"s{i}")
+
+    assert len(store) == 3
+    assert "s4" in store and "s0" not in store
+
+
+def test_bounded_store_evicts_least_recently_seen(clock):
+    store = SessionPacingStore(ttl_seconds=1000, max_sessions=3, clock=clock)
+    for session_id in ("s0", "s1", "s2", "s0", "s3"):
+        clock.now += 1
+        store.get(session_id)
+
+    assert len(store) == 3
+    assert "s0" in store and "s1" not in store
+
+
+def test_invalid_store_arguments_rejected():
+    with pytest.raises(ValueError):
+        SessionPacingStore(ttl_seconds=0)
+    with pytest.raises(ValueError):
+        SessionPacingStore(max_sessions=0)
+
+
+# ---------------------------------------------------------------------
+# CONCURRENCY
+# ---------------------------------------------------------------------
+
+def test_concurrent_sessions_keep_their_own_counts():
+    policy_engine = PolicyEngine("policy_v1.3.2.yaml")
+    pacing_controller = PacingController(policy_engine)
+    sessions = [f"session-{i}" for i in range(200)]
+
+    def worker(owned):
+        for session_id in owned:
+            for _ in range(3):
+                continue_step(pacing_controller, session_id)
+
+    threads = [
+        threading.Thread(target=worker, args=(sessions[i::8],))
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(pacing_controller.deliberative_turns(s) == 3 for s in sessions)
@@ -0,0 +1,144 @@
+import pytest
+
+from llm_executor.adapters.base import BaseLLMAdapter
+from llm_executor.executor import LLMExecutor
+from llm_executor.models import LLMRequest
+from llm_executor.prompt_builder import build_prompt
+from pacing_controller.controller import PacingController
+from pacing_controller.enums import PacingMode
+from pacing_controller.errors import TokenLimitExceededError
+from pacing_controller.models import PacingLimits
+from pacing_controller.streaming import StreamingCapGuard
+from policy_engine.policy_engine import PolicyEngine
+from tokenizer_service.service import TokenizerService
+
+
+class WordEncoder:
+    def encode(self, text):
+        return text.split()
+
+
+def word_service():
+    service = TokenizerService(default_model="words")
+    service.register_encoder("words", WordEncoder())
+    return service
+
+
+LIMITS = PacingLimits(target_tokens=3, hard_cap_tokens=5, multiturn=False)
+
+
+class StreamingAdapter(BaseLLMAdapter):
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.yielded = 0
+        self.closed = False
+
+    def generate(self, prompt, max_tokens):
+        raise AssertionError("not used")
+
+    def stream(self, prompt, max_tokens):
+        try:
+            for chunk in self.chunks:
+                self.yielded += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def request():
+    return LLMRequest(
+        system_instruction="Do the task.",
+        user_content="User input here.",
+        pacing_mode=PacingMode.NORMAL,
+        token_limit=5,
+        forbidden_patterns=[],
+        claim_label_required=False,
+    )
+
+
+def test_target_reported_once_then_continue():
+    guard = StreamingCapGuard(LIMITS, service=word_service())
+
+    actions = [guard.observe(chunk).action for chunk in ["a ", "b ", "c ", "d "]]
+
+    assert actions == ["CONTINUE", "CONTINUE", "TARGET_REACHED", "CONTINUE"]
+    assert guard.tokens == 4
+
+
+def test_stop_when_cap_crossed():
+    guard = StreamingCapGuard(LIMITS, service=word_service())
+    for chunk in ["a b c d e", " f"]:
+        decision = guard.observe(chunk)
+
+    assert decision.action == "STOP"
+    assert decision.must_stop
+    assert decision.tokens == 6
+    assert guard.stopped
+    # Sticky
+    assert guard.observe(" g").action == "STOP"
+
+
+def test_cut_keeps_longest_prefix_within_cap():
+    guard = StreamingCapGuard(LIMITS, on_cap="CUT", service=word_service())
+    guard.observe("a b c ")
+    decision = guard.observe("d e f g")
+
+    assert decision.action == "CUT_AT_CAP"
+    assert decision.tokens == 5
+    assert ("a b c " + "d e f g")[:decision.keep_chars].split() == ["a", "b", "c", "d", "e"]
+
+
+def test_invalid_on_cap_rejected():
+    with pytest.raises(ValueError):
+        StreamingCapGuard(LIMITS, on_cap="TRUNCATE")
+
+
+def test_executor_stops_stream_at_cap():
+    adapter = StreamingAdapter(["a b ", "c d ", "e f ", "g h ", "i j "])
+    guard = StreamingCapGuard(LIMITS, service=word_service())
+
+    with pytest.raises(TokenLimitExceededError):
+        LLMExecutor(adapter).execute_streaming(request(), guard)
+
+    assert adapter.yielded == 3
+    assert adapter.closed
+
+
+def test_executor_cut_returns_text_within_cap():
+    adapter = StreamingAdapter(["a b ", "c d ", "e f ", "g h "])
+    guard = StreamingCapGuard(LIMITS, on_cap="CUT", service=word_service())
+
+    response = LLMExecutor(adapter).execute_streaming(request(), guard)
+
+    assert response.text.split() == ["a", "b", "c", "d", "e"]
+    assert response.token_usage_output == 5
+    assert response.raw_provider_response["cut_at_cap"]
+    assert response.raw_provider_response["decision"].action == "CUT_AT_CAP"
+    assert adapter.yielded == 3
+
+
+def test_executor_returns_full_text_under_cap():
+    adapter = StreamingAdapter(["a b ", "c"])
+    guard = StreamingCapGuard(LIMITS, service=word_service())
+
+    response = LLMExecutor(adapter).execute_streaming(request(), guard)
+
+    assert response.text == "a b c"
+    assert not response.raw_provider_response["cut_at_cap"]
+
+
+def test_controller_builds_guard_from_mode_limits():
+    pacing = PacingController(PolicyEngine("policy_v1.3.2.yaml"))
+    guard = pacing.streaming_guard(PacingMode.CAREFUL)
+
+    assert guard.limits == pacing.get_limits(PacingMode.CAREFUL)
+
+
+def test_executor_counts_prompt_with_tokenizer_service():
+    adapter = StreamingAdapter(["a b ", "c"])
+    guard = StreamingCapGuard(LIMITS, service=word_service())
+    executor = LLMExecutor(adapter, tokenizer_service=word_service())
+
+    response = executor.execute_streaming(request(), guard)
+
+    assert response.token_usage_input == len(build_prompt(request()).split())
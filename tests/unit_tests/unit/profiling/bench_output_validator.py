@@ -0,0 +1,349 @@
+"""
+Fuzz + throughput benchmark for output_validator.
+
+Generates synthetic responses (100 to 20k tokens) with controlled
+densities of confidence labels, assertive terms and questions, then:
+
+1. Fuzz:       checks validate() == validate_sequential() on every
+               generated response (str and UTF-8 bytes input)
+2. Per rule:   mean ns per rule evaluation (ValidatorMetrics), on
+               responses that pass every rule so every rule runs;
+               shared signals (the lowercase copy) are reported apart
+3. End to end: p50 / p99 latency and tokens/sec per size and profile,
+               for validate() and for validate_sequential() on the
+               same texts (the fused path must not be slower)
+
+Latencies are stored relative to a fixed pure-Python calibration
+workload, so a baseline recorded on one machine stays meaningful on
+another of similar architecture. No network, no model calls.
+
+Run:
+    python -m tests.unit_tests.unit.profiling.bench_output_validator
+    python -m tests.unit_tests.unit.profiling.bench_output_validator --update-baseline
+
+Exits 1 if any p99 regresses beyond --tolerance against the baseline,
+or if the fused p50 is above the sequential p50 (suspected regressions
+are re-measured --retries times first, keeping the best run, so one
+noisy run does not fail the build).
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from output_validator.validator import OutputValidator
+from orchestrator.models import OrchestratorContext
+from uncertainty_engine.enums import UncertaintyLevel
+from policy_engine.policy_engine import PolicyEngine
+from pacing_controller.tokenizer import estimate_tokens
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "output_validator_baseline.json")
+DEFAULT_TOLERANCE = 0.5
+# Suspected regressions are re-measured; the best run counts
+DEFAULT_RETRIES = 2
+BASELINE_RUNS = 5
+DEFAULT_SIZES = (100, 1_000, 5_000, 20_000)
+
+WORDS = [
+    "python", "error", "handling", "function", "returns", "value", "when",
+    "input", "exception", "raised", "this", "code", "path", "because",
+    "retry", "the", "a", "of", "loop", "cache", "list", "request",
+]
+ASSERTIVE = ["is", "are", "will", "works", "means"]
+LABELS = ["[HIGH]", "[MEDIUM]", "[LOW]"]
+
+
+@dataclass(frozen=True)
+class Profile:
+    label_density: float      # share of assertive sentences that get a label
+    assertive_density: float  # share of sentences with an assertive term
+    question_density: float   # share of sentences ending in "?"
+
+
+PROFILES: Dict[str, Profile] = {
+    # Every rule passes, so every rule runs
+    "accepted": Profile(label_density=1.0, assertive_density=0.5, question_density=0.1),
+    # Realistic mix: early rejections on unlabelled claims
+    "mixed": Profile(label_density=0.7, assertive_density=0.5, question_density=0.1),
+}
+
+CONTEXT = OrchestratorContext(
+    uncertainty_level=UncertaintyLevel.LEVEL_1_2,
+    memory_write_attempted=False,
+    memory_confirmation_asked=False,
+    memory_scope=None,
+    token_count=100,
+    token_limit=10**9,
+    user_intent="python error handling",
+    assumptions_required=False,
+    contains_medium_or_low_confidence_claims=True,
+)
+
+
+def generate_response(tokens: int, profile: Profile, seed: int = 0) -> str:
+    """
+    Synthetic response of about `tokens` tokens. Low-confidence lines
+    never use definitive wording, and the response ends with
+    uncertainty language and a next step, so only the densities decide
+    which rules fire.
+    """
+    rng = random.Random(seed)
+    sentences: List[str] = []
+    chars = 0
+    budget = tokens * 4  # estimate_tokens is ~4 chars per token
+
+    while chars < budget:
+        words = [rng.choice(WORDS) for _ in range(rng.randint(6, 14))]
+        if rng.random() < profile.assertive_density:
+            words.insert(rng.randint(1, len(words) - 1), rng.choice(ASSERTIVE))
+            if rng.random() < profile.label_density:
+                words.insert(0, rng.choice(LABELS))
+        end = "?" if rng.random() < profile.question_density else "."
+        sentence = " ".join(words) + end
+        sentences.append(sentence)
+        chars += len(sentence) + 1
+
+    sentences.append("This might depend on your setup. Next step: try it.")
+    return "\n".join(sentences)
+
+
+def calibrate(repeat: int = 9) -> int:
+    """Fastest ns of a fixed pure-Python workload (machine speed unit)."""
+    text = " ".join(WORDS) * 200
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(20):
+            sum(len(word) for word in text.lower().split())
+        timings.append(time.perf_counter_ns() - start)
+    return min(timings)
+
+
+def _percentile(values: List[int], q: float) -> int:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def fuzz(validator: OutputValidator, sizes, seeds: int) -> int:
+    """Fused / sequential parity on every generated response."""
+    checked = 0
+    for size in sizes:
+        for profile in PROFILES.values():
+            for seed in range(seeds):
+                text = generate_response(size, profile, seed)
+                expected = validator.validate_sequential(text, CONTEXT)
+                for candidate in (text, text.encode("utf-8")):
+                    actual = validator.validate(candidate, CONTEXT)
+                    if actual != expected:
+                        raise AssertionError(
+                            f"Fused / sequential mismatch (size={size}, seed={seed}): "
+                            f"{actual.error_code} != {expected.error_code}"
+                        )
+                checked += 1
+    return checked
+
+
+def bench(
+    sizes=DEFAULT_SIZES,
+    iterations: int = 100,
+    seeds: int = 3,
+) -> dict:
+    policy_engine = PolicyEngine("policy_v1.3.2.yaml")
+    validator = OutputValidator(policy_engine, cache_size=0)
+
+    results = {
+        "calibration_ns": calibrate(),
+        "fuzz_checked": fuzz(validator, sizes, seeds),
+        "end_to_end": {},
+        "per_rule_ns": {},
+    }
+
+    # End to end
+    for size in sizes:
+        for name, profile in PROFILES.items():
+            texts = [generate_response(size, profile, seed) for seed in range(seeds)]
+            tokens = sum(estimate_tokens(text) for text in texts) / len(texts)
+
+            # Interleaved, so both paths see the same machine noise
+            latencies = []
+            sequential = []
+            gc.collect()
+            gc.disable()
+            try:
+                for i in range(iterations):
+                    text = texts[i % len(texts)]
+                    validator._last_claims = None  # no index reused from a previous call
+                    start = time.perf_counter_ns()
+                    validator.validate(text, CONTEXT)
+                    latencies.append(time.perf_counter_ns() - start)
+
+                    start = time.perf_counter_ns()
+                    validator.validate_sequential(text, CONTEXT)
+                    sequential.append(time.perf_counter_ns() - start)
+            finally:
+                gc.enable()
+
+            mean_ns = statistics.mean(latencies)
+            results["end_to_end"][f"{name}/{size}"] = {
+                "tokens": int(tokens),
+                "p50_ns": _percentile(latencies, 0.50),
+                "p99_ns": _percentile(latencies, 0.99),
+                "tokens_per_second": round(tokens / (mean_ns / 1e9)),
+                "sequential_p50_ns": _percentile(sequential, 0.50),
+                "sequential_p99_ns": _percentile(sequential, 0.99),
+            }
+
+    # Per rule: every rule runs on "accepted" responses
+    metered = OutputValidator(policy_engine, cache_size=0, metrics_enabled=True)
+    for size in sizes:
+        text = generate_response(size, PROFILES["accepted"])
+        for _ in range(iterations):
+            metered._last_claims = None
+            metered.validate(text, CONTEXT)
+    results["per_rule_ns"] = {
+        error_code.value: round(stats.mean_ns)
+        for error_code, stats in sorted(
+            metered.metrics.rule_stats().items(), key=lambda item: item[0].value
+        )
+    }
+    results["shared_signals_ns"] = round(metered.metrics.signal_stats().mean_ns)
+
+    return results
+
+
+def relative_p99(results: dict) -> Dict[str, float]:
+    unit = results["calibration_ns"]
+    return {
+        key: round(entry["p99_ns"] / unit, 4)
+        for key, entry in results["end_to_end"].items()
+    }
+
+
+def relative_sequential_p99(results: dict) -> Dict[str, float]:
+    unit = results["calibration_ns"]
+    return {
+        key: round(entry["sequential_p99_ns"] / unit, 4)
+        for key, entry in results["end_to_end"].items()
+    }
+
+
+def find_slower_than_sequential(results: dict) -> List[str]:
+    """Keys whose fused p50 is above the sequential p50."""
+    return [
+        f"{key}: fused p50 {entry['p50_ns'] / 1e6:.3f} ms > "
+        f"sequential p50 {entry['sequential_p50_ns'] / 1e6:.3f} ms"
+        for key, entry in results["end_to_end"].items()
+        if entry["p50_ns"] > entry["sequential_p50_ns"]
+    ]
+
+
+def find_regressions(
+    current: Dict[str, float],
+    baseline: Dict[str, float],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """Keys whose relative p99 exceeds baseline * (1 + tolerance)."""
+    regressions = []
+    for key, allowed in baseline.items():
+        value = current.get(key)
+        if value is not None and value > allowed * (1 + tolerance):
+            regressions.append(f"{key}: p99 {value:.3f} > baseline {allowed:.3f} (+{tolerance:.0%})")
+    return regressions
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Optional[Dict[str, float]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["relative_p99"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.unit_tests.unit.profiling.bench_output_validator",
+    )
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = bench(iterations=args.iterations)
+    current = relative_p99(results)
+
+    print(f"fuzz: {results['fuzz_checked']} responses, fused == sequential")
+    print(f"calibration unit: {results['calibration_ns'] / 1e6:.2f} ms")
+    for key, entry in results["end_to_end"].items():
+        print(
+            f"{key:16s} {entry['tokens']:6d} tok  "
+            f"p50 {entry['p50_ns'] / 1e6:8.3f} ms  "
+            f"p99 {entry['p99_ns'] / 1e6:8.3f} ms  "
+            f"{entry['tokens_per_second']:>10,d} tok/s  "
+            f"(sequential p50 {entry['sequential_p50_ns'] / 1e6:8.3f} ms)"
+        )
+    print(f"  {'(shared signals)':34s} {results['shared_signals_ns'] / 1e3:9.1f} us/call")
+    for rule, mean_ns in results["per_rule_ns"].items():
+        print(f"  {rule:34s} {mean_ns / 1e3:9.1f} us/call")
+
+    if args.update_baseline:
+        # Median of several runs, so the baseline is not a lucky one
+        runs = [results] + [
+            bench(iterations=args.iterations)
+            for _ in range(BASELINE_RUNS - 1)
+        ]
+
+        def median_of(relative) -> Dict[str, float]:
+            values = [relative(run) for run in runs]
+            return {key: statistics.median(value[key] for value in values) for key in current}
+
+        stored = {
+            "relative_p99": median_of(relative_p99),
+            # Reference only: the fused path is checked against this
+            "sequential_relative_p99": median_of(relative_sequential_p99),
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written: {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print("no baseline stored (run with --update-baseline)")
+
+    def check() -> List[str]:
+        found = find_slower_than_sequential(results)
+        if baseline is not None:
+            found += find_regressions(current, baseline, args.tolerance)
+        return found
+
+    regressions = check()
+    for _ in range(args.retries):
+        if not regressions:
+            break
+        rerun = bench(iterations=args.iterations)
+        rerun_p99 = relative_p99(rerun)
+        current = {key: min(value, rerun_p99.get(key, value)) for key, value in current.items()}
+        for key, entry in rerun["end_to_end"].items():
+            kept = results["end_to_end"][key]
+            if entry["p50_ns"] - entry["sequential_p50_ns"] < kept["p50_ns"] - kept["sequential_p50_ns"]:
+                results["end_to_end"][key] = entry
+        regressions = check()
+
+    for line in regressions:
+        print("REGRESSION " + line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
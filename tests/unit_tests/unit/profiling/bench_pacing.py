@@ -0,0 +1,68 @@
+"""
+Microbenchmark: per-turn PacingController overhead.
+
+One turn is what the orchestrator pays per request:
+
+    get_limits -> prepare_request -> evaluate_output
+
+measured for each mode, with evaluate_output given a running token count
+(no tokenizer cost, so only the controller's own overhead is timed).
+The "deepcopy" column reproduces the previous get_limits, which returned
+deepcopy(limits) on every call and formatted the instruction per turn.
+
+Run:
+    python -m tests.unit_tests.unit.profiling.bench_pacing
+"""
+
+import timeit
+from copy import deepcopy
+
+from pacing_controller.controller import PacingController
+from pacing_controller.enums import PacingMode
+from policy_engine.policy_engine import PolicyEngine
+
+
+NUMBER = 20_000
+
+
+def turn(pacing: PacingController, mode: PacingMode) -> None:
+    limits = pacing.get_limits(mode)
+    pacing.prepare_request(mode)
+    pacing.evaluate_output(mode, "", token_count=limits.target_tokens // 2)
+
+
+def legacy_turn(pacing: PacingController, mode: PacingMode) -> None:
+    # Three deep copies (one per call site) plus per-turn formatting
+    limits = deepcopy(pacing._limits_by_mode[mode])
+    prepared = deepcopy(pacing._limits_by_mode[mode])
+    {
+        "max_tokens": prepared.hard_cap_tokens,
+        "instruction_prefix": (
+            "Produce a concise response.\n"
+            f"Target {prepared.target_tokens} tokens.\n"
+            f"Hard cap {prepared.hard_cap_tokens} tokens.\n"
+            "Never split across turns."
+        ),
+    }
+    deepcopy(pacing._limits_by_mode[mode])
+    limits.target_tokens // 2 > limits.hard_cap_tokens
+
+
+def main() -> None:
+    pacing = PacingController(PolicyEngine("policy_v1.3.2.yaml"))
+
+    print(f"{'mode':14s} {'deepcopy':>12s} {'current':>12s} {'speedup':>8s}")
+    for mode in PacingMode:
+        legacy = min(timeit.repeat(lambda: legacy_turn(pacing, mode), number=NUMBER, repeat=5))
+        current = min(timeit.repeat(lambda: turn(pacing, mode), number=NUMBER, repeat=5))
+        pacing.deliberative_turn_count = 0
+        print(
+            f"{mode.value:14s} "
+            f"{legacy / NUMBER * 1e6:9.2f} us "
+            f"{current / NUMBER * 1e6:9.2f} us "
+            f"{legacy / current:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Microbenchmark: per-sentence vocabulary checks in output_validator.rules.
+
+Compares the original any(term in s ...) loops with the compiled
+vocabulary patterns on a synthetic ~5k-token response.
+
+Run:
+    python -m tests.unit_tests.unit.profiling.bench_rule_vocabularies
+"""
+
+import random
+import timeit
+
+from output_validator.rules import (
+    ASSERTIVE_TERMS,
+    LOW_ASSERTIVE_TERMS,
+    ASSERTIVE_PATTERN,
+    LOW_ASSERTIVE_PATTERN,
+    SENTENCE_SPLIT_PATTERN,
+)
+from pacing_controller.tokenizer import estimate_tokens
+
+
+WORDS = [
+    "python", "error", "handling", "the", "a", "function", "returns",
+    "value", "when", "input", "valid", "exception", "raised", "[HIGH]",
+    "[MEDIUM]", "this", "code", "path", "because", "of", "retry",
+]
+
+
+def build_response(target_tokens: int = 5000, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    sentences = []
+    while estimate_tokens(" ".join(sentences)) < target_tokens:
+        sentences.append(" ".join(rng.choice(WORDS) for _ in range(14)) + ".")
+    return "\n".join(sentences)
+
+
+def _sentences(text: str):
+    return [s.strip().lower() for s in SENTENCE_SPLIT_PATTERN.split(text) if s.strip()]
+
+
+def bench(number: int = 50) -> dict:
+    sentences = _sentences(build_response())
+    results = {}
+
+    for name, terms, pattern in (
+        ("assertive", ASSERTIVE_TERMS, ASSERTIVE_PATTERN),
+        ("low_assertive", LOW_ASSERTIVE_TERMS, LOW_ASSERTIVE_PATTERN),
+    ):
+        loop = timeit.timeit(
+            lambda: [any(t in s for t in terms) for s in sentences],
+            number=number,
+        )
+        compiled = timeit.timeit(
+            lambda: [pattern.search(s) is not None for s in sentences],
+            number=number,
+        )
+        results[name] = (loop, compiled)
+
+    return results
+
+
+def main() -> None:
+    for name, (loop, compiled) in bench().items():
+        print(
+            f"{name:14s} any-loop {loop * 1e3:8.2f} ms  "
+            f"compiled {compiled * 1e3:8.2f} ms  "
+            f"speedup {loop / compiled:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
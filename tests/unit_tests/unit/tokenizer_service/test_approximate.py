@@ -0,0 +1,147 @@
+import random
+import re
+
+import pytest
+
+from tokenizer_service.approximate import (
+    CLASSES,
+    DEFAULT_APPROXIMATION,
+    ApproximateEncoder,
+    calibrate,
+    histogram,
+)
+from tokenizer_service.incremental import IncrementalTokenCounter
+from tokenizer_service.service import TokenizerService
+
+
+# BPE-like stand-in: letter runs split every 6 chars, digits in groups
+# of 3, every non-ASCII character its own token
+_PIECES = re.compile(r" ?[A-Za-z]{1,6}| ?\d{1,3}| ?[^\sA-Za-z\d\x80-￿]+|\s+|[\x80-￿]")
+
+
+class CountingBpe:
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return _PIECES.findall(text)
+
+
+def corpus(seed, count=60):
+    rng = random.Random(seed)
+    kinds = [
+        lambda: " ".join(rng.choice(["error", "handling", "python", "a", "the", "retry"]) for _ in range(40)),
+        lambda: "def f(x):\n    return x[0] + {'k': 42}\n" * rng.randint(1, 5),
+        lambda: "数据处理错误 " * rng.randint(5, 30),
+        lambda: "Обработка ошибок в Python " * rng.randint(2, 10),
+        lambda: " ".join(str(rng.randint(0, 10**6)) for _ in range(30)),
+    ]
+    return [rng.choice(kinds)() for _ in range(count)]
+
+
+def test_histogram_counts_byte_classes():
+    counts = dict(zip(CLASSES, histogram("ab 12, é漢😀")))
+    assert counts == {"L": 2, "D": 2, "S": 2, "P": 1, "2": 1, "3": 1, "4": 1}
+
+
+def test_calibrated_bounds_hold_on_samples():
+    encoder = CountingBpe()
+    approximation = calibrate(encoder, corpus(0))
+
+    for text in corpus(0):
+        bounds = approximation.bounds(text)
+        exact = len(encoder.encode(text))
+        assert bounds.lower <= exact <= bounds.upper
+
+
+def test_calibrated_estimate_is_close_on_unseen_text():
+    encoder = CountingBpe()
+    approximation = calibrate(encoder, corpus(0, count=200))
+
+    errors = [
+        abs(approximation.estimate(text) - len(encoder.encode(text))) / len(encoder.encode(text))
+        for text in corpus(1)
+    ]
+    assert sum(errors) / len(errors) < 0.15
+
+
+def test_upper_bound_never_exceeds_utf8_bytes():
+    text = "漢" * 10
+    assert DEFAULT_APPROXIMATION.upper_bound(text) <= len(text.encode("utf-8"))
+
+
+def test_default_beats_four_chars_per_token_on_cjk():
+    text = "数据处理错误" * 20
+    # Old fallback: len // 4 + 1 == 31, far below one token per character
+    assert DEFAULT_APPROXIMATION.upper_bound(text) >= len(text)
+
+
+def test_check_limit_uses_exact_count_only_near_limit():
+    encoder = CountingBpe()
+    service = TokenizerService(default_model="bpe", cache_size=0)
+    service.register_encoder("bpe", encoder)
+    service.calibrate(corpus(0))
+    text = corpus(2, count=1)[0]
+    exact = len(encoder.encode(text))
+    encoder.calls = 0
+
+    far_above = service.check_limit(text, exact * 10)
+    far_below = service.check_limit(text, exact // 10)
+    assert far_above.within and not far_above.exact
+    assert not far_below.within and not far_below.exact
+    assert encoder.calls == 0
+
+    at_limit = service.check_limit(text, exact)
+    assert at_limit.within and at_limit.exact and at_limit.tokens == exact
+
+
+def test_calibrate_requires_exact_encoder():
+    service = TokenizerService(default_model="plain")
+    service.register_encoder("plain", ApproximateEncoder())
+    with pytest.raises(ValueError):
+        service.calibrate(["text"])
+
+
+def test_incremental_counter_matches_approximate_fallback():
+    service = TokenizerService(default_model="approx")
+    service.register_encoder("approx", ApproximateEncoder())
+    counter = IncrementalTokenCounter(service)
+    text = "Обработка ошибок: retry 3 times!\n" * 20
+
+    for i in range(0, len(text), 7):
+        counter.append(text[i:i + 7])
+
+    assert counter.tokens == service.count(text)
+
+
+def test_uncalibrated_check_limit_trusts_only_byte_ceiling():
+    encoder = CountingBpe()
+    service = TokenizerService(default_model="bpe", cache_size=0)
+    service.register_encoder("bpe", encoder)
+    text = "error handling " * 50
+
+    assert service.check_limit(text, len(text.encode("utf-8"))).exact is False
+    assert encoder.calls == 0
+
+    near = service.check_limit(text, len(encoder.encode(text)))
+    assert near.within and near.exact
+
+
+def test_uncalibrated_check_limit_never_rejects_on_estimate():
+    encoder = CountingBpe()
+    service = TokenizerService(default_model="bpe", cache_size=0)
+    service.register_encoder("bpe", encoder)
+    text = corpus(2, count=1)[0]
+    exact = len(encoder.encode(text))
+    encoder.calls = 0
+
+    # Clearly over, but only a calibrated lower bound may say so
+    over = service.check_limit(text, exact // 10)
+    assert not over.within and over.exact
+    assert encoder.calls == 1
+
+    service.calibrate(corpus(0))
+    encoder.calls = 0
+    assert not service.check_limit(text, exact // 10).exact
+    assert encoder.calls == 0
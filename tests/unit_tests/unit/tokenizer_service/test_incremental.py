@@ -0,0 +1,110 @@
+import random
+import re
+
+import pytest
+
+from tokenizer_service.encoders import ConservativeEncoder
+from tokenizer_service.incremental import MAX_TAIL_CHARS, IncrementalTokenCounter
+from tokenizer_service.service import TokenizerService
+from pacing_controller.controller import PacingController
+from pacing_controller.enums import PacingMode
+from pacing_controller.errors import TokenLimitExceededError
+from policy_engine.policy_engine import PolicyEngine
+
+
+# Same pre-split shape as tiktoken's cl100k pattern; one token per piece
+_PIECES = re.compile(r" ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+")
+
+
+class PretokenEncoder:
+    def __init__(self):
+        self.encoded_chars = 0
+
+    def encode(self, text):
+        self.encoded_chars += len(text)
+        return _PIECES.findall(text)
+
+
+def make_counter(encoder=None):
+    service = TokenizerService(default_model="bpe")
+    service.register_encoder("bpe", encoder or PretokenEncoder())
+    return IncrementalTokenCounter(service), service
+
+
+def random_text(rng, words=400):
+    vocabulary = ["python", "error", "x", "42", "1234", "a.b", "(try)", "\n", "  ", "it's"]
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def chunks(rng, text):
+    position = 0
+    while position < len(text):
+        step = rng.randint(1, 12)
+        yield text[position:position + step]
+        position += step
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_running_count_matches_full_count(seed):
+    rng = random.Random(seed)
+    counter, service = make_counter()
+    text = random_text(rng)
+
+    for chunk in chunks(rng, text):
+        counter.append(chunk)
+
+    assert counter.tokens == service.count(text)
+    assert counter.chars == len(text)
+    assert counter.exact
+
+
+def test_each_append_encodes_only_the_tail():
+    encoder = PretokenEncoder()
+    counter, _ = make_counter(encoder)
+    text = "word " * 5000
+
+    for chunk in chunks(random.Random(0), text):
+        counter.append(chunk)
+
+    # Linear, not quadratic, in the response length
+    assert encoder.encoded_chars < 10 * len(text)
+
+
+def test_conservative_fallback_is_exact():
+    service = TokenizerService(default_model="plain")
+    service.register_encoder("plain", ConservativeEncoder())
+    counter = IncrementalTokenCounter(service)
+    text = "abc " * 101
+
+    for chunk in chunks(random.Random(1), text):
+        counter.append(chunk)
+
+    assert counter.tokens == service.count(text)
+
+
+def test_forced_cut_never_undercounts():
+    counter, service = make_counter()
+    text = "x" * (MAX_TAIL_CHARS * 3)
+
+    for chunk in chunks(random.Random(2), text):
+        counter.append(chunk)
+
+    assert not counter.exact
+    assert counter.tokens >= service.count(text)
+
+
+def test_reset_starts_over():
+    counter, _ = make_counter()
+    counter.append("hello world")
+    counter.reset()
+
+    assert counter.tokens == 0
+    assert counter.chars == 0
+
+
+def test_evaluate_output_accepts_running_count():
+    pacing = PacingController(PolicyEngine("policy_v1.3.2.yaml"))
+    cap = pacing.get_limits(PacingMode.NORMAL).hard_cap_tokens
+
+    with pytest.raises(TokenLimitExceededError):
+        pacing.evaluate_output(PacingMode.NORMAL, "short", token_count=cap + 1)
@@ -0,0 +1,143 @@
+import sys
+import threading
+
+import pytest
+
+from tokenizer_service.approximate import DEFAULT_APPROXIMATION
+from tokenizer_service.encoders import ConservativeEncoder
+from tokenizer_service.service import MIN_CACHED_CHARS, TokenizerService
+from pacing_controller.tokenizer import estimate_tokens as pacing_estimate
+from llm_executor.token_utils import estimate_tokens as diagnostic_estimate
+
+
+class CountingEncoder:
+    """One token per word; counts encode() calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return text.split()
+
+
+LONG_TEXT = "word " * MIN_CACHED_CHARS
+
+
+def test_empty_text_is_zero_tokens():
+    service = TokenizerService()
+    assert service.count("") == 0
+    assert service.encode("") == ()
+
+
+def test_encoder_is_loaded_lazily_and_once():
+    loads = []
+
+    def factory():
+        loads.append(1)
+        return CountingEncoder()
+
+    service = TokenizerService()
+    service.register_encoder("custom", factory)
+    assert loads == []
+
+    service.count("a b c", model="custom")
+    service.count("d e", model="custom")
+    assert loads == [1]
+
+
+def test_registered_encoder_is_used_per_model():
+    service = TokenizerService()
+    service.register_encoder("words", CountingEncoder())
+
+    assert service.count("one two three", model="words") == 3
+    assert service.count("one two three") == service.count("one two three", model=None)
+
+
+def test_repeat_count_hits_cache():
+    encoder = CountingEncoder()
+    service = TokenizerService(default_model="words")
+    service.register_encoder("words", encoder)
+
+    first = service.count(LONG_TEXT)
+    second = service.count(LONG_TEXT)
+
+    assert first == second == MIN_CACHED_CHARS
+    assert encoder.calls == 1
+    stats = service.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_short_texts_bypass_cache():
+    encoder = CountingEncoder()
+    service = TokenizerService(default_model="words")
+    service.register_encoder("words", encoder)
+
+    service.count("short text")
+    service.count("short text")
+
+    assert encoder.calls == 2
+    assert service.cache_stats().size == 0
+
+
+def test_cache_is_lru_bounded():
+    service = TokenizerService(default_model="words", cache_size=2)
+    service.register_encoder("words", CountingEncoder())
+
+    texts = [LONG_TEXT + str(i) for i in range(3)]
+    for text in texts:
+        service.count(text)
+
+    assert service.cache_stats().size == 2
+
+
+def test_reregistering_drops_cached_counts():
+    service = TokenizerService(default_model="m")
+    service.register_encoder("m", CountingEncoder())
+    service.count(LONG_TEXT)
+
+    service.register_encoder("m", ConservativeEncoder())
+
+    assert service.count(LONG_TEXT) == len(LONG_TEXT) // 4 + 1
+
+
+def test_fallback_without_tiktoken(monkeypatch):
+    monkeypatch.setitem(sys.modules, "tiktoken", None)
+    service = TokenizerService()
+
+    assert not service.is_exact()
+    # Approximate upper bound, never below the old ~4 chars/token estimate
+    assert service.count("x" * 40) == DEFAULT_APPROXIMATION.upper_bound("x" * 40)
+    assert service.count("x" * 40) >= 40 // 4 + 1
+
+
+def test_concurrent_counts_are_consistent():
+    service = TokenizerService(default_model="words", cache_size=8)
+    service.register_encoder("words", CountingEncoder())
+    texts = [LONG_TEXT + "extra " * i for i in range(16)]
+    errors = []
+
+    def worker():
+        for _ in range(50):
+            for i, text in enumerate(texts):
+                if service.count(text) != MIN_CACHED_CHARS + i:
+                    errors.append(i)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_pacing_and_diagnostic_paths_agree():
+    text = "Python error handling uses try and except blocks. " * 5
+    assert pacing_estimate(text) == diagnostic_estimate(text)
+    assert pacing_estimate("") == 0
+
+
+def test_negative_cache_size_rejected():
+    with pytest.raises(ValueError):
+        TokenizerService(cache_size=-1)
@@ -1,4 +1,11 @@
-from uncertainty_engine.matrix import map_to_level
+import itertools
+
+import pytest
+
+from uncertainty_engine.matrix import map_to_level, compile_matrix, LEVEL_TABLE
+from uncertainty_engine.errors import MatrixPolicyMismatchError
+from uncertainty_engine.engine import UncertaintyEngine
+from policy_engine.policy_engine import PolicyEngine
 from uncertainty_engine.enums import BinaryCheck, UncertaintyLevel
 from uncertainty_engine.models import BinaryCheckResult
 
@@ -48,4 +55,42 @@ def test_two_nos_completeness_and_memory_maps_to_level_4():
 
 def test_all_no_maps_to_level_5():
     checks = make_checks(BinaryCheck.NO, BinaryCheck.NO, BinaryCheck.NO)
-    assert map_to_level(checks) == UncertaintyLevel.LEVEL_5
\ No newline at end of file
+    assert map_to_level(checks) == UncertaintyLevel.LEVEL_5
+
+# ---------- COMPILED TABLE ----------
+
+def test_no_mask_sets_one_bit_per_no():
+    checks = make_checks(BinaryCheck.NO, BinaryCheck.YES, BinaryCheck.NO)
+    assert checks.no_mask == 0b101
+
+
+def test_table_matches_no_count_for_every_vector():
+    for intent, complete, memory in itertools.product(BinaryCheck, repeat=3):
+        checks = make_checks(intent, complete, memory)
+        no_count = [intent, complete, memory].count(BinaryCheck.NO)
+        expected = [
+            UncertaintyLevel.LEVEL_1_2,
+            UncertaintyLevel.LEVEL_3,
+            UncertaintyLevel.LEVEL_4,
+            UncertaintyLevel.LEVEL_5,
+        ][no_count]
+        assert LEVEL_TABLE[checks.no_mask] == expected
+
+
+def test_table_validates_against_policy_mapping():
+    policy_engine = PolicyEngine("policy_v1.3.2.yaml")
+    table = compile_matrix(policy_engine.get_uncertainty_mapping())
+    assert table == LEVEL_TABLE
+    assert len(table) == 8
+
+
+def test_table_rejects_mismatched_policy_mapping():
+    mapping = {"allyes": "LEVEL12", "oneno": "LEVEL45", "twoormoreno": "LEVEL45"}
+    with pytest.raises(MatrixPolicyMismatchError):
+        compile_matrix(mapping)
+
+
+def test_engine_boots_with_policy_engine():
+    engine = UncertaintyEngine(policy_engine=PolicyEngine("policy_v1.3.2.yaml"))
+    checks = make_checks(BinaryCheck.YES, BinaryCheck.YES, BinaryCheck.YES)
+    assert engine._level_table[checks.no_mask] == UncertaintyLevel.LEVEL_1_2
@@ -0,0 +1,84 @@
+import pytest
+
+from uncertainty_engine.engine import UncertaintyEngine
+from uncertainty_engine.enums import Context, BinaryCheck
+from uncertainty_engine.stream_scanner import iter_text_chunks, scan_stream
+from memory_manager.enums import MemoryQueryResult
+
+
+engine = UncertaintyEngine()
+
+INPUTS = [
+    "I want to learn Python at a deep level",
+    "I want to learn Python",
+    "Help me",
+    "Help me fix this",
+    "Plan the roadmap to launch in three months",
+    "Please review this code and refactor:\n```python\nx = 1\n```",
+    "Evaluate the quality of this API design",
+    "We must choose a database based on latency",
+    "  word",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", INPUTS)
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_stream_matches_full_text_assessment(text, chunk_size):
+    for memory in (MemoryQueryResult.PRESENT, MemoryQueryResult.CONFLICT):
+        expected = engine.assess(text, memory)
+        streamed = engine.assess_stream(text, memory, chunk_size=chunk_size)
+
+        assert streamed.context == expected.context
+        assert streamed.checks == expected.checks
+        assert streamed.level == expected.level
+        assert streamed.reasons == expected.reasons
+
+
+def test_stream_accepts_memoryview_and_byte_chunks():
+    text = "Résumé: please review this code ```x```"
+    expected = engine.assess(text, MemoryQueryResult.PRESENT)
+
+    view = memoryview(text.encode("utf-8"))
+    assert engine.assess_stream(view, MemoryQueryResult.PRESENT, chunk_size=1).checks == expected.checks
+
+    raw = text.encode("utf-8")
+    chunks = (raw[i:i + 2] for i in range(0, len(raw), 2))
+    assert engine.assess_stream(chunks, MemoryQueryResult.PRESENT).checks == expected.checks
+
+
+def test_multibyte_characters_survive_chunk_edges():
+    text = "ééé ü"
+    decoded = "".join(iter_text_chunks(memoryview(text.encode("utf-8")), chunk_size=1))
+    assert decoded == text
+
+
+def test_stream_stops_once_every_decision_is_settled():
+    consumed = []
+
+    def chunks():
+        for chunk in ["Help me review ", "```code``` ", "and more"]:
+            consumed.append(chunk)
+            yield chunk
+        raise AssertionError("scanner read past the settled point")
+
+    scanner = scan_stream(chunks())
+
+    assert consumed == ["Help me review ", "```code``` "]
+    assert scanner.context() == Context.CODE_REVIEW
+    assert scanner.intent_clarity() == BinaryCheck.NO
+    assert scanner.context_completeness(Context.CODE_REVIEW) == BinaryCheck.YES
+
+
+def test_large_input_is_not_materialised():
+    filler = "lorem ipsum " * 1000
+
+    def chunks():
+        for _ in range(200):
+            yield filler
+        yield "help me"
+
+    scanner = scan_stream(chunks())
+
+    assert scanner.intent_clarity() == BinaryCheck.NO
+    assert len(scanner._tail) <= scanner._overlap
@@ -0,0 +1,58 @@
+from uncertainty_engine.engine import UncertaintyEngine
+from uncertainty_engine.enums import Context, BinaryCheck
+from memory_manager.enums import MemoryQueryResult
+
+
+engine = UncertaintyEngine()
+
+STAGES = {"classify", "intent", "completeness", "memory", "matrix"}
+
+
+def test_trace_disabled_by_default():
+    result = engine.assess("I want to learn Python at a deep level", MemoryQueryResult.PRESENT)
+    assert result.trace is None
+
+
+def test_trace_records_every_stage():
+    result = engine.assess(
+        "I want to learn Python at a deep level",
+        MemoryQueryResult.PRESENT,
+        trace=True,
+    )
+
+    assert set(result.trace.stage_ns) == STAGES
+    assert all(ns >= 0 for ns in result.trace.stage_ns.values())
+
+
+def test_trace_records_matched_tokens():
+    result = engine.assess(
+        "Help me review this code",
+        MemoryQueryResult.CONFLICT,
+        trace=True,
+    )
+
+    assert result.trace.context_matches == {Context.CODE_REVIEW: "code"}
+    assert result.trace.vague_phrase == "help me"
+    assert result.trace.missing_param == "code"
+    assert result.trace.matrix_inputs == result.checks
+    assert result.trace.matrix_inputs.memory_consistency == BinaryCheck.NO
+
+
+def test_trace_does_not_change_decision():
+    inputs = [
+        "I want to learn Python at a deep level",
+        "Help me",
+        "I want to learn Python",
+        "Help me fix this",
+        "Plan the roadmap to launch in three months",
+    ]
+
+    for text in inputs:
+        for memory in MemoryQueryResult:
+            plain = engine.assess(text, memory)
+            traced = engine.assess(text, memory, trace=True)
+
+            assert traced.context == plain.context
+            assert traced.checks == plain.checks
+            assert traced.level == plain.level
+            assert traced.reasons == plain.reasons
@@ -0,0 +1,253 @@
+"""
+Fast approximate token counts with calibrated bounds.
+
+Exact BPE is the most expensive step of a quick pre-check, and the
+no-tiktoken fallback (~4 characters per token) is badly wrong for code
+and non-English text. ApproximateTokenizer instead models
+
+    tokens ≈ bias + Σ weight[class] · count[class]
+
+over a histogram of UTF-8 byte classes:
+
+    L  ASCII letters       D  digits           S  whitespace
+    P  ASCII punctuation   2  2-byte chars (Latin ext., Cyrillic, ...)
+    3  3-byte chars (CJK, ...)                 4  4-byte chars (emoji, ...)
+
+The histogram is one bytes.translate + one bytes.count per class (C
+speed, no per-character Python loop).
+
+calibrate(encoder, samples) fits the weights per encoder (non-negative
+least squares) and derives two factors from the worst sample:
+
+    upper_bound(text) = min(ceil(estimate · upper_factor) + 1, utf-8 bytes)
+    lower_bound(text) = floor(estimate · lower_factor)
+
+Only the utf-8 byte count is a hard ceiling (byte-level BPE: every
+token covers at least one byte). The calibrated factors are empirical:
+they hold on every calibration sample (plus margin) and on text that
+resembles it, but are not guaranteed for arbitrary input. check_limit()
+uses the bounds to decide "clearly within" / "clearly over" and runs
+exact BPE only in between. DEFAULT_APPROXIMATION is not fitted to any
+encoder, so for an uncalibrated model check_limit() trusts only the
+byte ceiling and never rejects on an estimate.
+"""
+
+import math
+import string
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from tokenizer_service.encoders import Encoder
+
+
+CLASSES = "LDSP234"
+
+# Slack added to the calibrated factors (5%)
+CALIBRATION_MARGIN = 0.05
+
+
+def _class_table() -> bytes:
+    table = bytearray(b"P" * 128 + b"C" * 64 + b"2" * 32 + b"3" * 16 + b"4" * 16)
+    for byte in (string.ascii_letters).encode():
+        table[byte] = ord("L")
+    for byte in string.digits.encode():
+        table[byte] = ord("D")
+    for byte in string.whitespace.encode() + b"\x1c\x1d\x1e\x1f":
+        table[byte] = ord("S")
+    for byte in range(0, 32):
+        if table[byte] == ord("P"):
+            table[byte] = ord("S")
+    return bytes(table)
+
+
+# Byte → class; continuation bytes (C) are not counted
+_CLASS_TABLE = _class_table()
+_CLASS_BYTES = tuple(cls.encode() for cls in CLASSES)
+
+
+def histogram(text: str) -> Tuple[int, ...]:
+    """Per-class counts (CLASSES order) of `text`."""
+    classes = text.encode("utf-8", "surrogatepass").translate(_CLASS_TABLE)
+    return tuple(classes.count(cls) for cls in _CLASS_BYTES)
+
+
+def utf8_length(counts: Sequence[int]) -> int:
+    """UTF-8 byte length implied by a histogram."""
+    return sum(counts[:4]) + 2 * counts[4] + 3 * counts[5] + 4 * counts[6]
+
+
+@dataclass(frozen=True)
+class TokenBounds:
+    estimate: float
+    lower: int
+    upper: int
+
+
+@dataclass(frozen=True)
+class ApproximateTokenizer:
+    weights: Tuple[float, ...]  # one per CLASSES entry
+    bias: float
+    upper_factor: float
+    lower_factor: float
+    name: str = "approximate"
+
+    def estimate_histogram(self, counts: Sequence[int]) -> float:
+        if not any(counts):
+            return 0.0
+        return self.bias + sum(w * n for w, n in zip(self.weights, counts))
+
+    def bounds_histogram(self, counts: Sequence[int]) -> TokenBounds:
+        estimate = self.estimate_histogram(counts)
+        if estimate == 0.0:
+            return TokenBounds(0.0, 0, 0)
+        upper = min(math.ceil(estimate * self.upper_factor) + 1, utf8_length(counts))
+        lower = min(math.floor(estimate * self.lower_factor), upper)
+        return TokenBounds(estimate, max(1, lower), upper)
+
+    def bounds(self, text: str) -> TokenBounds:
+        return self.bounds_histogram(histogram(text))
+
+    def estimate(self, text: str) -> float:
+        return self.estimate_histogram(histogram(text))
+
+    def upper_bound(self, text: str) -> int:
+        return self.bounds(text).upper
+
+
+# Uncalibrated defaults: generous per-class rates (a letter-heavy word
+# costs more than cl100k usually charges), used when no encoder is
+# available to calibrate against.
+DEFAULT_APPROXIMATION = ApproximateTokenizer(
+    weights=(0.3, 0.4, 0.15, 0.8, 0.6, 1.2, 2.0),
+    bias=1.0,
+    upper_factor=1.0,
+    lower_factor=0.25,
+    name="default",
+)
+
+
+class ApproximateEncoder:
+    """
+    Encoder over an ApproximateTokenizer: encode() has the length of
+    the upper bound. Histograms are additive, so incremental counting
+    only needs the histogram of each delta.
+    """
+
+    def __init__(self, approximation: ApproximateTokenizer = DEFAULT_APPROXIMATION):
+        self.approximation = approximation
+        self.name = approximation.name
+
+    def histogram(self, text: str) -> Tuple[int, ...]:
+        return histogram(text)
+
+    def tokens_for_histogram(self, counts: Sequence[int]) -> int:
+        return self.approximation.bounds_histogram(counts).upper
+
+    def encode(self, text: str) -> Sequence[int]:
+        return range(self.tokens_for_histogram(histogram(text)))
+
+
+# ------------------------------------------------------------------
+# Calibration
+# ------------------------------------------------------------------
+
+def _solve(matrix: List[List[float]], vector: List[float]) -> Optional[List[float]]:
+    """Gaussian elimination with partial pivoting (None if singular)."""
+    size = len(vector)
+    rows = [row[:] + [value] for row, value in zip(matrix, vector)]
+
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda r: abs(rows[r][column]))
+        if abs(rows[pivot][column]) < 1e-12:
+            return None
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        for r in range(column + 1, size):
+            factor = rows[r][column] / rows[column][column]
+            for c in range(column, size + 1):
+                rows[r][c] -= factor * rows[column][c]
+
+    solution = [0.0] * size
+    for r in reversed(range(size)):
+        total = rows[r][size] - sum(rows[r][c] * solution[c] for c in range(r + 1, size))
+        solution[r] = total / rows[r][r]
+    return solution
+
+
+def _nonnegative_least_squares(features: List[List[float]], targets: List[float]) -> List[float]:
+    """
+    Least squares with coefficients clipped to >= 0: refit without the
+    most negative coefficient until none is negative (features that
+    never occur get weight 0).
+    """
+    active = [
+        i for i in range(len(features[0]))
+        if any(row[i] for row in features)
+    ]
+    coefficients = [0.0] * len(features[0])
+
+    while active:
+        normal = [
+            [sum(row[i] * row[j] for row in features) for j in active]
+            for i in active
+        ]
+        rhs = [sum(row[i] * t for row, t in zip(features, targets)) for i in active]
+        solution = _solve(normal, rhs)
+
+        if solution is None:
+            active.pop()
+            continue
+
+        worst = min(range(len(active)), key=lambda k: solution[k])
+        if solution[worst] < 0:
+            active.pop(worst)
+            continue
+
+        coefficients = [0.0] * len(features[0])
+        for k, i in enumerate(active):
+            coefficients[i] = solution[k]
+        break
+
+    return coefficients
+
+
+def calibrate(
+    encoder: Encoder,
+    samples: Iterable[str],
+    name: str = "calibrated",
+    margin: float = CALIBRATION_MARGIN,
+) -> ApproximateTokenizer:
+    """
+    Fit an ApproximateTokenizer to `encoder` on `samples` (use text
+    representative of real traffic: prose, code, non-English). The
+    bounds are only as good as the samples are representative.
+    """
+    histograms, targets = [], []
+    for text in samples:
+        if text:
+            histograms.append(histogram(text))
+            targets.append(float(len(encoder.encode(text))))
+    if not histograms:
+        raise ValueError("calibrate needs at least one non-empty sample")
+
+    features = [[1.0] + [float(n) for n in counts] for counts in histograms]
+    coefficients = _nonnegative_least_squares(features, targets)
+    fitted = ApproximateTokenizer(
+        weights=tuple(coefficients[1:]),
+        bias=coefficients[0],
+        upper_factor=1.0,
+        lower_factor=1.0,
+        name=name,
+    )
+
+    ratios = []
+    for counts, target in zip(histograms, targets):
+        estimate = fitted.estimate_histogram(counts)
+        ratios.append(target / estimate if estimate > 0 else 1.0)
+
+    return ApproximateTokenizer(
+        weights=fitted.weights,
+        bias=fitted.bias,
+        upper_factor=max(ratios) * (1 + margin),
+        lower_factor=min(ratios) / (1 + margin),
+        name=name,
+    )
@@ -0,0 +1,85 @@
+"""
+Encoders behind the tokenizer service.
+
+An encoder is anything with encode(text) -> sequence of token ids.
+tiktoken encodings qualify as-is. Without tiktoken (or the requested
+encoding) the service falls back to an approximate encoder
+(tokenizer_service.approximate); ConservativeEncoder is the plain
+~4 characters per token estimate.
+"""
+
+from typing import Callable, Optional, Protocol, Sequence, Tuple
+
+
+DEFAULT_ENCODING = "cl100k_base"
+
+
+class Encoder(Protocol):
+    def encode(self, text: str) -> Sequence[int]:
+        ...
+
+
+EncoderFactory = Callable[[], Optional[Encoder]]
+
+
+class ConservativeEncoder:
+    """
+    Deterministic fallback: ~4 characters per token + buffer.
+
+    Never returns real token ids; only the LENGTH of encode() is
+    meaningful. Counts depend on an additive histogram (here: the
+    length), so incremental counting needs only each delta's histogram.
+    """
+
+    name = "conservative"
+
+    @staticmethod
+    def tokens_for_length(length: int) -> int:
+        if length <= 0:
+            return 0
+        return max(1, length // 4 + 1)
+
+    def histogram(self, text: str) -> Tuple[int, ...]:
+        return (len(text),)
+
+    def tokens_for_histogram(self, counts: Sequence[int]) -> int:
+        return self.tokens_for_length(counts[0])
+
+    def encode(self, text: str) -> Sequence[int]:
+        return range(self.tokens_for_length(len(text)))
+
+
+def tiktoken_encoding(encoding_name: str) -> EncoderFactory:
+    """Factory loading a tiktoken encoding by name (None if unavailable)."""
+
+    def load() -> Optional[Encoder]:
+        try:
+            import tiktoken
+
+            return tiktoken.get_encoding(encoding_name)
+        except Exception:
+            return None
+
+    return load
+
+
+def tiktoken_model(model: str) -> EncoderFactory:
+    """
+    Factory loading the tiktoken encoding for a model name, falling
+    back to DEFAULT_ENCODING for models tiktoken does not know.
+    """
+
+    def load() -> Optional[Encoder]:
+        try:
+            import tiktoken
+        except Exception:
+            return None
+
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken_encoding(DEFAULT_ENCODING)()
+        except Exception:
+            return None
+
+    return load
@@ -0,0 +1,124 @@
+"""
+Incremental token counting for streamed output.
+
+Re-encoding the growing response on every chunk is quadratic in its
+length. IncrementalTokenCounter keeps:
+
+- a STABLE prefix, already counted, ending at a safe boundary
+- an unstable TAIL after it, re-encoded on each append
+
+A safe boundary is a space preceded by a non-whitespace character and
+followed by a letter ("...abc| foo"). BPE tokenizers in the tiktoken
+family pre-split text there and never merge across such a point, so
+
+    count(prefix) + count(tail) == count(prefix + tail)
+
+and each append costs O(tail + delta), not O(response).
+
+HARD RULES:
+- The running count equals the service's count of the full text,
+  EXCEPT when the tail outgrows MAX_TAIL_CHARS without a safe
+  boundary (e.g. long whitespace-free code). The tail is then committed
+  at a forced cut, which can only overcount (never undercount) on
+  BPE encoders, so hard-cap checks stay conservative.
+- Histogram encoders (the approximate and conservative fallbacks) are
+  counted from a running histogram and are always exact.
+"""
+
+import re
+from typing import Optional
+
+from tokenizer_service.service import TokenizerService, default_service
+
+
+# Longest tail kept without a safe boundary before a forced commit
+MAX_TAIL_CHARS = 2048
+
+_SAFE_BOUNDARY = re.compile(r"(?<=\S) (?=[^\W\d_])")
+
+
+class IncrementalTokenCounter:
+    def __init__(
+        self,
+        service: Optional[TokenizerService] = None,
+        model: Optional[str] = None,
+    ):
+        self.service = service or default_service()
+        self.model = model
+        self._encoder = self.service.encoder(model)
+        # Count depends only on an additive histogram of the text
+        self._additive = hasattr(self._encoder, "tokens_for_histogram")
+        self.reset()
+
+    def reset(self) -> None:
+        self._stable_tokens = 0
+        self._tail = ""
+        self._tail_tokens = 0
+        self._chars = 0
+        self._forced_cuts = 0
+        self._histogram = None
+
+    @property
+    def chars(self) -> int:
+        """Characters appended so far."""
+        return self._chars
+
+    @property
+    def tokens(self) -> int:
+        """Running token count of everything appended so far."""
+        if self._additive:
+            if self._histogram is None:
+                return 0
+            return self._encoder.tokens_for_histogram(self._histogram)
+        return self._stable_tokens + self._tail_tokens
+
+    @property
+    def exact(self) -> bool:
+        """False once a forced cut may have overcounted."""
+        return self._forced_cuts == 0
+
+    def tokens_with(self, extra: str) -> int:
+        """Running count if `extra` were appended (nothing is recorded)."""
+        if self._additive:
+            counts = self._encoder.histogram(extra)
+            if self._histogram is not None:
+                counts = [a + b for a, b in zip(self._histogram, counts)]
+            return self._encoder.tokens_for_histogram(counts)
+        tail = self._tail + extra
+        return self._stable_tokens + (len(self._encoder.encode(tail)) if tail else 0)
+
+    def append(self, delta: str) -> int:
+        """Add a streamed chunk; returns the running token count."""
+        if not delta:
+            return self.tokens
+
+        self._chars += len(delta)
+        if self._additive:
+            counts = self._encoder.histogram(delta)
+            if self._histogram is not None:
+                counts = [a + b for a, b in zip(self._histogram, counts)]
+            self._histogram = counts
+            return self.tokens
+
+        # Only the old tail and the delta can hold a new boundary
+        tail = self._tail + delta
+        cut = self._last_safe_boundary(tail)
+
+        if cut == 0 and len(tail) > MAX_TAIL_CHARS:
+            cut = len(tail)
+            self._forced_cuts += 1
+
+        if cut > 0:
+            self._stable_tokens += len(self._encoder.encode(tail[:cut]))
+            tail = tail[cut:]
+
+        self._tail = tail
+        self._tail_tokens = len(self._encoder.encode(tail)) if tail else 0
+        return self.tokens
+
+    @staticmethod
+    def _last_safe_boundary(text: str) -> int:
+        last = 0
+        for match in _SAFE_BOUNDARY.finditer(text):
+            last = match.start()
+        return last
@@ -0,0 +1,271 @@
+"""
+Shared tokenizer service.
+
+One process-wide place to count tokens, used by the pacing controller
+(enforcement) and llm_executor.token_utils (diagnostics):
+
+- Encoders load LAZILY, on the first count for their model, never at
+  import time, and each is loaded once
+- One encoder per model name; register_encoder() plugs in any object
+  with encode(text), e.g. a provider-specific tokenizer
+- Unknown models use their tiktoken encoding when tiktoken knows them,
+  DEFAULT_ENCODING otherwise; without tiktoken every model falls back
+  to the upper bound of its approximate tokenizer (deterministic and
+  generous, but an estimate; see tokenizer_service.approximate)
+- check_limit() answers "does this fit?" from the approximate bounds
+  and runs the exact encoder only when the text is near the limit;
+  until a model is calibrated, only its utf-8 byte ceiling is used
+  (the uncalibrated defaults are not a bound for an arbitrary encoder)
+- Token counts are kept in an LRU cache keyed by (model, text digest),
+  so re-counting the same prompt or response costs one hash
+
+HARD RULES:
+- Deterministic: the same text and model always give the same count
+- Thread-safe: one service may be shared across threads
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Sequence, Union
+
+from tokenizer_service.approximate import (
+    DEFAULT_APPROXIMATION,
+    ApproximateEncoder,
+    ApproximateTokenizer,
+    calibrate,
+)
+from tokenizer_service.encoders import (
+    DEFAULT_ENCODING,
+    ConservativeEncoder,
+    Encoder,
+    EncoderFactory,
+    tiktoken_model,
+)
+
+
+DEFAULT_CACHE_SIZE = 4096
+
+# Shorter texts are encoded directly: hashing them costs about as much
+MIN_CACHED_CHARS = 64
+
+
+@dataclass(frozen=True)
+class LimitCheck:
+    """
+    within:  True if the text fits in `limit` tokens
+    tokens:  exact count if exact, otherwise the bound that decided
+             (upper bound when within, lower bound when over)
+    """
+    within: bool
+    tokens: int
+    exact: bool
+
+
+@dataclass(frozen=True)
+class TokenCacheStats:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+class TokenizerService:
+    def __init__(
+        self,
+        default_model: str = DEFAULT_ENCODING,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        if cache_size < 0:
+            raise ValueError("cache_size must be >= 0")
+
+        self.default_model = default_model
+        self.cache_size = cache_size
+
+        self._factories: Dict[str, EncoderFactory] = {}
+        self._encoders: Dict[str, Encoder] = {}
+        self._approximations: Dict[str, ApproximateTokenizer] = {}
+        self._counts: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------------------
+    # Encoders
+    # --------------------------------------------------------------
+
+    def register_encoder(
+        self,
+        model: str,
+        encoder: Union[Encoder, EncoderFactory],
+    ) -> None:
+        """
+        Use `encoder` for `model`. Accepts an encoder or a zero-argument
+        factory returning one (called lazily, on first use).
+        Cached counts for the model are dropped.
+        """
+        factory = encoder if not hasattr(encoder, "encode") else (lambda: encoder)
+
+        with self._lock:
+            self._factories[model] = factory
+            self._encoders.pop(model, None)
+            for key in [key for key in self._counts if key[0] == model]:
+                del self._counts[key]
+
+    def encoder(self, model: Optional[str] = None) -> Encoder:
+        """The encoder for `model` (default model if None), loaded on first use."""
+        model = model or self.default_model
+
+        encoder = self._encoders.get(model)
+        if encoder is not None:
+            return encoder
+
+        with self._lock:
+            encoder = self._encoders.get(model)
+            if encoder is None:
+                factory = self._factories.get(model) or tiktoken_model(model)
+                encoder = factory() or ApproximateEncoder(self.approximation(model))
+                self._encoders[model] = encoder
+        return encoder
+
+    def is_exact(self, model: Optional[str] = None) -> bool:
+        """False when `model` is counted by an approximate fallback."""
+        return not isinstance(self.encoder(model), (ApproximateEncoder, ConservativeEncoder))
+
+    # --------------------------------------------------------------
+    # Approximation
+    # --------------------------------------------------------------
+
+    def approximation(self, model: Optional[str] = None) -> ApproximateTokenizer:
+        """Calibrated approximation for `model` (uncalibrated default if none)."""
+        return self._approximations.get(model or self.default_model, DEFAULT_APPROXIMATION)
+
+    def register_approximation(self, model: str, approximation: ApproximateTokenizer) -> None:
+        with self._lock:
+            self._approximations[model] = approximation
+            # A fallback encoder built on the previous approximation is stale
+            if isinstance(self._encoders.get(model), ApproximateEncoder):
+                del self._encoders[model]
+                for key in [key for key in self._counts if key[0] == model]:
+                    del self._counts[key]
+
+    def calibrate(self, samples, model: Optional[str] = None) -> ApproximateTokenizer:
+        """Fit and register an approximation against `model`'s exact encoder."""
+        model = model or self.default_model
+        if not self.is_exact(model):
+            raise ValueError(f"No exact encoder to calibrate against for model: {model}")
+
+        approximation = calibrate(self.encoder(model), samples, name=model)
+        self.register_approximation(model, approximation)
+        return approximation
+
+    def check_limit(self, text: str, limit: int, model: Optional[str] = None) -> LimitCheck:
+        """
+        Does `text` fit in `limit` tokens?
+
+        Approximate bounds first: clearly within (upper <= limit) or
+        clearly over (lower > limit) is decided without BPE. Only texts
+        near the limit are counted exactly. The calibrated bounds are
+        empirical; until the model is calibrated, only the utf-8 byte
+        ceiling (a hard bound) is trusted.
+        """
+        if not text:
+            return LimitCheck(within=0 <= limit, tokens=0, exact=True)
+
+        if not self.is_exact(model):
+            tokens = self.count(text, model)
+            return LimitCheck(within=tokens <= limit, tokens=tokens, exact=False)
+
+        approximation = self._approximations.get(model or self.default_model)
+        if approximation is None:
+            # Uncalibrated: only the byte-level BPE ceiling is safe
+            upper = len(text.encode("utf-8", "surrogatepass"))
+            if upper <= limit:
+                return LimitCheck(within=True, tokens=upper, exact=False)
+        else:
+            bounds = approximation.bounds(text)
+            if bounds.upper <= limit:
+                return LimitCheck(within=True, tokens=bounds.upper, exact=False)
+            if bounds.lower > limit:
+                return LimitCheck(within=False, tokens=bounds.lower, exact=False)
+
+        tokens = self.count(text, model)
+        return LimitCheck(within=tokens <= limit, tokens=tokens, exact=True)
+
+    # --------------------------------------------------------------
+    # Counting
+    # --------------------------------------------------------------
+
+    def encode(self, text: str, model: Optional[str] = None) -> Sequence[int]:
+        if not text:
+            return ()
+        return self.encoder(model).encode(text)
+
+    def count(self, text: str, model: Optional[str] = None) -> int:
+        if not text:
+            return 0
+
+        model = model or self.default_model
+        if self.cache_size == 0 or len(text) < MIN_CACHED_CHARS:
+            return len(self.encoder(model).encode(text))
+
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        key = (model, digest)
+
+        with self._lock:
+            tokens = self._counts.get(key)
+            if tokens is not None:
+                self._counts.move_to_end(key)
+                self._hits += 1
+                return tokens
+            self._misses += 1
+
+        tokens = len(self.encoder(model).encode(text))
+
+        with self._lock:
+            self._counts[key] = tokens
+            self._counts.move_to_end(key)
+            if len(self._counts) > self.cache_size:
+                self._counts.popitem(last=False)
+        return tokens
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def cache_stats(self) -> TokenCacheStats:
+        return TokenCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._counts),
+            max_size=self.cache_size,
+        )
+
+
+_DEFAULT_SERVICE: Optional[TokenizerService] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_service() -> TokenizerService:
+    """The process-wide service (created on first use)."""
+    global _DEFAULT_SERVICE
+    if _DEFAULT_SERVICE is None:
+        with _DEFAULT_LOCK:
+            if _DEFAULT_SERVICE is None:
+                _DEFAULT_SERVICE = TokenizerService()
+    return _DEFAULT_SERVICE
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Token count of `text` using the process-wide service."""
+    return default_service().count(text, model)
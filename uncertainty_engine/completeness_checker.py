@@ -1,3 +1,5 @@
+from typing import Optional
+
 from uncertainty_engine.enums import Context, BinaryCheck
 
 # Source of truth: required parameters per context
@@ -11,57 +13,63 @@ REQUIRED_PARAMS = {
     Context.EVALUATION: ["subject", "standard"],
 }
 
+# Keyword evidence per (context, param), matched case-insensitively
+PARAM_KEYWORDS = {
+    (Context.LEARNING, "depthorgoal"): ["overview", "deep", "master", "learn"],
+    (Context.CODE_REVIEW, "reviewgoal"): ["review", "improve", "optimize", "refactor"],
+    (Context.ARCHITECTURE_DESIGN, "system"): ["system", "architecture", "service"],
+    (Context.ARCHITECTURE_DESIGN, "goal"): ["goal", "want", "to ", "so that"],
+    (Context.PROBLEM_SOLVING, "problem"): ["error", "bug", "fails", "issue"],
+    (Context.DECISION_MAKING, "criteria"): ["criteria", "based on", "priority"],
+    (Context.DECISION_MAKING, "constraints"): ["must", "cannot", "limited"],
+    (Context.PLANNING, "goal"): ["build", "launch", "achieve"],
+    (Context.PLANNING, "timehorizon"): ["week", "month", "year", "days"],
+    (Context.EVALUATION, "standard"): ["better", "quality", "compare"],
+}
 
-def param_is_present(context: Context, param: str, text: str) -> bool:
-    t = text.lower()
-
-    if context == Context.LEARNING:
-        if param == "topic":
-            return len(t.split()) >= 2
-        if param == "depthorgoal":
-            return any(w in t for w in ["overview", "deep", "master", "learn"])
+# Structural evidence: at least two words of free text
+MIN_WORD_PARAMS = {
+    (Context.LEARNING, "topic"),
+    (Context.EVALUATION, "subject"),
+}
+MIN_WORDS = 2
 
-    if context == Context.CODE_REVIEW:
-        if param == "code":
-            return "```" in text
-        if param == "reviewgoal":
-            return any(w in t for w in ["review", "improve", "optimize", "refactor"])
+# Structural evidence: a fenced code block (case-sensitive)
+CODE_FENCE = "```"
+CODE_FENCE_PARAMS = {
+    (Context.CODE_REVIEW, "code"),
+}
 
-    if context == Context.ARCHITECTURE_DESIGN:
-        if param == "system":
-            return any(w in t for w in ["system", "architecture", "service"])
-        if param == "goal":
-            return any(w in t for w in ["goal", "want", "to ", "so that"])
 
-    if context == Context.PROBLEM_SOLVING:
-        return any(w in t for w in ["error", "bug", "fails", "issue"])
+def param_is_present(context: Context, param: str, text: str) -> bool:
+    key = (context, param)
 
-    if context == Context.DECISION_MAKING:
-        if param == "criteria":
-            return any(w in t for w in ["criteria", "based on", "priority"])
-        if param == "constraints":
-            return any(w in t for w in ["must", "cannot", "limited"])
+    if key in MIN_WORD_PARAMS:
+        return len(text.split()) >= MIN_WORDS
 
-    if context == Context.PLANNING:
-        if param == "goal":
-            return any(w in t for w in ["build", "launch", "achieve"])
-        if param == "timehorizon":
-            return any(w in t for w in ["week", "month", "year", "days"])
+    if key in CODE_FENCE_PARAMS:
+        return CODE_FENCE in text
 
-    if context == Context.EVALUATION:
-        if param == "subject":
-            return len(t.split()) >= 2
-        if param == "standard":
-            return any(w in t for w in ["better", "quality", "compare"])
+    keywords = PARAM_KEYWORDS.get(key)
+    if keywords is None:
+        return False
 
-    return False
+    t = text.lower()
+    return any(w in t for w in keywords)
 
 
-def check_completeness(context: Context, text: str) -> BinaryCheck:
+def find_missing_param(context: Context, text: str) -> Optional[str]:
     required = REQUIRED_PARAMS.get(context, [])
 
     for param in required:
         if not param_is_present(context, param, text):
-            return BinaryCheck.NO  # EARLY FAIL
+            return param  # EARLY FAIL
+
+    return None
+
+
+def check_completeness(context: Context, text: str) -> BinaryCheck:
+    if find_missing_param(context, text) is not None:
+        return BinaryCheck.NO
 
-    return BinaryCheck.YES
\ No newline at end of file
+    return BinaryCheck.YES
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from uncertainty_engine.enums import Context
 from uncertainty_engine.errors import AmbiguousContextError
 
@@ -24,17 +24,24 @@ PRIORITY_ORDER = [
 ]
 
 
-def classify_context(text: str) -> Context:
+def find_context_matches(text: str) -> Dict[Context, str]:
+    """
+    Return the first keyword that fired for every matching context.
+    Insertion order follows KEYWORDS.
+    """
     text_lower = text.lower()
-    matches: List[Context] = []
+    matches: Dict[Context, str] = {}
 
-    # 1. Detect matching contexts
     for context, keywords in KEYWORDS.items():
         for word in keywords:
             if word in text_lower:
-                matches.append(context)
+                matches[context] = word
                 break
 
+    return matches
+
+
+def resolve_context(matches: List[Context]) -> Context:
     # 2. No matches → default safely to LEARNING
     if len(matches) == 0:
         return Context.LEARNING
@@ -49,4 +56,11 @@ def classify_context(text: str) -> Context:
             return context
 
     # 5. STILL ambiguous → HARD FAIL (this is the rule you asked about)
-    raise AmbiguousContextError(matches)
\ No newline at end of file
+    raise AmbiguousContextError(matches)
+
+
+def classify_context(text: str) -> Context:
+    # 1. Detect matching contexts
+    matches: List[Context] = list(find_context_matches(text))
+
+    return resolve_context(matches)
\ No newline at end of file
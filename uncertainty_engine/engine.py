@@ -1,30 +1,68 @@
-from uncertainty_engine.context_classifier import classify_context
-from uncertainty_engine.intent_checker import check_intent
-from uncertainty_engine.completeness_checker import check_completeness
+from time import perf_counter_ns
+from typing import Optional
+
+from uncertainty_engine.context_classifier import (
+    classify_context,
+    find_context_matches,
+    resolve_context,
+)
+from uncertainty_engine.intent_checker import check_intent, find_vague_phrase
+from uncertainty_engine.completeness_checker import (
+    check_completeness,
+    find_missing_param,
+)
 from uncertainty_engine.memory_checker import check_memory_consistency
-from uncertainty_engine.matrix import map_to_level
+from uncertainty_engine.stream_scanner import (
+    DEFAULT_CHUNK_SIZE,
+    TextSource,
+    scan_stream,
+)
+from uncertainty_engine.matrix import compile_matrix
 from uncertainty_engine.reason_templates import REASONS
 from uncertainty_engine.models import (
+    AssessmentTrace,
     BinaryCheckResult,
     UncertaintyAssessment,
 )
 from uncertainty_engine.enums import (
     BinaryCheck,
+    Context,
     UncertaintyLevel,
 )
 from memory_manager.enums import MemoryQueryResult
+from policy_engine.policy_engine import PolicyEngine
 
 
 class UncertaintyEngine:
+    def __init__(self, policy_engine: Optional[PolicyEngine] = None):
+        """
+        Compile the uncertainty matrix once at boot.
+
+        If a PolicyEngine is provided, the compiled table is validated
+        against policy.uncertainty.mapping (FAIL FAST on mismatch).
+        """
+        policy_mapping = (
+            policy_engine.get_uncertainty_mapping()
+            if policy_engine is not None
+            else None
+        )
+        self._level_table = compile_matrix(policy_mapping)
+
     def assess(
         self,
         user_input: str,
         memory_query_result: MemoryQueryResult,
+        trace: bool = False,
     ) -> UncertaintyAssessment:
         """
         Deterministically assess uncertainty for a single user input.
         No checks may be skipped. No inference is allowed.
+
+        trace=True attaches an AssessmentTrace (stage timings, matched
+        tokens, matrix inputs). The default path does no extra work.
         """
+        if trace:
+            return self._assess_traced(user_input, memory_query_result)
 
         # 1. Context classification (MUST be first)
         context = classify_context(user_input)
@@ -49,10 +87,136 @@ class UncertaintyEngine:
             memory_consistency=memory_consistency,
         )
 
-        # 6. Matrix mapping (FULL, NO SHORTCUTS)
-        level = map_to_level(checks)
+        # 6. Matrix mapping (FULL, NO SHORTCUTS — precompiled table)
+        level = self._level_table[checks.no_mask]
+
+        return UncertaintyAssessment(
+            context=context,
+            checks=checks,
+            level=level,
+            reasons=self._build_reasons(context, checks, level),
+        )
+
+    def assess_stream(
+        self,
+        source: TextSource,
+        memory_query_result: MemoryQueryResult,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> UncertaintyAssessment:
+        """
+        Assess very long inputs without materialising them.
+
+        source may be a str, UTF-8 bytes / memoryview, or an iterable of
+        str / bytes chunks. Matchers run incrementally with bounded
+        overlap at chunk edges and stop once every decision is settled.
+        Decisions are identical to assess() on the full text.
+        """
+
+        # 1–3. Context, intent and completeness in one streaming pass
+        scanner = scan_stream(source, chunk_size)
+        context = scanner.context()
+        intent_clarity = scanner.intent_clarity()
+        context_completeness = scanner.context_completeness(context)
+
+        # 4. Memory consistency check
+        memory_consistency = check_memory_consistency(memory_query_result)
+
+        # 5. Assemble binary checks
+        checks = BinaryCheckResult(
+            intent_clarity=intent_clarity,
+            context_completeness=context_completeness,
+            memory_consistency=memory_consistency,
+        )
+
+        # 6. Matrix mapping (precompiled table)
+        level = self._level_table[checks.no_mask]
+
+        return UncertaintyAssessment(
+            context=context,
+            checks=checks,
+            level=level,
+            reasons=self._build_reasons(context, checks, level),
+        )
+
+    def _assess_traced(
+        self,
+        user_input: str,
+        memory_query_result: MemoryQueryResult,
+    ) -> UncertaintyAssessment:
+        """
+        Same pipeline as assess(), instrumented stage by stage.
+        Decisions MUST be identical to the untraced path.
+        """
+        stage_ns = {}
+
+        # 1. Context classification
+        start = perf_counter_ns()
+        context_matches = find_context_matches(user_input)
+        context = resolve_context(list(context_matches))
+        stage_ns["classify"] = perf_counter_ns() - start
+
+        # 2. Intent clarity check
+        start = perf_counter_ns()
+        vague_phrase = find_vague_phrase(user_input)
+        intent_clarity = (
+            BinaryCheck.NO if vague_phrase is not None else BinaryCheck.YES
+        )
+        stage_ns["intent"] = perf_counter_ns() - start
+
+        # 3. Context completeness check
+        start = perf_counter_ns()
+        try:
+            missing_param = find_missing_param(context, user_input)
+            context_completeness = (
+                BinaryCheck.NO if missing_param is not None else BinaryCheck.YES
+            )
+        except ValueError:
+            missing_param = None
+            context_completeness = BinaryCheck.NO
+        stage_ns["completeness"] = perf_counter_ns() - start
+
+        # 4. Memory consistency check
+        start = perf_counter_ns()
+        memory_consistency = check_memory_consistency(memory_query_result)
+        stage_ns["memory"] = perf_counter_ns() - start
+
+        # 5–6. Assemble checks + matrix mapping
+        start = perf_counter_ns()
+        checks = BinaryCheckResult(
+            intent_clarity=intent_clarity,
+            context_completeness=context_completeness,
+            memory_consistency=memory_consistency,
+        )
+        level = self._level_table[checks.no_mask]
+        stage_ns["matrix"] = perf_counter_ns() - start
+
+        return UncertaintyAssessment(
+            context=context,
+            checks=checks,
+            level=level,
+            reasons=self._build_reasons(context, checks, level),
+            trace=AssessmentTrace(
+                stage_ns=stage_ns,
+                context_matches=context_matches,
+                vague_phrase=vague_phrase,
+                missing_param=missing_param,
+                matrix_inputs=checks,
+            ),
+        )
+
+    def _build_reasons(
+        self,
+        context: Context,
+        checks: BinaryCheckResult,
+        level: UncertaintyLevel,
+    ) -> list:
+        """
+        Build deterministic reasons (2–5 only).
+        """
+        intent_clarity = checks.intent_clarity
+        context_completeness = checks.context_completeness
+        memory_consistency = checks.memory_consistency
 
-        # 7. Build deterministic reasons (2–5 only)
         reasons = []
 
         # Intent reason
@@ -99,11 +263,4 @@ class UncertaintyEngine:
             reasons.append(REASONS["blocked"])
 
         # Enforce deterministic upper bound
-        reasons = reasons[:5]
-
-        return UncertaintyAssessment(
-            context=context,
-            checks=checks,
-            level=level,
-            reasons=reasons,
-        )
\ No newline at end of file
+        return reasons[:5]
@@ -29,4 +29,21 @@ class InvalidContextError(UncertaintyEngineError):
     def __init__(self, context):
         message = f"Invalid context detected: {context}"
         super().__init__(message)
-        self.context = context
\ No newline at end of file
+        self.context = context
+
+
+class MatrixPolicyMismatchError(UncertaintyEngineError):
+    """
+    Raised at boot when the compiled uncertainty matrix disagrees
+    with policy.uncertainty.mapping.
+    """
+
+    def __init__(self, bucket, policy_level, matrix_level):
+        message = (
+            "Uncertainty matrix does not match policy mapping. "
+            f"Bucket '{bucket}': policy={policy_level}, matrix={matrix_level}."
+        )
+        super().__init__(message)
+        self.bucket = bucket
+        self.policy_level = policy_level
+        self.matrix_level = matrix_level
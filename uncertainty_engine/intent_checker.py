@@ -1,3 +1,5 @@
+from typing import Optional
+
 from uncertainty_engine.enums import BinaryCheck
 
 
@@ -11,11 +13,18 @@ VAGUE_PHRASES = [
 ]
 
 
-def check_intent(text: str) -> BinaryCheck:
+def find_vague_phrase(text: str) -> Optional[str]:
     text_lower = text.lower()
 
     for phrase in VAGUE_PHRASES:
         if phrase in text_lower:
-            return BinaryCheck.NO
+            return phrase
+
+    return None
+
+
+def check_intent(text: str) -> BinaryCheck:
+    if find_vague_phrase(text) is not None:
+        return BinaryCheck.NO
 
     return BinaryCheck.YES
\ No newline at end of file
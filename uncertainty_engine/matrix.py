@@ -1,14 +1,34 @@
-from uncertainty_engine.enums import BinaryCheck, UncertaintyLevel
-from uncertainty_engine.models import BinaryCheckResult
+from typing import Dict, Optional, Tuple
 
+from uncertainty_engine.enums import UncertaintyLevel
+from uncertainty_engine.errors import MatrixPolicyMismatchError
+from uncertainty_engine.models import (
+    BinaryCheckResult,
+    INTENT_NO_BIT,
+    COMPLETENESS_NO_BIT,
+    MEMORY_NO_BIT,
+)
 
-def map_to_level(checks: BinaryCheckResult) -> UncertaintyLevel:
-    no_count = sum([
-        checks.intent_clarity == BinaryCheck.NO,
-        checks.context_completeness == BinaryCheck.NO,
-        checks.memory_consistency == BinaryCheck.NO,
-    ])
 
+ALL_CHECKS_MASK = INTENT_NO_BIT | COMPLETENESS_NO_BIT | MEMORY_NO_BIT
+
+# Policy bucket (uncertainty.mapping key) for a given number of NO checks
+POLICY_BUCKETS = {
+    0: "allyes",
+    1: "oneno",
+    2: "twoormoreno",
+    3: "twoormoreno",
+}
+
+# Policy level token → engine levels it covers
+POLICY_LEVELS = {
+    "LEVEL12": {UncertaintyLevel.LEVEL_1_2},
+    "LEVEL3": {UncertaintyLevel.LEVEL_3},
+    "LEVEL45": {UncertaintyLevel.LEVEL_4, UncertaintyLevel.LEVEL_5},
+}
+
+
+def _level_for_no_count(no_count: int) -> UncertaintyLevel:
     if no_count == 0:
         return UncertaintyLevel.LEVEL_1_2
 
@@ -18,4 +38,37 @@ def map_to_level(checks: BinaryCheckResult) -> UncertaintyLevel:
     if no_count == 2:
         return UncertaintyLevel.LEVEL_4
 
-    return UncertaintyLevel.LEVEL_5
\ No newline at end of file
+    return UncertaintyLevel.LEVEL_5
+
+
+def compile_matrix(
+    policy_mapping: Optional[Dict[str, str]] = None,
+) -> Tuple[UncertaintyLevel, ...]:
+    """
+    Compile the uncertainty matrix into an 8-entry lookup table
+    indexed by BinaryCheckResult.no_mask.
+
+    If policy_mapping (policy.uncertainty.mapping) is given, every
+    entry is checked against it. FAIL FAST on any disagreement.
+    """
+    table = tuple(
+        _level_for_no_count(bin(mask).count("1"))
+        for mask in range(ALL_CHECKS_MASK + 1)
+    )
+
+    if policy_mapping is not None:
+        for mask, level in enumerate(table):
+            bucket = POLICY_BUCKETS[bin(mask).count("1")]
+            token = policy_mapping.get(bucket)
+
+            if level not in POLICY_LEVELS.get(token, ()):
+                raise MatrixPolicyMismatchError(bucket, token, level)
+
+    return table
+
+
+LEVEL_TABLE = compile_matrix()
+
+
+def map_to_level(checks: BinaryCheckResult) -> UncertaintyLevel:
+    return LEVEL_TABLE[checks.no_mask]
@@ -1,19 +1,57 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional
 
 from uncertainty_engine.enums import Context, BinaryCheck, UncertaintyLevel
 
 
+# Bit positions of a NO answer in BinaryCheckResult.no_mask
+INTENT_NO_BIT = 1
+COMPLETENESS_NO_BIT = 2
+MEMORY_NO_BIT = 4
+
+
 @dataclass(frozen=True)
 class BinaryCheckResult:
     intent_clarity: BinaryCheck
     context_completeness: BinaryCheck
     memory_consistency: BinaryCheck
 
+    @property
+    def no_mask(self) -> int:
+        """
+        3-bit check vector: one bit set per check that answered NO.
+        Indexes the compiled matrix table directly.
+        """
+        return (
+            (INTENT_NO_BIT if self.intent_clarity is BinaryCheck.NO else 0)
+            | (COMPLETENESS_NO_BIT if self.context_completeness is BinaryCheck.NO else 0)
+            | (MEMORY_NO_BIT if self.memory_consistency is BinaryCheck.NO else 0)
+        )
+
+
+@dataclass(frozen=True)
+class AssessmentTrace:
+    """
+    Explain-trace for a single assessment (opt-in, diagnostics only).
+
+    - stage_ns: wall time per stage in nanoseconds
+      (classify, intent, completeness, memory, matrix)
+    - context_matches: first keyword that fired per matching context
+    - vague_phrase: vague phrase that failed intent clarity, if any
+    - missing_param: first required parameter not found, if any
+    - matrix_inputs: exact checks fed into the matrix
+    """
+    stage_ns: Dict[str, int]
+    context_matches: Dict[Context, str]
+    vague_phrase: Optional[str]
+    missing_param: Optional[str]
+    matrix_inputs: BinaryCheckResult
+
 
 @dataclass(frozen=True)
 class UncertaintyAssessment:
     context: Context
     checks: BinaryCheckResult
     level: UncertaintyLevel
-    reasons: List[str]
\ No newline at end of file
+    reasons: List[str]
+    trace: Optional[AssessmentTrace] = None
@@ -0,0 +1,216 @@
+"""
+Incremental matchers for very long user inputs.
+
+Runs the same vocabularies as the classifier, intent checker and
+completeness checker over a stream of chunks:
+- Each chunk is lowercased on its own (bounded copy)
+- A tail of (longest term - 1) chars is carried across chunk edges
+- Matched terms are monotonic, so decisions only ever settle
+- Scanning stops once every decision is settled
+
+Memory is O(chunk size + overlap), independent of input size.
+"""
+
+import codecs
+import re
+from typing import Iterable, Iterator, List, Optional, Set, Union
+
+from uncertainty_engine.enums import Context, BinaryCheck
+from uncertainty_engine.context_classifier import (
+    KEYWORDS,
+    PRIORITY_ORDER,
+    resolve_context,
+)
+from uncertainty_engine.intent_checker import VAGUE_PHRASES
+from uncertainty_engine.completeness_checker import (
+    REQUIRED_PARAMS,
+    PARAM_KEYWORDS,
+    MIN_WORD_PARAMS,
+    MIN_WORDS,
+    CODE_FENCE,
+    CODE_FENCE_PARAMS,
+)
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+TextSource = Union[str, bytes, bytearray, memoryview, Iterable[Union[str, bytes]]]
+
+_WORD_PATTERN = re.compile(r"\S+")
+
+
+def iter_text_chunks(
+    source: TextSource,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Yield decoded text chunks from a str, UTF-8 bytes / memoryview,
+    or an iterable of str / UTF-8 bytes chunks.
+
+    Bytes are decoded incrementally, so multi-byte characters split
+    across chunk edges are handled without buffering the whole input.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+        return
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        for start in range(0, len(view), chunk_size):
+            text = decoder.decode(view[start:start + chunk_size])
+            if text:
+                yield text
+    else:
+        for chunk in source:
+            text = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+            if text:
+                yield text
+
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+class StreamScanner:
+    """
+    Incremental scanner producing the three text-derived decisions:
+    context, intent clarity and context completeness.
+
+    Decisions are identical to classify_context / check_intent /
+    check_completeness run on the concatenated input.
+    """
+
+    def __init__(self):
+        terms: Set[str] = set(VAGUE_PHRASES)
+        for keywords in KEYWORDS.values():
+            terms.update(keywords)
+        for keywords in PARAM_KEYWORDS.values():
+            terms.update(keywords)
+        terms.add(CODE_FENCE)
+
+        self._pending: List[str] = sorted(terms)
+        self._found: Set[str] = set()
+        self._overlap = max(len(term) for term in terms) - 1
+        self._tail = ""
+
+        self._words = 0
+        self._in_word = False
+
+    # --------------------------------------------------------------
+    # Feeding
+    # --------------------------------------------------------------
+
+    def feed(self, chunk: str) -> None:
+        if not chunk:
+            return
+
+        self._count_words(chunk)
+
+        if self._pending:
+            window = self._tail + chunk.lower()
+            still_pending = []
+            for term in self._pending:
+                if term in window:
+                    self._found.add(term)
+                else:
+                    still_pending.append(term)
+            self._pending = still_pending
+            self._tail = window[-self._overlap:]
+
+    def _count_words(self, chunk: str) -> None:
+        if self._words >= MIN_WORDS:
+            return
+
+        for match in _WORD_PATTERN.finditer(chunk):
+            # A word touching the previous chunk edge was already counted
+            if not (match.start() == 0 and self._in_word):
+                self._words += 1
+                if self._words >= MIN_WORDS:
+                    return
+
+        self._in_word = not chunk[-1].isspace()
+
+    # --------------------------------------------------------------
+    # Decisions
+    # --------------------------------------------------------------
+
+    def context_matches(self) -> List[Context]:
+        return [
+            context
+            for context, keywords in KEYWORDS.items()
+            if any(word in self._found for word in keywords)
+        ]
+
+    def context(self) -> Context:
+        return resolve_context(self.context_matches())
+
+    def intent_clarity(self) -> BinaryCheck:
+        if any(phrase in self._found for phrase in VAGUE_PHRASES):
+            return BinaryCheck.NO
+        return BinaryCheck.YES
+
+    def missing_param(self, context: Context) -> Optional[str]:
+        for param in REQUIRED_PARAMS.get(context, []):
+            if not self._param_present(context, param):
+                return param
+        return None
+
+    def context_completeness(self, context: Context) -> BinaryCheck:
+        if self.missing_param(context) is not None:
+            return BinaryCheck.NO
+        return BinaryCheck.YES
+
+    def _param_present(self, context: Context, param: str) -> bool:
+        key = (context, param)
+
+        if key in MIN_WORD_PARAMS:
+            return self._words >= MIN_WORDS
+
+        if key in CODE_FENCE_PARAMS:
+            return CODE_FENCE in self._found
+
+        keywords = PARAM_KEYWORDS.get(key)
+        if keywords is None:
+            return False
+
+        return any(word in self._found for word in keywords)
+
+    def settled(self) -> bool:
+        """
+        True once no further input can change any decision:
+        - intent: a vague phrase has matched (NO is final)
+        - context: the top-priority context has matched
+        - completeness: every required param of that context is present
+        """
+        if self.intent_clarity() != BinaryCheck.NO:
+            return False
+
+        top = PRIORITY_ORDER[0]
+        if top not in self.context_matches():
+            return False
+
+        return self.missing_param(top) is None
+
+
+def scan_stream(
+    source: TextSource,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamScanner:
+    """
+    Feed a source through a StreamScanner, stopping early once
+    every decision is settled.
+    """
+    scanner = StreamScanner()
+
+    for chunk in iter_text_chunks(source, chunk_size):
+        scanner.feed(chunk)
+        if scanner.settled():
+            break
+
+    return scanner